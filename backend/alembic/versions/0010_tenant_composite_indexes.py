@@ -0,0 +1,89 @@
+"""tenant-scoped composite indexes
+
+Duplicate (school_id, session_id, student_id) attendance rows are collapsed
+before the unique index is built. Attendance has no timestamps, so the row
+kept is the one with the most sign-off: approved by the school, then by the
+provider, then the most hours recorded, with the lowest id only breaking
+exact ties.
+
+Revision ID: 0010_tenant_composite_indexes
+Revises: 0009_project_class_id
+Create Date: 2026-10-17 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0010_tenant_composite_indexes"
+down_revision = "0009_project_class_id"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = [
+    (
+        "ux_attendance_school_session_student",
+        "attendance",
+        ["school_id", "session_id", "student_id"],
+        True,
+    ),
+    ("ix_attendance_school_student", "attendance", ["school_id", "student_id"], False),
+    (
+        "ix_session_school_project_start",
+        "session",
+        ["school_id", "project_id", "start"],
+        False,
+    ),
+    ("ix_student_school_class", "student", ["school_id", "class_id"], False),
+    ("ix_project_school_class", "project", ["school_id", "class_id"], False),
+]
+
+
+def _dedup_attendance(conn: sa.Connection) -> None:
+    groups = conn.execute(
+        sa.text(
+            """
+            SELECT school_id, session_id, student_id, COUNT(*) as cnt
+            FROM attendance
+            GROUP BY school_id, session_id, student_id
+            HAVING COUNT(*) > 1
+            """
+        )
+    ).fetchall()
+
+    for school_id, session_id, student_id, _ in groups:
+        rows = conn.execute(
+            sa.text(
+                """
+                SELECT id
+                FROM attendance
+                WHERE school_id = :school_id
+                  AND session_id = :session_id
+                  AND student_id = :student_id
+                ORDER BY approved_by_school DESC, approved_by_provider DESC,
+                         hours DESC, id
+                """
+            ),
+            {"school_id": school_id, "session_id": session_id, "student_id": student_id},
+        ).fetchall()
+
+        for (row_id,) in rows[1:]:
+            conn.execute(
+                sa.text("DELETE FROM attendance WHERE id = :id"), {"id": row_id}
+            )
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    _dedup_attendance(conn)
+    for name, table, columns, unique in INDEXES:
+        op.create_index(name, table, columns, unique=unique, if_not_exists=True)
+
+
+def downgrade() -> None:
+    for name, table, _columns, _unique in reversed(INDEXES):
+        op.drop_index(name, table_name=table, if_exists=True)
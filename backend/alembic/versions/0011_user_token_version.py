@@ -0,0 +1,32 @@
+"""add user is_active and token_version
+
+Revision ID: 0011_user_token_version
+Revises: 0010_tenant_composite_indexes
+Create Date: 2026-10-17 10:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0011_user_token_version"
+down_revision = "0010_tenant_composite_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "user",
+        sa.Column("is_active", sa.Boolean(), nullable=False, server_default=sa.true()),
+    )
+    op.add_column(
+        "user",
+        sa.Column("token_version", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("user", "token_version")
+    op.drop_column("user", "is_active")
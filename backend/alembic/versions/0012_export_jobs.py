@@ -0,0 +1,55 @@
+"""export job status columns
+
+Revision ID: 0012_export_jobs
+Revises: 0011_user_token_version
+Create Date: 2026-10-17 11:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0012_export_jobs"
+down_revision = "0011_user_token_version"
+branch_labels = None
+depends_on = None
+
+
+export_status = sa.Enum("pending", "running", "done", "failed", name="exportstatus")
+
+
+def upgrade() -> None:
+    # add_column, unlike create_table, does not create the type itself.
+    export_status.create(op.get_bind(), checkfirst=True)
+    op.add_column("export", sa.Column("project_id", sa.Uuid(), nullable=True))
+    op.add_column(
+        "export",
+        sa.Column(
+            "status",
+            export_status,
+            nullable=False,
+            server_default="done",
+        ),
+    )
+    op.add_column(
+        "export",
+        sa.Column("progress", sa.Integer(), nullable=False, server_default="100"),
+    )
+    op.add_column("export", sa.Column("error", sa.String(), nullable=True))
+    op.add_column("export", sa.Column("duration_ms", sa.Integer(), nullable=True))
+    op.add_column("export", sa.Column("started_at", sa.DateTime(), nullable=True))
+    op.add_column("export", sa.Column("finished_at", sa.DateTime(), nullable=True))
+    op.create_index("ix_export_status_created", "export", ["status", "created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_export_status_created", table_name="export")
+    op.drop_column("export", "finished_at")
+    op.drop_column("export", "started_at")
+    op.drop_column("export", "duration_ms")
+    op.drop_column("export", "error")
+    op.drop_column("export", "progress")
+    op.drop_column("export", "status")
+    op.drop_column("export", "project_id")
+    export_status.drop(op.get_bind(), checkfirst=True)
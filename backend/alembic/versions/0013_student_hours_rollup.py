@@ -0,0 +1,82 @@
+"""student hours rollup table
+
+Revision ID: 0013_student_hours_rollup
+Revises: 0012_export_jobs
+Create Date: 2026-10-17 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0013_student_hours_rollup"
+down_revision = "0012_export_jobs"
+branch_labels = None
+depends_on = None
+
+
+def _backfill_student_hours(conn: sa.Connection) -> None:
+    conn.execute(
+        sa.text(
+            """
+            INSERT INTO student_hours (
+                school_id, student_id, project_id, total_hours, attendance_count,
+                present_count, approved_provider_count, approved_school_count,
+                last_session_end
+            )
+            SELECT
+                attendance.school_id,
+                attendance.student_id,
+                session.project_id,
+                COALESCE(SUM(attendance.hours), 0.0),
+                COUNT(*),
+                SUM(CASE WHEN attendance.status = 'present' THEN 1 ELSE 0 END),
+                SUM(CASE WHEN attendance.approved_by_provider THEN 1 ELSE 0 END),
+                SUM(CASE WHEN attendance.approved_by_school THEN 1 ELSE 0 END),
+                MAX(session."end")
+            FROM attendance
+            JOIN session ON session.id = attendance.session_id
+            WHERE session.school_id = attendance.school_id
+            GROUP BY attendance.school_id, attendance.student_id, session.project_id
+            """
+        )
+    )
+
+
+def upgrade() -> None:
+    op.create_table(
+        "student_hours",
+        sa.Column("student_id", sa.Uuid(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column("school_id", sa.Uuid(), nullable=False),
+        sa.Column("total_hours", sa.Float(), nullable=False, server_default="0"),
+        sa.Column("attendance_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("present_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "approved_provider_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "approved_school_count", sa.Integer(), nullable=False, server_default="0"
+        ),
+        sa.Column("last_session_end", sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint("student_id", "project_id"),
+        sa.ForeignKeyConstraint(["student_id"], ["student.id"]),
+        sa.ForeignKeyConstraint(["project_id"], ["project.id"]),
+        sa.ForeignKeyConstraint(["school_id"], ["school.id"]),
+    )
+    op.create_index(
+        "ix_student_hours_school_student", "student_hours", ["school_id", "student_id"]
+    )
+    op.create_index(
+        "ix_student_hours_school_project", "student_hours", ["school_id", "project_id"]
+    )
+    _backfill_student_hours(op.get_bind())
+
+
+def downgrade() -> None:
+    op.drop_index("ix_student_hours_school_project", table_name="student_hours")
+    op.drop_index("ix_student_hours_school_student", table_name="student_hours")
+    op.drop_table("student_hours")
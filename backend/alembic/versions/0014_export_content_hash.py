@@ -0,0 +1,28 @@
+"""export content hash
+
+Revision ID: 0014_export_content_hash
+Revises: 0013_student_hours_rollup
+Create Date: 2026-10-17 14:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0014_export_content_hash"
+down_revision = "0013_student_hours_rollup"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("export", sa.Column("content_hash", sa.String(), nullable=True))
+    op.create_index(
+        "ix_export_school_kind_hash", "export", ["school_id", "kind", "content_hash"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_export_school_kind_hash", table_name="export")
+    op.drop_column("export", "content_hash")
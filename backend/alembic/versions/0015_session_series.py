@@ -0,0 +1,26 @@
+"""session series id
+
+Revision ID: 0015_session_series
+Revises: 0014_export_content_hash
+Create Date: 2026-10-17 16:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0015_session_series"
+down_revision = "0014_export_content_hash"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("session", sa.Column("series_id", sa.Uuid(), nullable=True))
+    op.create_index("ix_session_school_series", "session", ["school_id", "series_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_session_school_series", table_name="session")
+    op.drop_column("session", "series_id")
@@ -0,0 +1,51 @@
+"""append-only approval events
+
+project_id has no foreign key, so events survive deleting their project.
+
+Revision ID: 0016_approval_event
+Revises: 0015_session_series
+Create Date: 2026-10-17 18:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0016_approval_event"
+down_revision = "0015_session_series"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "approval_event",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("school_id", sa.Uuid(), nullable=False),
+        sa.Column("project_id", sa.Uuid(), nullable=False),
+        sa.Column("session_id", sa.Uuid(), nullable=True),
+        sa.Column("attendance_id", sa.Uuid(), nullable=True),
+        sa.Column("user_id", sa.Uuid(), nullable=False),
+        sa.Column(
+            "role",
+            sa.Enum("provider", "school", name="approvalrole"),
+            nullable=False,
+        ),
+        sa.Column("student_ids", sa.JSON(), nullable=True),
+        sa.Column("approved_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["school_id"], ["school.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+    )
+    op.create_index(
+        "ix_approval_event_school_project",
+        "approval_event",
+        ["school_id", "project_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_approval_event_school_project", table_name="approval_event")
+    op.drop_table("approval_event")
+    sa.Enum(name="approvalrole").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,30 @@
+"""per-school collection version counters
+
+Revision ID: 0017_collection_version
+Revises: 0016_approval_event
+Create Date: 2026-10-17 20:00:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "0017_collection_version"
+down_revision = "0016_approval_event"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "collection_version",
+        sa.Column("school_id", sa.Uuid(), primary_key=True),
+        sa.Column("collection", sa.String(length=32), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["school_id"], ["school.id"]),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("collection_version")
@@ -0,0 +1,104 @@
+from collections import Counter
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import bindparam, false, select, update
+from sqlmodel import Session
+
+from app.models import (
+    ApprovalEvent,
+    ApprovalRole,
+    Attendance,
+    Session as ProjectSession,
+    StudentHours,
+)
+
+attendance = Attendance.__table__
+project_session = ProjectSession.__table__
+student_hours = StudentHours.__table__
+
+APPROVAL_COLUMNS = {
+    ApprovalRole.provider: attendance.c.approved_by_provider,
+    ApprovalRole.school: attendance.c.approved_by_school,
+}
+ROLLUP_COUNTERS = {
+    ApprovalRole.provider: student_hours.c.approved_provider_count,
+    ApprovalRole.school: student_hours.c.approved_school_count,
+}
+
+
+def approve_attendance(
+    session: Session,
+    school_id: UUID,
+    project_id: UUID,
+    user_id: UUID,
+    role: ApprovalRole,
+    session_id: UUID | None = None,
+    attendance_id: UUID | None = None,
+    student_ids: Iterable[UUID] | None = None,
+) -> Counter[UUID]:
+    """Approve every pending attendance row in scope with one UPDATE.
+
+    Returns the number of newly approved rows per student. The student_hours
+    counters are bumped from the same numbers and an ApprovalEvent is
+    appended, so nothing has to be re-aggregated or re-read afterwards.
+    """
+    column = APPROVAL_COLUMNS[role]
+    stmt = update(attendance).where(
+        attendance.c.school_id == school_id, column == false()
+    )
+    if attendance_id is not None:
+        stmt = stmt.where(attendance.c.id == attendance_id)
+    if session_id is not None:
+        stmt = stmt.where(attendance.c.session_id == session_id)
+    else:
+        stmt = stmt.where(
+            attendance.c.session_id.in_(
+                select(project_session.c.id).where(
+                    project_session.c.school_id == school_id,
+                    project_session.c.project_id == project_id,
+                )
+            )
+        )
+    students = sorted(set(student_ids)) if student_ids is not None else None
+    if students is not None:
+        stmt = stmt.where(attendance.c.student_id.in_(students))
+
+    conn = session.connection()
+    approved = Counter(
+        conn.execute(
+            stmt.values({column: True}).returning(attendance.c.student_id)
+        ).scalars()
+    )
+
+    if approved:
+        counter = ROLLUP_COUNTERS[role]
+        conn.execute(
+            update(student_hours)
+            .where(
+                student_hours.c.school_id == school_id,
+                student_hours.c.project_id == project_id,
+                student_hours.c.student_id == bindparam("rollup_student_id"),
+            )
+            .values({counter: counter + bindparam("approved")}),
+            [
+                {"rollup_student_id": student_id, "approved": count}
+                for student_id, count in approved.items()
+            ],
+        )
+
+    session.add(
+        ApprovalEvent(
+            school_id=school_id,
+            project_id=project_id,
+            session_id=session_id,
+            attendance_id=attendance_id,
+            user_id=user_id,
+            role=role,
+            student_ids=[str(student_id) for student_id in students]
+            if students is not None
+            else None,
+            approved_count=sum(approved.values()),
+        )
+    )
+    return approved
@@ -0,0 +1,285 @@
+from datetime import date, datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.routing import APIRoute
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.deps import get_current_user_async
+from app.core.pagination import PageParams, page_params, paginate_async
+from app.core.responses import validated_json
+from app.db import get_async_session
+from app.models import (
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    SessionStatus,
+    Student,
+    User,
+)
+from app.reads import (
+    CLASS_ORDER,
+    PROJECT_ORDER,
+    SESSION_ORDER,
+    STUDENT_ORDER,
+    attendance_read_query,
+    attendance_reads,
+    class_list_query,
+    classroom_query,
+    dashboard,
+    dashboard_since,
+    dashboard_totals_query,
+    hours_by_class_query,
+    hours_by_day_query,
+    project_list_query,
+    project_progress,
+    project_progress_query,
+    project_query,
+    session_list_query,
+    session_query,
+    student_list_query,
+    student_metrics,
+    student_metrics_query,
+    student_project_hours_query,
+    student_summary,
+    student_with_class_query,
+)
+from app.response_cache import (
+    STUDENT_METRICS_TAGS,
+    STUDENT_SUMMARY_TAGS,
+    get_cached,
+    response_key,
+    set_cached,
+)
+from app.schemas import (
+    ATTENDANCE_READ_LIST,
+    CLASS_LIST,
+    PROJECT_LIST,
+    SESSION_LIST,
+    STUDENT_LIST,
+    AttendanceRead,
+    Dashboard,
+    ProjectProgress,
+    StudentMetric,
+    StudentSummary,
+)
+from app.versions import Collection, versioned_async
+
+router = APIRouter()
+
+
+def _school_id(current_user: User) -> UUID:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    return current_user.school_id
+
+
+@router.get(
+    "/v1/projects",
+    response_model=list[Project],
+    dependencies=[Depends(versioned_async(Collection.projects))],
+)
+async def list_projects(
+    response: Response,
+    status_filter: ProjectStatus | None = Query(default=None, alias="status"),
+    class_id: UUID | None = None,
+    start_from: date | None = None,
+    start_to: date | None = None,
+    title_prefix: str | None = None,
+    page: PageParams = Depends(page_params),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async),
+) -> Response:
+    query = project_list_query(
+        _school_id(current_user),
+        status_filter,
+        class_id,
+        start_from,
+        start_to,
+        title_prefix,
+    )
+    return await paginate_async(
+        session, query, Project, PROJECT_ORDER, page, response, PROJECT_LIST
+    )
+
+
+@router.get(
+    "/v1/classes",
+    response_model=list[ClassRoom],
+    dependencies=[Depends(versioned_async(Collection.classes))],
+)
+async def list_classes(
+    response: Response,
+    year: int | None = None,
+    section: str | None = None,
+    page: PageParams = Depends(page_params),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async),
+) -> Response:
+    query = class_list_query(_school_id(current_user), year, section)
+    return await paginate_async(
+        session, query, ClassRoom, CLASS_ORDER, page, response, CLASS_LIST
+    )
+
+
+@router.get(
+    "/v1/students",
+    response_model=list[Student],
+    dependencies=[Depends(versioned_async(Collection.classes, Collection.students))],
+)
+async def list_students(
+    response: Response,
+    class_id: UUID | None = None,
+    name_prefix: str | None = None,
+    page: PageParams = Depends(page_params),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async),
+) -> Response:
+    school_id = _school_id(current_user)
+    if class_id:
+        classroom = (await session.exec(classroom_query(school_id, class_id))).first()
+        if not classroom:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    query = student_list_query(school_id, class_id, name_prefix)
+    return await paginate_async(
+        session, query, Student, STUDENT_ORDER, page, response, STUDENT_LIST
+    )
+
+
+@router.get("/v1/students/metrics", response_model=list[StudentMetric])
+async def list_student_metrics(
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async),
+) -> list[StudentMetric]:
+    school_id = _school_id(current_user)
+    key = response_key(school_id, STUDENT_METRICS_TAGS, "student_metrics")
+    cached = get_cached(key)
+    if cached is not None:
+        return cached
+    rows = (await session.exec(student_metrics_query(school_id))).all()
+    return set_cached(key, student_metrics(rows))
+
+
+@router.get("/v1/students/{student_id}/summary", response_model=StudentSummary)
+async def get_student_summary(
+    student_id: UUID,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async),
+) -> StudentSummary:
+    school_id = _school_id(current_user)
+    key = response_key(school_id, STUDENT_SUMMARY_TAGS, "student_summary", student_id)
+    cached = get_cached(key)
+    if cached is not None:
+        return cached
+    row = (await session.exec(student_with_class_query(school_id, student_id))).first()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    student, classroom = row
+
+    project_rows = (
+        await session.exec(student_project_hours_query(school_id, student_id))
+    ).all()
+    return set_cached(key, student_summary(student, classroom, project_rows))
+
+
+@router.get("/v1/projects/progress", response_model=list[ProjectProgress])
+async def list_project_progress(
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async),
+) -> list[ProjectProgress]:
+    rows = (await session.exec(project_progress_query(_school_id(current_user)))).all()
+    return project_progress(rows)
+
+
+@router.get("/v1/dashboard", response_model=Dashboard)
+async def get_dashboard(
+    days: int = Query(default=30, ge=1, le=366),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async),
+) -> Dashboard:
+    school_id = _school_id(current_user)
+    progress_rows = (await session.exec(project_progress_query(school_id))).all()
+    totals = (await session.exec(dashboard_totals_query(school_id))).one()
+    day_rows = (
+        await session.exec(hours_by_day_query(school_id, dashboard_since(days)))
+    ).all()
+    class_rows = (await session.exec(hours_by_class_query(school_id))).all()
+    return dashboard(progress_rows, totals, day_rows, class_rows)
+
+
+@router.get(
+    "/v1/projects/{project_id}/sessions",
+    response_model=list[ProjectSession],
+    dependencies=[Depends(versioned_async(Collection.projects, Collection.sessions))],
+)
+async def list_sessions(
+    project_id: UUID,
+    response: Response,
+    status_filter: SessionStatus | None = Query(default=None, alias="status"),
+    start_from: datetime | None = None,
+    start_to: datetime | None = None,
+    page: PageParams = Depends(page_params),
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async),
+) -> Response:
+    school_id = _school_id(current_user)
+    project = (await session.exec(project_query(school_id, project_id))).first()
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    query = session_list_query(school_id, project_id, status_filter, start_from, start_to)
+    return await paginate_async(
+        session, query, ProjectSession, SESSION_ORDER, page, response, SESSION_LIST
+    )
+
+
+@router.get(
+    "/v1/sessions/{session_id}/attendance",
+    response_model=list[AttendanceRead],
+    dependencies=[Depends(versioned_async(Collection.sessions, Collection.attendance))],
+)
+async def get_attendance(
+    session_id: UUID,
+    response: Response,
+    session: AsyncSession = Depends(get_async_session),
+    current_user: User = Depends(get_current_user_async),
+) -> Response:
+    school_id = _school_id(current_user)
+    project_session = (await session.exec(session_query(school_id, session_id))).first()
+    if not project_session:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    rows = (await session.exec(attendance_read_query(school_id, session_id))).all()
+    return validated_json(ATTENDANCE_READ_LIST, attendance_reads(rows), response)
+
+
+def with_async_reads(sync_router: APIRouter) -> APIRouter:
+    """A copy of ``sync_router`` with its read routes swapped for the async ones.
+
+    Routes keep their position, so path matching order is unchanged.
+    """
+    replacements = {
+        (route.path, method): route
+        for route in router.routes
+        if isinstance(route, APIRoute)
+        for method in route.methods
+    }
+    routes = []
+    for route in sync_router.routes:
+        if isinstance(route, APIRoute):
+            match = next(
+                (
+                    replacements[(route.path, method)]
+                    for method in route.methods
+                    if (route.path, method) in replacements
+                ),
+                None,
+            )
+            if match is not None:
+                routes.append(match)
+                continue
+        routes.append(route)
+    return APIRouter(routes=routes)
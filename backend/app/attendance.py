@@ -0,0 +1,102 @@
+from collections.abc import Iterable
+from uuid import UUID, uuid4
+
+from sqlalchemy import bindparam, insert as portable_insert, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+
+from app.models import Attendance, AttendanceStatus
+
+UPSERT_CHUNK_SIZE = 500
+
+AttendanceKey = tuple[UUID, UUID]
+
+_INSERT_BY_DIALECT = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+def _dedup(
+    rows: Iterable[tuple[UUID, UUID, AttendanceStatus, float]],
+) -> dict[AttendanceKey, tuple[AttendanceStatus, float]]:
+    latest: dict[AttendanceKey, tuple[AttendanceStatus, float]] = {}
+    for session_id, student_id, status, hours in rows:
+        latest[(session_id, student_id)] = (status, hours)
+    return latest
+
+
+def bulk_upsert_attendance(
+    session: Session,
+    school_id: UUID,
+    rows: Iterable[tuple[UUID, UUID, AttendanceStatus, float]],
+    chunk_size: int = UPSERT_CHUNK_SIZE,
+) -> int:
+    latest = _dedup(rows)
+    insert = _INSERT_BY_DIALECT.get(session.get_bind().dialect.name)
+    values = [
+        {
+            "id": uuid4(),
+            "school_id": school_id,
+            "session_id": session_id,
+            "student_id": student_id,
+            "status": status,
+            "hours": hours,
+            "approved_by_provider": False,
+            "approved_by_school": False,
+        }
+        for (session_id, student_id), (status, hours) in latest.items()
+    ]
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start : start + chunk_size]
+        if insert is None:
+            _upsert_chunk(session, school_id, chunk)
+            continue
+        stmt = insert(Attendance).values(chunk)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["school_id", "session_id", "student_id"],
+            set_={"status": stmt.excluded.status, "hours": stmt.excluded.hours},
+        )
+        session.exec(stmt)
+    return len(values)
+
+
+def _upsert_chunk(session: Session, school_id: UUID, chunk: list[dict]) -> None:
+    """Select-then-write upsert for dialects without ON CONFLICT.
+
+    Not atomic against a concurrent writer of the same keys; the unique
+    index turns that race into an IntegrityError instead of a duplicate.
+    """
+    existing = {
+        (session_id, student_id): attendance_id
+        for attendance_id, session_id, student_id in session.exec(
+            select(Attendance.id, Attendance.session_id, Attendance.student_id).where(
+                Attendance.school_id == school_id,
+                Attendance.session_id.in_({row["session_id"] for row in chunk}),
+                Attendance.student_id.in_({row["student_id"] for row in chunk}),
+            )
+        )
+    }
+    updates, inserts = [], []
+    for row in chunk:
+        attendance_id = existing.get((row["session_id"], row["student_id"]))
+        if attendance_id is None:
+            inserts.append(row)
+        else:
+            updates.append(
+                {
+                    "attendance_id": attendance_id,
+                    "new_status": row["status"],
+                    "new_hours": row["hours"],
+                }
+            )
+    table = Attendance.__table__
+    if updates:
+        session.connection().execute(
+            update(table)
+            .where(table.c.id == bindparam("attendance_id"))
+            .values(status=bindparam("new_status"), hours=bindparam("new_hours")),
+            updates,
+        )
+    if inserts:
+        session.exec(portable_insert(Attendance).values(inserts))
@@ -0,0 +1,114 @@
+import argparse
+import json
+import os
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+
+def _seed(projects: int, sessions: int, students: int) -> str:
+    from sqlmodel import Session, SQLModel, select, update
+
+    from app.bench.register_export import seed_project
+    from app.core.security import create_access_token
+    from app.db import get_engine
+    from app.models import School, Session as ProjectSession, SessionStatus, User, UserRole
+
+    engine = get_engine()
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        export = seed_project(session, sessions=sessions, students=students)
+        school = session.exec(select(School).where(School.id == export.school_id)).one()
+        for _ in range(projects - 1):
+            seed_project(session, sessions=sessions, students=students, school=school)
+        session.exec(update(ProjectSession).values(status=SessionStatus.done))
+        user = User(
+            school_id=school.id,
+            role=UserRole.school_admin,
+            email="bench@demo.it",
+            password_hash="unused",
+        )
+        session.add(user)
+        session.commit()
+        return create_access_token(user.id, user.role, user.school_id)
+
+
+def _fan_out(client, headers) -> None:
+    # What the dashboard and projects pages did before /v1/dashboard existed.
+    projects = client.get("/v1/projects", headers=headers).json()
+    client.get("/v1/classes", headers=headers)
+    client.get("/v1/students", headers=headers)
+    for project in projects:
+        sessions = client.get(f"/v1/projects/{project['id']}/sessions", headers=headers)
+        for item in sessions.json():
+            client.get(f"/v1/sessions/{item['id']}/attendance", headers=headers)
+
+
+def _aggregate(client, headers) -> None:
+    client.get("/v1/dashboard", headers=headers)
+
+
+def _measure(client, headers, flow) -> dict:
+    from sqlalchemy import event
+
+    from app.db import get_engine
+
+    counts = {"requests": 0, "statements": 0}
+
+    def count_request(_request) -> None:
+        counts["requests"] += 1
+
+    def count_statement(*_args) -> None:
+        counts["statements"] += 1
+
+    client.event_hooks["request"] = [count_request]
+    engine = get_engine()
+    event.listen(engine, "before_cursor_execute", count_statement)
+    started = perf_counter()
+    try:
+        flow(client, headers)
+    finally:
+        elapsed = perf_counter() - started
+        event.remove(engine, "before_cursor_execute", count_statement)
+        client.event_hooks["request"] = []
+    return {**counts, "seconds": round(elapsed, 4)}
+
+
+def run(projects: int, sessions: int, students: int) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        os.environ["DATABASE_URL"] = f"sqlite:///{Path(workdir) / 'bench.db'}"
+        os.environ["STORAGE_DIR"] = str(Path(workdir) / "storage")
+        os.environ["EXPORT_EXECUTOR"] = "inline"
+        os.environ["DB_ASYNC"] = "false"
+
+        from fastapi.testclient import TestClient
+
+        token = _seed(projects, sessions, students)
+        from app.main import app
+
+        headers = {"Authorization": f"Bearer {token}"}
+        with TestClient(app) as client:
+            before = _measure(client, headers, _fan_out)
+            after = _measure(client, headers, _aggregate)
+    return {
+        "projects": projects,
+        "sessions_per_project": sessions,
+        "students_per_project": students,
+        "before": before,
+        "after": after,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Count requests and queries behind one dashboard load"
+    )
+    parser.add_argument("--projects", type=int, default=10)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--students", type=int, default=25)
+    args = parser.parse_args()
+    print(json.dumps(run(args.projects, args.sessions, args.students), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import quantiles
+from time import perf_counter
+
+PASSWORD = "bench-password"
+
+
+def _seed(users: int) -> list[str]:
+    from sqlalchemy import insert
+    from sqlmodel import Session, SQLModel
+    from uuid import uuid4
+
+    from app.core.security import hash_password
+    from app.db import get_engine
+    from app.models import School, User, UserRole
+
+    engine = get_engine()
+    SQLModel.metadata.create_all(engine)
+    password_hash = hash_password(PASSWORD)
+    emails = [f"tutor{index:05d}@demo.it" for index in range(users)]
+    with Session(engine) as session:
+        school = School(
+            name="Bench School",
+            address="Via Roma 1",
+            city="Roma",
+            province="RM",
+            email="bench@demo.it",
+            phone="+39-000-000000",
+        )
+        session.add(school)
+        session.flush()
+        session.exec(
+            insert(User),
+            params=[
+                {
+                    "id": uuid4(),
+                    "school_id": school.id,
+                    "role": UserRole.school_admin,
+                    "email": email,
+                    "password_hash": password_hash,
+                    "is_active": True,
+                    "token_version": 0,
+                }
+                for email in emails
+            ],
+        )
+        session.commit()
+    return emails
+
+
+def _percentiles(samples: list[float]) -> dict:
+    cuts = quantiles(samples, n=100)
+    return {"p50_ms": round(cuts[49] * 1000, 2), "p99_ms": round(cuts[98] * 1000, 2)}
+
+
+async def _load(emails: list[str], concurrency: int) -> dict:
+    import httpx
+
+    from app.core.hashing import stop_password_hasher
+    from app.main import app
+
+    semaphore = asyncio.Semaphore(concurrency)
+    login_latencies: list[float] = []
+    probe_latencies: list[float] = []
+    statuses: dict[int, int] = {}
+    done = asyncio.Event()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def login(email: str) -> None:
+            async with semaphore:
+                started = perf_counter()
+                response = await client.post(
+                    "/v1/auth/login", json={"email": email, "password": PASSWORD}
+                )
+                login_latencies.append(perf_counter() - started)
+                statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        async def probe() -> None:
+            # A cheap route served alongside the login storm.
+            while not done.is_set():
+                started = perf_counter()
+                await client.get("/health")
+                probe_latencies.append(perf_counter() - started)
+                await asyncio.sleep(0.01)
+
+        probe_task = asyncio.create_task(probe())
+        started = perf_counter()
+        await asyncio.gather(*(login(email) for email in emails))
+        elapsed = perf_counter() - started
+        done.set()
+        await probe_task
+    stop_password_hasher()
+
+    return {
+        "logins": len(emails),
+        "concurrency": concurrency,
+        "statuses": statuses,
+        "logins_per_second": round(len(emails) / elapsed, 1),
+        "login": _percentiles(login_latencies),
+        "health_probe": _percentiles(probe_latencies),
+    }
+
+
+def run_mode(args: argparse.Namespace) -> dict:
+    emails = _seed(args.users)
+    result = asyncio.run(_load(emails, args.concurrency))
+    return {"executor": os.environ.get("PASSWORD_HASH_EXECUTOR", "process"), **result}
+
+
+def compare(args: argparse.Namespace) -> list[dict]:
+    results = []
+    for executor in args.executors.split(","):
+        with tempfile.TemporaryDirectory() as workdir:
+            env = {
+                **os.environ,
+                "DATABASE_URL": f"sqlite:///{Path(workdir) / 'bench.db'}",
+                "STORAGE_DIR": str(Path(workdir) / "storage"),
+                "PASSWORD_HASH_EXECUTOR": executor,
+                "PASSWORD_HASH_WORKERS": str(args.workers),
+                "PASSWORD_HASH_MAX_QUEUE": str(args.max_queue),
+                "LOGIN_RATE_LIMIT_IP_ATTEMPTS": "0",
+            }
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "app.bench.login_throughput",
+                    "--single",
+                    "--users",
+                    str(args.users),
+                    "--concurrency",
+                    str(args.concurrency),
+                ],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results.append(json.loads(output))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Login throughput under concurrent clients")
+    parser.add_argument("--users", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    parser.add_argument("--max-queue", type=int, default=64)
+    parser.add_argument("--executors", default="inline,thread,process")
+    parser.add_argument(
+        "--single",
+        action="store_true",
+        help="run only the executor selected by PASSWORD_HASH_EXECUTOR",
+    )
+    args = parser.parse_args()
+    result = run_mode(args) if args.single else compare(args)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from statistics import quantiles
+from time import perf_counter
+
+READ_PATHS = [
+    "/v1/students?limit=50",
+    "/v1/students/metrics",
+    "/v1/projects",
+    "/v1/classes",
+]
+
+
+def _seed(students: int, sessions: int) -> str:
+    from sqlmodel import Session, SQLModel, select
+
+    from app.bench.register_export import seed_project
+    from app.core.security import create_access_token
+    from app.db import get_engine
+    from app.models import School, User, UserRole
+
+    engine = get_engine()
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed_project(session, sessions=sessions, students=students)
+        school = session.exec(select(School)).one()
+        user = User(
+            school_id=school.id,
+            role=UserRole.school_admin,
+            email="bench@demo.it",
+            password_hash="unused",
+        )
+        session.add(user)
+        session.commit()
+        return create_access_token(user.id, user.role, user.school_id)
+
+
+async def _load(requests: int, concurrency: int, token: str) -> dict:
+    import httpx
+
+    from app.main import app
+
+    headers = {"Authorization": f"Bearer {token}"}
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def one(index: int) -> None:
+            nonlocal errors
+            async with semaphore:
+                started = perf_counter()
+                try:
+                    response = await client.get(
+                        READ_PATHS[index % len(READ_PATHS)], headers=headers
+                    )
+                    ok = response.status_code == 200
+                except Exception:
+                    ok = False
+                latencies.append(perf_counter() - started)
+                errors += not ok
+
+        started = perf_counter()
+        await asyncio.gather(*(one(index) for index in range(requests)))
+        elapsed = perf_counter() - started
+
+    cuts = quantiles(latencies, n=100)
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "errors": errors,
+        "requests_per_second": round(requests / elapsed, 1),
+        "p50_ms": round(cuts[49] * 1000, 2),
+        "p99_ms": round(cuts[98] * 1000, 2),
+    }
+
+
+def run_mode(args: argparse.Namespace) -> dict:
+    token = _seed(args.students, args.sessions)
+    result = asyncio.run(_load(args.requests, args.concurrency, token))
+    return {"mode": "async" if os.environ.get("DB_ASYNC") == "true" else "sync", **result}
+
+
+def compare(args: argparse.Namespace) -> list[dict]:
+    results = []
+    for mode in ("sync", "async"):
+        with tempfile.TemporaryDirectory() as workdir:
+            env = {
+                **os.environ,
+                "DATABASE_URL": f"sqlite:///{Path(workdir) / 'bench.db'}",
+                "STORAGE_DIR": str(Path(workdir) / "storage"),
+                "DB_ASYNC": "true" if mode == "async" else "false",
+            }
+            output = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "app.bench.read_load",
+                    "--single",
+                    "--requests",
+                    str(args.requests),
+                    "--concurrency",
+                    str(args.concurrency),
+                    "--students",
+                    str(args.students),
+                    "--sessions",
+                    str(args.sessions),
+                ],
+                env=env,
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+            results.append(json.loads(output))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare read throughput of the sync and async request paths"
+    )
+    parser.add_argument("--requests", type=int, default=2000)
+    # The sync path holds a pooled connection while it waits for a threadpool
+    # slot to validate the response, so concurrency above the pool size
+    # (db_pool_size + db_max_overflow) stalls it until pool_timeout.
+    parser.add_argument("--concurrency", type=int, default=25)
+    parser.add_argument("--students", type=int, default=200)
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument(
+        "--single",
+        action="store_true",
+        help="run only the mode selected by DB_ASYNC against DATABASE_URL",
+    )
+    args = parser.parse_args()
+    result = run_mode(args) if args.single else compare(args)
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
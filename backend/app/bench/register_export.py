@@ -0,0 +1,149 @@
+import argparse
+import json
+import tempfile
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from time import perf_counter
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlmodel import Session, SQLModel
+
+from app.db import build_engine
+from app.exports.render import render_attendance_register
+from app.models import (
+    Attendance,
+    AttendanceStatus,
+    ClassRoom,
+    Export,
+    Project,
+    ProjectStatus,
+    School,
+    Session as ProjectSession,
+    Student,
+)
+from app.rollups import rebuild_student_hours
+
+
+def seed_project(
+    session: Session, sessions: int, students: int, school: School | None = None
+) -> Export:
+    if school is None:
+        school = School(
+            name="Bench School",
+            address="Via Roma 1",
+            city="Roma",
+            province="RM",
+            email="bench@demo.it",
+            phone="+39-000-000000",
+        )
+        session.add(school)
+        session.flush()
+    section = f"S{uuid4().hex[:6]}"
+    classroom = ClassRoom(
+        school_id=school.id, name=f"4{section}", year=4, section=section
+    )
+    session.add(classroom)
+    session.flush()
+    project = Project(
+        school_id=school.id,
+        class_id=classroom.id,
+        title="Bench project",
+        status=ProjectStatus.active,
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 12, 31),
+    )
+    session.add(project)
+    session.flush()
+
+    student_rows = [
+        {
+            "id": uuid4(),
+            "school_id": school.id,
+            "class_id": classroom.id,
+            "first_name": f"Nome{index:04d}",
+            "last_name": f"Cognome{index:04d}",
+            "pcto_required_hours": 150,
+        }
+        for index in range(students)
+    ]
+    start = datetime(2026, 1, 5, 9, 0, tzinfo=timezone.utc)
+    session_rows = [
+        {
+            "id": uuid4(),
+            "school_id": school.id,
+            "project_id": project.id,
+            "start": start + timedelta(days=index),
+            "end": start + timedelta(days=index, hours=3),
+            "planned_hours": 3.0,
+            "status": "scheduled",
+        }
+        for index in range(sessions)
+    ]
+    session.exec(insert(Student), params=student_rows)
+    session.exec(insert(ProjectSession), params=session_rows)
+    session.exec(
+        insert(Attendance),
+        params=[
+            {
+                "id": uuid4(),
+                "school_id": school.id,
+                "session_id": session_row["id"],
+                "student_id": student_row["id"],
+                "status": AttendanceStatus.present,
+                "hours": 3.0,
+                "approved_by_provider": False,
+                "approved_by_school": False,
+            }
+            for session_row in session_rows
+            for student_row in student_rows
+        ],
+    )
+    rebuild_student_hours(session, school.id)
+    session.commit()
+    return Export(
+        school_id=school.id,
+        kind="attendance_register",
+        project_id=project.id,
+        file_path="",
+    )
+
+
+def run(sessions: int, students: int) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = build_engine(f"sqlite:///{Path(workdir) / 'bench.db'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            export = seed_project(session, sessions, students)
+            export.file_path = str(Path(workdir) / "register.pdf")
+
+            tracemalloc.start()
+            started = perf_counter()
+            render_attendance_register(session, export, lambda _progress: None)
+            elapsed = perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        size = Path(export.file_path).stat().st_size
+        engine.dispose()
+    return {
+        "sessions": sessions,
+        "students": students,
+        "attendance_rows": sessions * students,
+        "render_seconds": round(elapsed, 4),
+        "peak_memory_kib": peak // 1024,
+        "pdf_bytes": size,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the attendance register export")
+    parser.add_argument("--sessions", type=int, default=200)
+    parser.add_argument("--students", type=int, default=30)
+    args = parser.parse_args()
+    print(json.dumps(run(args.sessions, args.students), indent=2))
+
+
+if __name__ == "__main__":
+    main()
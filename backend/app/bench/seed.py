@@ -0,0 +1,291 @@
+import argparse
+import json
+import random
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta, timezone
+from time import perf_counter
+from uuid import UUID
+
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from sqlmodel import Session, SQLModel, select
+
+from app.core.security import hash_password
+from app.db import build_engine
+from app.models import (
+    Attendance,
+    AttendanceStatus,
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    School,
+    Session as ProjectSession,
+    SessionStatus,
+    Student,
+    User,
+    UserRole,
+)
+from app.rollups import rebuild_student_hours
+
+PASSWORD = "bench123!"
+FIRST_NAMES = (
+    "Alessandro", "Alice", "Andrea", "Beatrice", "Chiara", "Davide", "Elena",
+    "Federico", "Francesca", "Giorgia", "Giulia", "Leonardo", "Lorenzo", "Marco",
+    "Martina", "Matteo", "Sara", "Sofia", "Tommaso", "Valentina",
+)
+LAST_NAMES = (
+    "Bianchi", "Bruno", "Colombo", "Conti", "Costa", "Esposito", "Ferrari",
+    "Fontana", "Gallo", "Greco", "Lombardi", "Mancini", "Marino", "Moretti",
+    "Ricci", "Rizzo", "Romano", "Rossi", "Russo", "Villa",
+)
+CITIES = (("Roma", "RM"), ("Milano", "MI"), ("Torino", "TO"), ("Napoli", "NA"))
+SECTIONS = "ABCDEFGHILMNOPQRSTUVZ"
+TERM_START = datetime(2026, 1, 12, 8, 0, tzinfo=timezone.utc)
+# Sessions before this instant are done and have attendance; later ones are
+# still scheduled, as in a school part-way through the year.
+AS_OF = datetime(2026, 4, 1, tzinfo=timezone.utc)
+
+
+def admin_email(school_index: int) -> str:
+    return f"admin{school_index:04d}@bench.pcto.it"
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _school_days(count: int) -> list[datetime]:
+    days: list[datetime] = []
+    current = TERM_START
+    while len(days) < count:
+        if current.weekday() < 5:
+            days.append(current)
+        current += timedelta(days=1)
+    return days
+
+
+def _chunks(rows: Iterator[dict] | list[dict], size: int) -> Iterator[list[dict]]:
+    chunk: list[dict] = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _school_rows(
+    seed: int,
+    index: int,
+    students: int,
+    class_size: int,
+    sessions: int,
+    password_hash: str,
+) -> dict[str, list[dict]]:
+    # Seeding per school keeps a school identical however many are generated,
+    # so a small dataset is a prefix of a large one.
+    rng = random.Random(f"{seed}:{index}")
+    city, province = CITIES[index % len(CITIES)]
+    school_id = _uuid(rng)
+    rows: dict[str, list[dict]] = {
+        "school": [
+            {
+                "id": school_id,
+                "name": f"Istituto Bench {index:04d}",
+                "legal_name": f"Istituto Bench {index:04d} SRL",
+                "address": f"Via Roma {index + 1}",
+                "city": city,
+                "province": province,
+                "email": f"info{index:04d}@bench.pcto.it",
+                "phone": f"+39-000-{index:06d}",
+            }
+        ],
+        "user": [
+            {
+                "id": _uuid(rng),
+                "school_id": school_id,
+                "role": UserRole.school_admin,
+                "email": admin_email(index),
+                "password_hash": password_hash,
+                "is_active": True,
+                "token_version": 0,
+            }
+        ],
+        "classroom": [],
+        "student": [],
+        "project": [],
+        "session": [],
+        "attendance": [],
+    }
+
+    days = _school_days(sessions)
+    class_count = max(1, -(-students // class_size))
+    for class_index in range(class_count):
+        year = 3 + class_index % 3
+        section = SECTIONS[class_index // 3 % len(SECTIONS)]
+        suffix = "" if class_index < 3 * len(SECTIONS) else str(class_index)
+        class_id = _uuid(rng)
+        rows["classroom"].append(
+            {
+                "id": class_id,
+                "school_id": school_id,
+                "name": f"{year}{section}{suffix}",
+                "year": year,
+                "section": f"{section}{suffix}",
+            }
+        )
+        roster = []
+        first = class_index * class_size
+        for _ in range(first, min(first + class_size, students)):
+            student_id = _uuid(rng)
+            roster.append(student_id)
+            rows["student"].append(
+                {
+                    "id": student_id,
+                    "school_id": school_id,
+                    "class_id": class_id,
+                    "first_name": rng.choice(FIRST_NAMES),
+                    "last_name": rng.choice(LAST_NAMES),
+                    "pcto_required_hours": 90 if year < 5 else 150,
+                }
+            )
+
+        project_id = _uuid(rng)
+        rows["project"].append(
+            {
+                "id": project_id,
+                "school_id": school_id,
+                "class_id": class_id,
+                "title": f"Stage {year}{section}{suffix}",
+                "status": ProjectStatus.active,
+                "start_date": days[0].date() if days else date(2026, 1, 12),
+                "end_date": days[-1].date() if days else date(2026, 6, 30),
+                "total_hours": 4.0 * len(days),
+            }
+        )
+        for day in days:
+            start = day + timedelta(hours=rng.choice((0, 1)))
+            done = start < AS_OF
+            session_id = _uuid(rng)
+            rows["session"].append(
+                {
+                    "id": session_id,
+                    "school_id": school_id,
+                    "project_id": project_id,
+                    "start": start,
+                    "end": start + timedelta(hours=4),
+                    "planned_hours": 4.0,
+                    "status": SessionStatus.done if done else SessionStatus.scheduled,
+                }
+            )
+            if not done:
+                continue
+            for student_id in roster:
+                present = rng.random() < 0.9
+                rows["attendance"].append(
+                    {
+                        "id": _uuid(rng),
+                        "school_id": school_id,
+                        "session_id": session_id,
+                        "student_id": student_id,
+                        "status": (
+                            AttendanceStatus.present if present else AttendanceStatus.absent
+                        ),
+                        "hours": 4.0 if present else 0.0,
+                        "approved_by_provider": present and rng.random() < 0.7,
+                        "approved_by_school": present and rng.random() < 0.5,
+                    }
+                )
+    return rows
+
+
+TABLES = (
+    ("school", School),
+    ("user", User),
+    ("classroom", ClassRoom),
+    ("student", Student),
+    ("project", Project),
+    ("session", ProjectSession),
+    ("attendance", Attendance),
+)
+
+
+def seed(
+    engine: Engine,
+    schools: int,
+    students_per_school: int,
+    sessions_per_project: int,
+    class_size: int = 25,
+    seed: int = 0,
+    chunk_size: int = 5000,
+) -> dict:
+    """Bulk-load a deterministic multi-tenant dataset, one commit per school.
+
+    Every admin logs in as ``admin_email(index)`` with ``PASSWORD``. Schools
+    already present from an earlier run with the same seed are skipped.
+    """
+    SQLModel.metadata.create_all(engine)
+    password_hash = hash_password(PASSWORD)
+    counts = dict.fromkeys((name for name, _ in TABLES), 0)
+    skipped = 0
+    started = perf_counter()
+    with Session(engine) as session:
+        for index in range(schools):
+            rows = _school_rows(
+                seed,
+                index,
+                students_per_school,
+                class_size,
+                sessions_per_project,
+                password_hash,
+            )
+            school_id = rows["school"][0]["id"]
+            if session.exec(select(School.id).where(School.id == school_id)).first():
+                skipped += 1
+                continue
+            for name, model in TABLES:
+                for chunk in _chunks(rows[name], chunk_size):
+                    session.exec(insert(model), params=chunk)
+                counts[name] += len(rows[name])
+            rebuild_student_hours(session, school_id)
+            session.commit()
+    return {
+        "seed": seed,
+        "schools": schools,
+        "skipped_schools": skipped,
+        "rows": counts,
+        "seconds": round(perf_counter() - started, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Generate a deterministic multi-tenant benchmark dataset"
+    )
+    parser.add_argument("--database-url", default=None)
+    parser.add_argument("--schools", type=int, default=10)
+    parser.add_argument("--students-per-school", type=int, default=300)
+    parser.add_argument("--sessions-per-project", type=int, default=30)
+    parser.add_argument("--class-size", type=int, default=25)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+    engine = build_engine(args.database_url)
+    try:
+        result = seed(
+            engine,
+            args.schools,
+            args.students_per_school,
+            args.sessions_per_project,
+            class_size=args.class_size,
+            seed=args.seed,
+            chunk_size=args.chunk_size,
+        )
+    finally:
+        engine.dispose()
+    print(json.dumps({"database": engine.url.render_as_string(), **result}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
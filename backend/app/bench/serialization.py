@@ -0,0 +1,141 @@
+import argparse
+import json
+import random
+from collections.abc import Callable
+from datetime import timedelta
+from statistics import quantiles
+from time import perf_counter
+from uuid import UUID
+
+from fastapi import FastAPI, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from app.bench.seed import TERM_START
+from app.core.responses import orjson_response, validated_json
+from app.models import Session as ProjectSession, SessionStatus, Student
+from app.schemas import SESSION_LIST, STUDENT_LIST
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _rows(count: int, seed: int = 0) -> tuple[list[Student], list[ProjectSession]]:
+    rng = random.Random(seed)
+    school_id, class_id, project_id = _uuid(rng), _uuid(rng), _uuid(rng)
+    students = [
+        Student(
+            id=_uuid(rng),
+            school_id=school_id,
+            class_id=class_id,
+            first_name=f"Nome{index}",
+            last_name=f"Cognome{index:05d}",
+            pcto_required_hours=90,
+        )
+        for index in range(count)
+    ]
+    sessions = [
+        ProjectSession(
+            id=_uuid(rng),
+            school_id=school_id,
+            project_id=project_id,
+            start=TERM_START + timedelta(days=index),
+            end=TERM_START + timedelta(days=index, hours=4),
+            planned_hours=4.0,
+            status=SessionStatus.scheduled,
+        )
+        for index in range(count)
+    ]
+    return students, sessions
+
+
+def _app(students: list[Student], sessions: list[ProjectSession]) -> FastAPI:
+    """One route per serialization strategy, over the same in-memory rows."""
+    app = FastAPI()
+    projection = [{"id": row.id, "start": row.start, "status": row.status} for row in sessions]
+
+    @app.get("/response-model/students", response_model=list[Student])
+    def students_response_model() -> list[Student]:
+        return students
+
+    @app.get("/validated/students", response_model=list[Student])
+    def students_validated(response: Response) -> Response:
+        return validated_json(STUDENT_LIST, students, response)
+
+    @app.get("/response-model/sessions", response_model=list[ProjectSession])
+    def sessions_response_model() -> list[ProjectSession]:
+        return sessions
+
+    @app.get("/validated/sessions", response_model=list[ProjectSession])
+    def sessions_validated(response: Response) -> Response:
+        return validated_json(SESSION_LIST, sessions, response)
+
+    @app.get("/jsonable-encoder/projection")
+    def projection_jsonable_encoder() -> JSONResponse:
+        return JSONResponse(content=jsonable_encoder(projection))
+
+    @app.get("/orjson/projection")
+    def projection_orjson(response: Response) -> Response:
+        return orjson_response(projection, response)
+
+    return app
+
+
+CASES = {
+    "students": ("/response-model/students", "/validated/students"),
+    "sessions": ("/response-model/sessions", "/validated/sessions"),
+    "projection": ("/jsonable-encoder/projection", "/orjson/projection"),
+}
+
+
+def _summarize(latencies: list[float]) -> dict:
+    cuts = quantiles(latencies, n=100)
+    return {
+        "n": len(latencies),
+        "p50_ms": round(cuts[49] * 1000, 2),
+        "p99_ms": round(cuts[98] * 1000, 2),
+    }
+
+
+def _measure(request: Callable[[], object], iterations: int, warmup: int) -> dict:
+    latencies: list[float] = []
+    for iteration in range(warmup + iterations):
+        started = perf_counter()
+        request()
+        if iteration >= warmup:
+            latencies.append(perf_counter() - started)
+    return _summarize(latencies)
+
+
+def run(rows: int, iterations: int, warmup: int) -> dict:
+    students, sessions = _rows(rows)
+    results = {}
+    with TestClient(_app(students, sessions)) as client:
+        for name, (before_path, after_path) in CASES.items():
+            before = client.get(before_path)
+            after = client.get(after_path)
+            if before.json() != after.json():
+                raise RuntimeError(f"{name}: the two strategies return different JSON")
+            results[name] = {
+                "bytes": len(after.content),
+                "before": _measure(lambda: client.get(before_path), iterations, warmup),
+                "after": _measure(lambda: client.get(after_path), iterations, warmup),
+            }
+    return {"rows": rows, "results": results}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare list serialization strategies on large in-memory payloads"
+    )
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--warmup", type=int, default=5)
+    args = parser.parse_args()
+    print(json.dumps(run(args.rows, args.iterations, args.warmup), indent=2))
+
+
+if __name__ == "__main__":
+    main()
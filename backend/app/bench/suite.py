@@ -0,0 +1,252 @@
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import tempfile
+from collections.abc import Callable
+from pathlib import Path
+from statistics import mean, quantiles
+from time import perf_counter
+
+SERVER_TIMING = re.compile(r'db;dur=([\d.]+);desc="(\d+) queries"')
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _targets(school_index: int) -> dict:
+    from sqlmodel import Session, delete, select
+
+    from app.bench.seed import admin_email
+    from app.core.security import create_access_token
+    from app.db import get_engine
+    from app.models import (
+        Export,
+        Project,
+        Session as ProjectSession,
+        SessionStatus,
+        Student,
+        User,
+    )
+
+    with Session(get_engine()) as session:
+        user = session.exec(
+            select(User).where(User.email == admin_email(school_index))
+        ).first()
+        if user is None:
+            raise SystemExit(f"No seeded admin {admin_email(school_index)}; run app.bench.seed")
+        # Earlier runs leave finished exports behind; drop them so renders are cold.
+        session.exec(delete(Export).where(Export.school_id == user.school_id))
+        session.commit()
+        projects = session.exec(
+            select(Project).where(Project.school_id == user.school_id).order_by(Project.id)
+        ).all()
+        project = projects[0]
+        sessions = session.exec(
+            select(ProjectSession)
+            .where(ProjectSession.project_id == project.id)
+            .order_by(ProjectSession.start)
+        ).all()
+        done = [row for row in sessions if row.status == SessionStatus.done]
+        scheduled = [row for row in sessions if row.status != SessionStatus.done]
+        roster = session.exec(
+            select(Student.id)
+            .where(Student.school_id == user.school_id, Student.class_id == project.class_id)
+            .order_by(Student.id)
+        ).all()
+        return {
+            "token": create_access_token(user.id, user.role, user.school_id),
+            "project_id": str(project.id),
+            "project_ids": [str(row.id) for row in projects],
+            "done_session_id": str((done or sessions)[0].id),
+            "open_session_id": str((scheduled or sessions)[-1].id),
+            "student_ids": [str(student_id) for student_id in roster],
+        }
+
+
+def _dataset() -> dict:
+    from sqlalchemy import func
+    from sqlmodel import Session, select
+
+    from app.db import get_engine
+    from app.models import Attendance, ClassRoom, School, Student
+
+    engine = get_engine()
+    with Session(engine) as session:
+        counts = {
+            model.__tablename__: session.exec(select(func.count()).select_from(model)).one()
+            for model in (School, ClassRoom, Student, Attendance)
+        }
+    return {"dialect": engine.dialect.name, **counts}
+
+
+def _cases(targets: dict) -> dict[str, Callable[[int], tuple[str, str, dict | None]]]:
+    project_id = targets["project_id"]
+    project_ids = targets["project_ids"]
+    student_id = targets["student_ids"][0]
+
+    def attendance_upsert(iteration: int) -> tuple[str, str, dict]:
+        # Flip every status each round so each request really writes.
+        status = "present" if iteration % 2 else "absent"
+        items = [
+            {
+                "session_id": targets["open_session_id"],
+                "student_id": sid,
+                "status": status,
+                "hours": 4.0 if status == "present" else 0.0,
+            }
+            for sid in targets["student_ids"]
+        ]
+        return "POST", "/v1/attendance/bulk", {"items": items}
+
+    def get(path: str) -> Callable[[int], tuple[str, str, None]]:
+        return lambda _iteration: ("GET", path, None)
+
+    def export(iteration: int) -> tuple[str, str, None]:
+        export_project_id = project_ids[iteration % len(project_ids)]
+        return "POST", f"/v1/exports/projects/{export_project_id}/attendance-register", None
+
+    return {
+        "students_list": get("/v1/students?limit=100"),
+        "classes_list": get("/v1/classes"),
+        "projects_list": get("/v1/projects"),
+        "sessions_list": get(f"/v1/projects/{project_id}/sessions"),
+        "attendance_read": get(f"/v1/sessions/{targets['done_session_id']}/attendance"),
+        "student_metrics": get("/v1/students/metrics"),
+        "student_summary": get(f"/v1/students/{student_id}/summary"),
+        "dashboard": get("/v1/dashboard"),
+        "attendance_upsert": attendance_upsert,
+        # Repeat exports of unchanged data are served from the content-hash
+        # cache, so the cold case renders a different project every round.
+        "register_export": export,
+        "register_export_cached": lambda _iteration: export(0),
+    }
+
+
+def _summarize(latencies: list[float], queries: list[int], db_ms: list[float]) -> dict:
+    cuts = quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+    return {
+        "n": len(latencies),
+        "mean_ms": round(mean(latencies) * 1000, 2),
+        "p50_ms": round(cuts[49] * 1000, 2),
+        "p95_ms": round(cuts[94] * 1000, 2),
+        "p99_ms": round(cuts[98] * 1000, 2),
+        "queries": max(queries) if queries else None,
+        "db_ms_mean": round(mean(db_ms), 2) if db_ms else None,
+    }
+
+
+def _measure(client, headers: dict, case, iterations: int, warmup: int) -> dict:
+    latencies: list[float] = []
+    queries: list[int] = []
+    db_ms: list[float] = []
+    for iteration in range(warmup + iterations):
+        method, path, body = case(iteration)
+        started = perf_counter()
+        response = client.request(method, path, headers=headers, json=body)
+        elapsed = perf_counter() - started
+        if response.status_code >= 400:
+            raise RuntimeError(f"{method} {path} -> {response.status_code}: {response.text}")
+        if iteration < warmup:
+            continue
+        latencies.append(elapsed)
+        match = SERVER_TIMING.search(response.headers.get("Server-Timing", ""))
+        if match:
+            db_ms.append(float(match.group(1)))
+            queries.append(int(match.group(2)))
+    return _summarize(latencies, queries, db_ms)
+
+
+def run(args: argparse.Namespace) -> dict:
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    targets = _targets(args.school)
+    headers = {"Authorization": f"Bearer {targets['token']}"}
+    cases = _cases(targets)
+    selected = args.only.split(",") if args.only else list(cases)
+    results = {}
+    with TestClient(app) as client:
+        for name in selected:
+            iterations = args.iterations
+            if name == "register_export":
+                # Each round renders a PDF inline, one project per round.
+                iterations = min(
+                    max(3, iterations // 5), len(targets["project_ids"]) - args.warmup
+                )
+            results[name] = _measure(client, headers, cases[name], iterations, args.warmup)
+    return {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "db_async": os.environ.get("DB_ASYNC", "false"),
+        "dataset": _dataset(),
+        "results": results,
+    }
+
+
+def compare(base: dict, current: dict) -> dict:
+    """Per-endpoint change from ``base``; positive percentages are slower."""
+    changes = {}
+    for name, result in current["results"].items():
+        before = base["results"].get(name)
+        if not before:
+            continue
+        changes[name] = {
+            "p50_change_pct": round((result["p50_ms"] / before["p50_ms"] - 1) * 100, 1),
+            "p95_change_pct": round((result["p95_ms"] / before["p95_ms"] - 1) * 100, 1),
+            "queries": [before["queries"], result["queries"]],
+        }
+    return {"base_commit": base.get("commit"), "commit": current.get("commit"), "changes": changes}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Time the key API endpoints against a seeded dataset"
+    )
+    parser.add_argument(
+        "--database-url",
+        help="a database loaded by app.bench.seed; a small temporary one is seeded if omitted",
+    )
+    parser.add_argument("--school", type=int, default=0, help="seeded school index to act as")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--only", help="comma-separated case names")
+    parser.add_argument("--output", type=Path, help="also write the results to this file")
+    parser.add_argument("--compare", type=Path, help="results file from another commit")
+    parser.add_argument("--schools", type=int, default=3)
+    parser.add_argument("--students-per-school", type=int, default=300)
+    parser.add_argument("--sessions-per-project", type=int, default=30)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        os.environ["STORAGE_DIR"] = str(Path(workdir) / "storage")
+        os.environ["EXPORT_EXECUTOR"] = "inline"
+        os.environ["DATABASE_URL"] = args.database_url or f"sqlite:///{Path(workdir) / 'bench.db'}"
+        if not args.database_url:
+            from app.bench.seed import seed
+            from app.db import get_engine
+
+            seed(get_engine(), args.schools, args.students_per_school, args.sessions_per_project)
+        result = run(args)
+
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2) + "\n")
+    if args.compare:
+        result = {**result, "compare": compare(json.loads(args.compare.read_text()), result)}
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+from threading import Lock
+from time import monotonic, time
+from typing import Any, Hashable
+
+
+class TTLCache:
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def get(self, key: Hashable) -> Any | None:
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= monotonic():
+                del self._data[key]
+                self.misses += 1
+                self.evictions += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = (monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class MemoryCache(TTLCache):
+    """A TTLCache with per-namespace generation counters, private to this process.
+
+    Generations are kept outside the LRU so they are never evicted; one that
+    went back to zero would bring stale entries back.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__(maxsize, ttl)
+        self._generations: dict[str, int] = {}
+
+    def generations(self, namespaces: Sequence[str]) -> list[int]:
+        return [self._generations.get(namespace, 0) for namespace in namespaces]
+
+    def bump_generations(self, namespaces: Sequence[str]) -> None:
+        with self._lock:
+            for namespace in namespaces:
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+
+class SQLiteCache:
+    """MemoryCache's interface over a SQLite file that every worker process shares.
+
+    Values are stored as JSON. Hits do not write, so once full the oldest
+    written entries are evicted rather than the least recently read. Hit,
+    miss and eviction counts cover this process only.
+    """
+
+    def __init__(self, path: Path, maxsize: int, ttl: float) -> None:
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._local = threading.local()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl > 0
+
+    def _connection(self) -> sqlite3.Connection:
+        # One connection per thread, reopened in forked workers.
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=wal")
+        conn.execute("PRAGMA synchronous=normal")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entry ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+            "expires_at REAL NOT NULL, written_at REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS ix_entry_written_at ON entry (written_at)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS generation ("
+            "namespace TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+        self._local.conn = conn
+        self._local.pid = os.getpid()
+        return conn
+
+    def get(self, key: str) -> Any | None:
+        if not self.enabled:
+            return None
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT value, expires_at FROM entry WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        value, expires_at = row
+        if expires_at <= time():
+            conn.execute("DELETE FROM entry WHERE key = ?", (key,))
+            self.misses += 1
+            self.evictions += 1
+            return None
+        self.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        if not self.enabled:
+            return
+        conn = self._connection()
+        now = time()
+        conn.execute(
+            "INSERT OR REPLACE INTO entry (key, value, expires_at, written_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, json.dumps(value), now + self.ttl, now),
+        )
+        evicted = conn.execute(
+            "DELETE FROM entry WHERE key IN ("
+            "SELECT key FROM entry ORDER BY written_at "
+            "LIMIT max(0, (SELECT count(*) FROM entry) - ?))",
+            (self.maxsize,),
+        ).rowcount
+        self.evictions += max(evicted, 0)
+
+    def delete(self, key: str) -> None:
+        self._connection().execute("DELETE FROM entry WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        self._connection().execute("DELETE FROM entry")
+
+    def generations(self, namespaces: Sequence[str]) -> list[int]:
+        if not namespaces:
+            return []
+        rows = self._connection().execute(
+            "SELECT namespace, value FROM generation WHERE namespace IN "
+            f"({', '.join('?' * len(namespaces))})",
+            tuple(namespaces),
+        )
+        found = dict(rows.fetchall())
+        return [found.get(namespace, 0) for namespace in namespaces]
+
+    def bump_generations(self, namespaces: Sequence[str]) -> None:
+        self._connection().executemany(
+            "INSERT INTO generation (namespace, value) VALUES (?, 1) "
+            "ON CONFLICT (namespace) DO UPDATE SET value = value + 1",
+            [(namespace,) for namespace in namespaces],
+        )
+
+    def stats(self) -> dict:
+        return {
+            "backend": "sqlite",
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT count(*) FROM entry").fetchone()[0]
@@ -0,0 +1,223 @@
+import gzip
+import os
+import shutil
+import zlib
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+# Media types worth compressing on the fly. Prefixes end with "/". Stored
+# exports are served from precompressed sidecars instead (see
+# ``write_precompressed``), so PDFs are not recompressed on every download.
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+    "text/",
+)
+# Chunks at least this big are compressed off the event loop.
+THREAD_MINIMUM_SIZE = 128 * 1024
+SIDECAR_CHUNK = 256 * 1024
+# Keep a sidecar only when it saves at least this fraction of the file.
+SIDECAR_MIN_SAVING = 0.05
+SIDECAR_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Supported codings, most preferred first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str | None, offered: Sequence[str]) -> str | None:
+    """Pick the first of ``offered`` the ``Accept-Encoding`` header allows."""
+    if not accept_encoding:
+        return None
+    weights: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        weight = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip() == "q":
+            try:
+                weight = float(value)
+            except ValueError:
+                weight = 0.0
+        weights[coding.strip().lower()] = weight
+    for coding in offered:
+        if weights.get(coding, weights.get("*", 0.0)) > 0:
+            return coding
+    return None
+
+
+def is_compressible(content_type: str, allowed: Iterable[str] = COMPRESSIBLE_TYPES) -> bool:
+    media_type = content_type.partition(";")[0].strip().lower()
+    return any(
+        media_type.startswith(entry) if entry.endswith("/") else media_type == entry
+        for entry in allowed
+    )
+
+
+class _Encoder:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, body: bytes, final: bool) -> bytes:
+        # Streams are flushed per chunk so clients can decode as bytes arrive.
+        if self.encoding == "br":
+            data = self._brotli.process(body)
+            return data + (self._brotli.finish() if final else self._brotli.flush())
+        data = self._zlib.compress(body)
+        return data + self._zlib.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class CompressionMiddleware:
+    """Compress responses with brotli (when installed) or gzip.
+
+    Bodies sent in one message are compressed only from ``minimum_size`` bytes;
+    streamed bodies are compressed chunk by chunk. Responses that already carry
+    a ``Content-Encoding``, partial content and media types outside
+    ``content_types`` pass through untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        content_types: Sequence[str] = COMPRESSIBLE_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.content_types = tuple(content_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding"), available_encodings()
+        )
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        encoder: _Encoder | None = None
+        passthrough = False
+
+        async def compress(body: bytes, final: bool) -> bytes:
+            if len(body) >= THREAD_MINIMUM_SIZE:
+                return await run_in_threadpool(encoder.compress, body, final)
+            return encoder.compress(body, final)
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, encoder, passthrough
+            message_type = message["type"]
+            if message_type == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                passthrough = (
+                    message["status"] in (204, 206, 304)
+                    or "content-encoding" in headers
+                    or not is_compressible(headers.get("content-type", ""), self.content_types)
+                )
+                if passthrough:
+                    await send(message)
+                else:
+                    # Held back until the first body shows whether to compress.
+                    start = message
+                return
+            if passthrough or message_type != "http.response.body":
+                if start is not None:
+                    await send(start)
+                    start = None
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                headers = MutableHeaders(raw=start["headers"])
+                headers.add_vary_header("Accept-Encoding")
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                else:
+                    encoder = _Encoder(encoding, self.gzip_level, self.brotli_quality)
+                    headers["Content-Encoding"] = encoding
+                    del headers["Content-Length"]
+                    body = await compress(body, not more_body)
+                    if not more_body:
+                        headers["Content-Length"] = str(len(body))
+                await send(start)
+                start = None
+            elif encoder is not None:
+                body = await compress(body, not more_body)
+            await send({**message, "body": body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def sidecar_path(path: str | Path, encoding: str) -> Path:
+    return Path(f"{path}{SIDECAR_SUFFIXES[encoding]}")
+
+
+def _write_sidecar(source: Path, target: Path, encoding: str) -> None:
+    partial = target.with_name(f"{target.name}.tmp")
+    with source.open("rb") as reader, partial.open("wb") as writer:
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=11)
+            while chunk := reader.read(SIDECAR_CHUNK):
+                writer.write(compressor.process(chunk))
+            writer.write(compressor.finish())
+        else:
+            # mtime=0 keeps the bytes identical for identical sources.
+            with gzip.GzipFile(fileobj=writer, mode="wb", compresslevel=9, mtime=0) as zipped:
+                shutil.copyfileobj(reader, zipped, SIDECAR_CHUNK)
+    os.replace(partial, target)
+
+
+def write_precompressed(path: str | Path) -> list[Path]:
+    """Write ``path.br``/``path.gz`` next to a stored file that compresses well.
+
+    Sidecars that would save less than ``SIDECAR_MIN_SAVING`` are dropped, so
+    already-compressed files are served as they are.
+    """
+    source = Path(path)
+    size = source.stat().st_size
+    written = []
+    for encoding in available_encodings():
+        target = sidecar_path(source, encoding)
+        _write_sidecar(source, target, encoding)
+        if target.stat().st_size > size * (1 - SIDECAR_MIN_SAVING):
+            target.unlink()
+        else:
+            written.append(target)
+    return written
+
+
+def precompressed_variant(
+    path: str | Path, accept_encoding: str | None
+) -> tuple[Path, str] | None:
+    """The best sidecar of ``path`` the client accepts, if one was written."""
+    offered = [
+        encoding
+        for encoding in available_encodings()
+        if sidecar_path(path, encoding).is_file()
+    ]
+    encoding = negotiate_encoding(accept_encoding, offered)
+    return (sidecar_path(path, encoding), encoding) if encoding else None
@@ -7,11 +7,75 @@ class Settings(BaseSettings):
     )
 
     database_url: str = "sqlite:///./dev.db"
+    db_pool_size: int = 10
+    db_max_overflow: int = 20
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_statement_timeout_ms: int = 30000
+    db_async: bool = False
+    db_instrumentation: bool = True
+    db_duplicate_query_threshold: int = 10
+    metrics_enabled: bool = True
+    # Bearer token a scraper can send to read /metrics; platform admins can
+    # always read it. Leave empty to allow platform admins only.
+    metrics_token: str = ""
+    sqlite_journal_mode: str = "wal"
+    sqlite_synchronous: str = "normal"
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_cache_size_kib: int = 16384
     jwt_secret: str = "dev-secret"
     jwt_algorithm: str = "HS256"
     jwt_expires_minutes: int = 60
+    password_pbkdf2_rounds: int = 29000
+    password_hash_executor: str = "process"
+    password_hash_workers: int = 2
+    password_hash_max_queue: int = 64
+    login_rate_limit_email_attempts: int = 10
+    login_rate_limit_ip_attempts: int = 100
+    login_rate_limit_window_seconds: int = 300
+    auth_user_cache_size: int = 2048
+    # Per worker process: a committed user change clears only the committing
+    # worker's entry, so other workers may accept a deactivated user or a
+    # revoked token for up to this long.
+    auth_user_cache_ttl_seconds: int = 60
+    # "memory" is per process; "sqlite" shares one file between workers so
+    # a write in one worker invalidates the others' entries too.
+    response_cache_backend: str = "memory"
+    response_cache_size: int = 4096
+    response_cache_ttl_seconds: int = 300
+    response_cache_path: str = ""
+    compression_enabled: bool = True
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 4
+    list_max_limit: int = 1000
+    student_import_chunk_size: int = 2000
+    school_timezone: str = "Europe/Rome"
     storage_dir: str = "./storage"
+    export_executor: str = "process"
+    export_workers: int = 2
+    export_poll_interval_seconds: float = 2.0
+    # A "running" export older than this is assumed lost with its worker and
+    # is requeued when the workers start; keep it above the slowest render.
+    export_lease_seconds: int = 1800
+    export_lookup_cache_size: int = 4096
+    export_lookup_cache_ttl_seconds: int = 3600
+    # "app" streams stored files itself; "x-accel-redirect" (nginx) and
+    # "x-sendfile" (Apache, lighttpd) only authorize and let the proxy send them.
+    # X-Accel-Redirect paths are the file's path under storage_dir behind this
+    # prefix, which must map to an internal proxy location.
+    download_mode: str = "app"
+    download_accel_prefix: str = "/protected-storage/"
     environment: str = "development"
 
 
 settings = Settings()
+
+
+def apply_settings(config: Settings) -> Settings:
+    """Copy ``config`` onto the process-wide ``settings`` other modules imported."""
+    if config is not settings:
+        for name in Settings.model_fields:
+            setattr(settings, name, getattr(config, name))
+    return settings
@@ -1,22 +1,79 @@
+import secrets
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy import event
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.cache import TTLCache
 from app.core.config import settings
-from app.db import get_session
+from app.db import get_async_session, get_session
 from app.models import User, UserRole
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/auth/login")
 
+user_cache = TTLCache(
+    maxsize=settings.auth_user_cache_size,
+    ttl=settings.auth_user_cache_ttl_seconds,
+)
 
-def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
-    session: Annotated[Session, Depends(get_session)],
-) -> User:
+
+def reset_user_cache() -> None:
+    global user_cache
+    user_cache = TTLCache(
+        maxsize=settings.auth_user_cache_size,
+        ttl=settings.auth_user_cache_ttl_seconds,
+    )
+
+
+# Users changed in a session's open transaction, dropped from the cache on commit.
+CHANGED_USERS_INFO_KEY = "changed_user_ids"
+
+
+def invalidate_user(user_id: UUID) -> None:
+    user_cache.delete(user_id)
+
+
+def revoke_user_tokens(session: Session, user: User) -> None:
+    """Invalidate every token issued to ``user`` so far.
+
+    Other worker processes keep their cached copy until it expires, which is
+    at most ``auth_user_cache_ttl_seconds``.
+    """
+    user.token_version += 1
+    session.add(user)
+    session.commit()
+    invalidate_user(user.id)
+
+
+@event.listens_for(Session, "after_flush")
+def _record_changed_users(session: Session, _flush_context) -> None:
+    for instance in (*session.dirty, *session.deleted):
+        if isinstance(instance, User):
+            session.info.setdefault(CHANGED_USERS_INFO_KEY, set()).add(instance.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_changed_users(session: Session) -> None:
+    # Deactivations, role and password changes reach this process's next
+    # request instead of waiting for the cached user to expire.
+    for user_id in session.info.pop(CHANGED_USERS_INFO_KEY, ()):
+        invalidate_user(user_id)
+
+
+def _load_user(session: Session, user_id: UUID) -> User | None:
+    user = session.exec(select(User).where(User.id == user_id)).first()
+    if user is not None:
+        session.expunge(user)
+        user_cache.set(user_id, user)
+    return user
+
+
+def _decode_token(token: str) -> tuple[UUID, int]:
     try:
         payload = jwt.decode(
             token, settings.jwt_secret, algorithms=[settings.jwt_algorithm]
@@ -24,19 +81,57 @@ def get_current_user(
         user_id = payload.get("sub")
         if not user_id:
             raise ValueError("missing sub")
-    except (JWTError, ValueError) as exc:
+        return UUID(user_id), int(payload.get("ver", 0))
+    except (JWTError, ValueError, TypeError) as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token"
         ) from exc
 
-    user = session.exec(select(User).where(User.id == UUID(user_id))).first()
+
+def _cached_user(user_id: UUID, token_version: int) -> User | None:
+    user = user_cache.get(user_id)
+    if user is None or user.token_version != token_version:
+        return None
+    return user
+
+
+def _check_user(user: User | None, token_version: int) -> User:
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="User not found"
         )
+    if not user.is_active or user.token_version != token_version:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Token revoked"
+        )
     return user
 
 
+def get_current_user(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    session: Annotated[Session, Depends(get_session)],
+) -> User:
+    user_id, token_version = _decode_token(token)
+    user = _cached_user(user_id, token_version)
+    if user is None:
+        user = _load_user(session, user_id)
+    return _check_user(user, token_version)
+
+
+async def get_current_user_async(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    session: Annotated[AsyncSession, Depends(get_async_session)],
+) -> User:
+    user_id, token_version = _decode_token(token)
+    user = _cached_user(user_id, token_version)
+    if user is None:
+        user = (await session.exec(select(User).where(User.id == user_id))).first()
+        if user is not None:
+            session.expunge(user)
+            user_cache.set(user_id, user)
+    return _check_user(user, token_version)
+
+
 def require_school(
     school_id: UUID,
     current_user: Annotated[User, Depends(get_current_user)],
@@ -49,3 +144,25 @@ def require_school(
             detail="Cross-school access denied",
         )
     return current_user
+
+
+def require_platform_admin(
+    current_user: Annotated[User, Depends(get_current_user)],
+) -> User:
+    if current_user.role != UserRole.platform_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Platform admin only",
+        )
+    return current_user
+
+
+def require_metrics_access(
+    token: Annotated[str, Depends(oauth2_scheme)],
+    session: Annotated[Session, Depends(get_session)],
+) -> None:
+    if settings.metrics_token and secrets.compare_digest(
+        token.encode(), settings.metrics_token.encode()
+    ):
+        return
+    require_platform_admin(get_current_user(token, session))
@@ -0,0 +1,79 @@
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from urllib.parse import quote
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import FileResponse
+
+from app.core.compression import precompressed_variant
+from app.core.config import settings
+from app.core.responses import etag_matches
+from app.core.storage import get_storage_base
+
+# Stored files are written once under a fresh name and never modified.
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+
+def file_etag(stat_result: os.stat_result) -> str:
+    # Strong: a sidecar has its own size and mtime, so each coding gets its own tag.
+    return f'"{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+def _not_modified(request: Request, etag: str, stat_result: os.stat_result) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if not if_modified_since:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return int(stat_result.st_mtime) <= since.timestamp()
+
+
+def _offload_headers(path: Path) -> dict[str, str] | None:
+    """Headers handing ``path`` to the front proxy, or None to serve it here."""
+    if settings.download_mode == "x-sendfile":
+        return {"X-Sendfile": str(path.resolve())}
+    if settings.download_mode == "x-accel-redirect":
+        try:
+            relative = path.resolve().relative_to(get_storage_base().resolve())
+        except ValueError:
+            return None
+        return {"X-Accel-Redirect": settings.download_accel_prefix + quote(relative.as_posix())}
+    return None
+
+
+def stored_file_response(request: Request, path: str | Path, media_type: str) -> Response:
+    """Serve a stored, never-modified file with validators and immutable caching.
+
+    In ``app`` mode the best precompressed sidecar is picked and Starlette
+    streams it, honouring ``Range``/``If-Range`` and handing the path to the
+    server when it supports ``http.response.pathsend``. The proxy modes only
+    authorize: the proxy sends the bytes and handles ranges and encodings.
+    """
+    path = Path(path)
+    headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    offload = _offload_headers(path)
+    if offload is None:
+        headers["Vary"] = "Accept-Encoding"
+        variant = precompressed_variant(path, request.headers.get("accept-encoding"))
+        if variant is not None:
+            path, headers["Content-Encoding"] = variant
+    try:
+        stat_result = path.stat()
+    except OSError:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File missing")
+
+    etag = file_etag(stat_result)
+    headers["ETag"] = etag
+    headers["Last-Modified"] = formatdate(stat_result.st_mtime, usegmt=True)
+    if _not_modified(request, etag, stat_result):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if offload is not None:
+        return Response(media_type=media_type, headers={**headers, **offload})
+    return FileResponse(path, media_type=media_type, headers=headers, stat_result=stat_result)
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from time import perf_counter
+
+from app.core import security
+from app.core.config import settings
+from app.core.metrics import LOGIN_HASH_SECONDS
+
+_executor: Executor | None = None
+_slots = threading.BoundedSemaphore(max(1, settings.password_hash_max_queue))
+# Verifications holding a slot; counted here so the gauge never reads the
+# semaphore's private state.
+_in_flight = 0
+_in_flight_lock = threading.Lock()
+
+
+class HashQueueFull(Exception):
+    pass
+
+
+def _build_executor() -> Executor:
+    workers = max(1, settings.password_hash_workers)
+    if settings.password_hash_executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def start_password_hasher() -> Executor | None:
+    global _executor
+    if settings.password_hash_executor == "inline":
+        return None
+    if _executor is None:
+        _executor = _build_executor()
+    return _executor
+
+
+def reset_hash_queue() -> None:
+    global _slots, _in_flight
+    _slots = threading.BoundedSemaphore(max(1, settings.password_hash_max_queue))
+    with _in_flight_lock:
+        _in_flight = 0
+
+
+def stop_password_hasher() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
+
+
+def _acquire_slot() -> bool:
+    global _in_flight
+    if not _slots.acquire(blocking=False):
+        return False
+    with _in_flight_lock:
+        _in_flight += 1
+    return True
+
+
+def _release_slot() -> None:
+    global _in_flight
+    with _in_flight_lock:
+        _in_flight -= 1
+    _slots.release()
+
+
+def queue_depth() -> int:
+    return _in_flight
+
+
+async def verify_and_update(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Verify off the event loop; raise HashQueueFull instead of queueing unboundedly."""
+    executor = start_password_hasher()
+    started = perf_counter()
+    if executor is None:
+        result = security.verify_and_update_password(plain_password, hashed_password)
+        LOGIN_HASH_SECONDS.observe(perf_counter() - started)
+        return result
+    if not _acquire_slot():
+        raise HashQueueFull
+    try:
+        return await asyncio.wrap_future(
+            executor.submit(
+                security.verify_and_update_password, plain_password, hashed_password
+            )
+        )
+    finally:
+        _release_slot()
+        LOGIN_HASH_SECONDS.observe(perf_counter() - started)
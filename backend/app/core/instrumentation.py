@@ -0,0 +1,145 @@
+import json
+import logging
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+logger = logging.getLogger("app.requests")
+
+SERVER_TIMING_HEADER = "Server-Timing"
+_STARTED_KEY = "query_started_at"
+_CAPTURE_KEY = "query_capture_started_at"
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    statements: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        self.statements[statement] += 1
+
+    @property
+    def duplicates(self) -> dict[str, int]:
+        return {
+            statement: count for statement, count in self.statements.items() if count > 1
+        }
+
+    @property
+    def duplicate_count(self) -> int:
+        return sum(count - 1 for count in self.statements.values() if count > 1)
+
+
+_request_stats: ContextVar[QueryStats | None] = ContextVar(
+    "request_query_stats", default=None
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _request_stats.get() is not None:
+        conn.info.setdefault(_STARTED_KEY, []).append(perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _request_stats.get()
+    started = conn.info.get(_STARTED_KEY)
+    if stats is not None and started:
+        stats.record(statement, perf_counter() - started.pop())
+
+
+def install_query_listeners(engine: Engine) -> None:
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def capture_queries(*engines: Engine) -> Iterator[QueryStats]:
+    """Collect every statement run on ``engines``, from any thread, while open."""
+    stats = QueryStats()
+
+    def before(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(_CAPTURE_KEY, []).append(perf_counter())
+
+    def after(conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info.get(_CAPTURE_KEY)
+        stats.record(statement, perf_counter() - started.pop() if started else 0.0)
+
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", before)
+        event.listen(engine, "after_cursor_execute", after)
+    try:
+        yield stats
+    finally:
+        for engine in engines:
+            event.remove(engine, "before_cursor_execute", before)
+            event.remove(engine, "after_cursor_execute", after)
+
+
+def server_timing(stats: QueryStats, total: float) -> str:
+    return (
+        f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", '
+        f"app;dur={total * 1000:.2f}"
+    )
+
+
+class QueryStatsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _request_stats.set(stats)
+        started = perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    SERVER_TIMING_HEADER, server_timing(stats, perf_counter() - started)
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_stats.reset(token)
+            _log_request(scope, status_code, stats, perf_counter() - started)
+
+
+def _log_request(scope: Scope, status_code: int, stats: QueryStats, total: float) -> None:
+    route = scope.get("route")
+    record = {
+        "method": scope["method"],
+        "path": getattr(route, "path", scope["path"]),
+        "status": status_code,
+        "duration_ms": round(total * 1000, 2),
+        "db_queries": stats.count,
+        "db_ms": round(stats.duration * 1000, 2),
+        "db_duplicates": stats.duplicate_count,
+    }
+    if stats.duplicate_count >= settings.db_duplicate_query_threshold:
+        statement, count = max(stats.duplicates.items(), key=lambda item: item[1])
+        record["db_top_duplicate"] = {"count": count, "statement": statement[:200]}
+        logger.warning(json.dumps(record))
+    elif logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps(record))
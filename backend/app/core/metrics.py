@@ -0,0 +1,308 @@
+import threading
+from bisect import bisect_left
+from collections.abc import Callable, Sequence
+from time import perf_counter
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+EXPORT_SECONDS_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+EXPORT_BYTES_BUCKETS = (1e4, 5e4, 1e5, 5e5, 1e6, 5e6, 1e7, 5e7)
+HASH_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+LabelValues = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(
+        f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)
+    )
+    return f"{{{pairs}}}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Base for metrics whose samples are sharded per writing thread.
+
+    Each thread only ever mutates its own shard, so recording a sample needs
+    no lock; the lock is taken once per thread to register the shard, and by
+    the scrape, which copies every shard (an atomic dict copy under the GIL).
+    """
+
+    kind = "untyped"
+
+    def __init__(
+        self, name: str, help_text: str, labels: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self._shards: list[dict] = []
+        self._shards_lock = threading.Lock()
+        self._local = threading.local()
+
+    def _shard(self) -> dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = {}
+            with self._shards_lock:
+                self._shards.append(shard)
+            self._local.shard = shard
+        return shard
+
+    def _snapshots(self) -> list[dict]:
+        with self._shards_lock:
+            shards = list(self._shards)
+        return [shard.copy() for shard in shards]
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def values(self) -> dict[LabelValues, float]:
+        totals: dict[LabelValues, float] = {}
+        for snapshot in self._snapshots():
+            for labels, value in snapshot.items():
+                totals[labels] = totals.get(labels, 0.0) + value
+        return totals
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for labels, value in sorted(self.values().items()):
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}{label_text} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """A gauge moved up and down with inc/dec; shards are summed on scrape."""
+
+    kind = "gauge"
+
+    def dec(self, *labels: str, amount: float = 1.0) -> None:
+        self.inc(*labels, amount=-amount)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, help_text, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str) -> None:
+        shard = self._shard()
+        row = shard.get(labels)
+        if row is None:
+            # One slot per bucket, one for +Inf, then the running sum.
+            row = shard[labels] = [0.0] * (len(self.buckets) + 2)
+        row[bisect_left(self.buckets, value)] += 1
+        row[-1] += value
+
+    def values(self) -> dict[LabelValues, list[float]]:
+        totals: dict[LabelValues, list[float]] = {}
+        for snapshot in self._snapshots():
+            for labels, row in snapshot.items():
+                total = totals.setdefault(labels, [0.0] * len(row))
+                for index, value in enumerate(row[:]):
+                    total[index] += value
+        return totals
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        bounds = [*self.buckets, float("inf")]
+        for labels, row in sorted(self.values().items()):
+            cumulative = 0.0
+            for bound, count in zip(bounds, row):
+                cumulative += count
+                bucket_labels = _format_labels(
+                    (*self.label_names, "le"), (*labels, _format_value(bound))
+                )
+                lines.append(
+                    f"{self.name}_bucket{bucket_labels} {_format_value(cumulative)}"
+                )
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(row[-1])}")
+            lines.append(f"{self.name}_count{label_text} {_format_value(cumulative)}")
+        return lines
+
+
+class CallbackGauge:
+    """A gauge whose samples are read from ``collect`` at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        collect: Callable[[], dict[LabelValues, float]],
+        labels: Sequence[str] = (),
+    ) -> None:
+        self.name = name
+        self.help = help_text
+        self.label_names = tuple(labels)
+        self.collect = collect
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for labels, value in sorted(self.collect().items()):
+            if value is None:
+                continue
+            label_text = _format_labels(self.label_names, labels)
+            lines.append(f"{self.name}{label_text} {_format_value(value)}")
+        return lines
+
+
+class CallbackCounter(CallbackGauge):
+    """A counter kept elsewhere, read from ``collect`` at scrape time."""
+
+    kind = "counter"
+
+
+class Registry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric | CallbackGauge] = {}
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, help_text, labels))
+
+    def gauge(self, name: str, help_text: str, labels: Sequence[str] = ()) -> Gauge:
+        return self.register(Gauge(name, help_text, labels))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, help_text, labels, buckets))
+
+    def callback_gauge(
+        self,
+        name: str,
+        help_text: str,
+        collect: Callable[[], dict[LabelValues, float]],
+        labels: Sequence[str] = (),
+    ) -> CallbackGauge:
+        return self.register(CallbackGauge(name, help_text, collect, labels))
+
+    def callback_counter(
+        self,
+        name: str,
+        help_text: str,
+        collect: Callable[[], dict[LabelValues, float]],
+        labels: Sequence[str] = (),
+    ) -> CallbackCounter:
+        return self.register(CallbackCounter(name, help_text, collect, labels))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_SECONDS = REGISTRY.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ("method", "route"),
+)
+HTTP_RESPONSES = REGISTRY.counter(
+    "http_responses_total",
+    "HTTP responses by route template and status code.",
+    ("method", "route", "status"),
+)
+HTTP_IN_FLIGHT = REGISTRY.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served.",
+)
+EXPORT_RENDER_SECONDS = REGISTRY.histogram(
+    "export_render_duration_seconds",
+    "Time spent rendering an export, by kind.",
+    ("kind",),
+    EXPORT_SECONDS_BUCKETS,
+)
+EXPORT_FILE_BYTES = REGISTRY.histogram(
+    "export_file_size_bytes",
+    "Size of rendered export files, by kind.",
+    ("kind",),
+    EXPORT_BYTES_BUCKETS,
+)
+EXPORT_FAILURES = REGISTRY.counter(
+    "export_failures_total",
+    "Exports that finished in the failed state, by kind.",
+    ("kind",),
+)
+LOGIN_HASH_SECONDS = REGISTRY.histogram(
+    "login_password_hash_seconds",
+    "Password verification time during login, including queueing.",
+    (),
+    HASH_SECONDS_BUCKETS,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            method = scope["method"]
+            HTTP_REQUEST_SECONDS.observe(perf_counter() - started, method, route)
+            HTTP_RESPONSES.inc(method, route, str(status_code))
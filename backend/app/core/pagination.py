@@ -0,0 +1,191 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import date, datetime
+from typing import Any
+from uuid import UUID
+
+from fastapi import HTTPException, Query, Response, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import func, literal, select as sa_select, tuple_, types
+from sqlalchemy.sql import ColumnElement, Select
+from sqlmodel import Session, SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.responses import orjson_response, validated_json
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+LIKE_ESCAPE = "\\"
+
+
+@dataclass
+class PageParams:
+    limit: int | None = None
+    cursor: str | None = None
+    fields: list[str] | None = None
+    include_total: bool = False
+
+
+def page_params(
+    limit: int | None = Query(default=None, ge=1),
+    cursor: str | None = None,
+    fields: str | None = None,
+    include_total: bool = False,
+) -> PageParams:
+    if limit is not None:
+        limit = min(limit, settings.list_max_limit)
+    field_list = None
+    if fields:
+        field_list = [name.strip() for name in fields.split(",") if name.strip()]
+    return PageParams(
+        limit=limit, cursor=cursor, fields=field_list, include_total=include_total
+    )
+
+
+def like_prefix(value: str) -> str:
+    escaped = (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+    return f"{escaped}%"
+
+
+def encode_cursor(values: list[Any]) -> str:
+    raw = json.dumps(jsonable_encoder(values), separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _coerce(column: ColumnElement, value: Any) -> Any:
+    if value is None:
+        return None
+    column_type = column.type
+    if isinstance(column_type, types.TypeDecorator):
+        column_type = column_type.impl_instance
+    if isinstance(column_type, types.Uuid):
+        return UUID(value)
+    if isinstance(column_type, types.DateTime):
+        return datetime.fromisoformat(value)
+    if isinstance(column_type, types.Date):
+        return date.fromisoformat(value)
+    if isinstance(column_type, types.Integer):
+        return int(value)
+    if isinstance(column_type, types.Float):
+        return float(value)
+    return value
+
+
+def decode_cursor(cursor: str, order_by: list[ColumnElement]) -> list[Any]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(order_by):
+            raise ValueError("cursor length mismatch")
+        return [_coerce(column, value) for column, value in zip(order_by, values)]
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor"
+        ) from exc
+
+
+def _projection(model: type[SQLModel], fields: list[str]) -> list[ColumnElement]:
+    columns = model.__table__.columns
+    unknown = [name for name in fields if name not in columns]
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown field: {unknown[0]}",
+        )
+    return [columns[name] for name in fields]
+
+
+def _count_query(query: Select) -> Select:
+    return select(func.count()).select_from(query.order_by(None).subquery())
+
+
+def _page_query(
+    query: Select,
+    model: type[SQLModel],
+    order_by: list[ColumnElement],
+    page: PageParams,
+) -> Select:
+    if page.fields:
+        projected = _projection(model, page.fields)
+        extra = [column for column in order_by if column.key not in page.fields]
+        projection = sa_select(*projected, *extra)
+        if query.whereclause is not None:
+            projection = projection.where(query.whereclause)
+        query = projection
+
+    query = query.order_by(*order_by)
+    if page.cursor:
+        values = decode_cursor(page.cursor, order_by)
+        bound = [literal(value, column.type) for column, value in zip(order_by, values)]
+        query = query.where(tuple_(*order_by) > tuple_(*bound))
+    if page.limit is not None:
+        query = query.limit(page.limit + 1)
+    return query
+
+
+def _page_result(
+    rows: list[Any],
+    order_by: list[ColumnElement],
+    page: PageParams,
+    headers: dict[str, str],
+    response: Response,
+    adapter: TypeAdapter,
+) -> Response:
+    order_keys = [column.key for column in order_by]
+    if page.limit is not None and len(rows) > page.limit:
+        rows = rows[: page.limit]
+        last = rows[-1]
+        if page.fields:
+            mapping = last._mapping
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(
+                [mapping[key] for key in order_keys]
+            )
+        else:
+            headers[NEXT_CURSOR_HEADER] = encode_cursor(
+                [getattr(last, key) for key in order_keys]
+            )
+
+    if page.fields:
+        items = [{name: row._mapping[name] for name in page.fields} for row in rows]
+        return orjson_response(items, response, headers)
+    return validated_json(adapter, rows, response, headers)
+
+
+def paginate(
+    session: Session,
+    query: Select,
+    model: type[SQLModel],
+    order_by: list[ColumnElement],
+    page: PageParams,
+    response: Response,
+    adapter: TypeAdapter,
+) -> Response:
+    headers: dict[str, str] = {}
+    if page.include_total:
+        headers[TOTAL_COUNT_HEADER] = str(session.exec(_count_query(query)).one())
+    rows = list(session.exec(_page_query(query, model, order_by, page)).all())
+    return _page_result(rows, order_by, page, headers, response, adapter)
+
+
+async def paginate_async(
+    session: AsyncSession,
+    query: Select,
+    model: type[SQLModel],
+    order_by: list[ColumnElement],
+    page: PageParams,
+    response: Response,
+    adapter: TypeAdapter,
+) -> Response:
+    headers: dict[str, str] = {}
+    if page.include_total:
+        total = (await session.exec(_count_query(query))).one()
+        headers[TOTAL_COUNT_HEADER] = str(total)
+    rows = list((await session.exec(_page_query(query, model, order_by, page))).all())
+    return _page_result(rows, order_by, page, headers, response, adapter)
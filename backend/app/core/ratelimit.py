@@ -0,0 +1,63 @@
+from collections import OrderedDict, deque
+from threading import Lock
+from time import monotonic
+from typing import Hashable
+
+
+class SlidingWindowLimiter:
+    def __init__(self, limit: int, window: float, maxsize: int = 10000) -> None:
+        self.limit = limit
+        self.window = window
+        self.maxsize = maxsize
+        self._hits: OrderedDict[Hashable, deque[float]] = OrderedDict()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.limit > 0 and self.window > 0
+
+    def _prune(self, key: Hashable, now: float) -> deque[float] | None:
+        hits = self._hits.get(key)
+        if hits is None:
+            return None
+        while hits and hits[0] <= now - self.window:
+            hits.popleft()
+        if not hits:
+            del self._hits[key]
+            return None
+        return hits
+
+    def retry_after(self, key: Hashable) -> float:
+        """Seconds until ``key`` may try again; 0 when it is under the limit."""
+        if not self.enabled:
+            return 0.0
+        now = monotonic()
+        with self._lock:
+            hits = self._prune(key, now)
+            if hits is None or len(hits) < self.limit:
+                return 0.0
+            return hits[0] + self.window - now
+
+    def hit(self, key: Hashable) -> None:
+        if not self.enabled:
+            return
+        now = monotonic()
+        with self._lock:
+            hits = self._prune(key, now)
+            if hits is None:
+                hits = self._hits[key] = deque()
+            hits.append(now)
+            self._hits.move_to_end(key)
+            while len(self._hits) > self.maxsize:
+                self._hits.popitem(last=False)
+
+    def reset(self, key: Hashable) -> None:
+        with self._lock:
+            self._hits.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hits.clear()
+
+    def __len__(self) -> int:
+        return len(self._hits)
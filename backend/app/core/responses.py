@@ -0,0 +1,56 @@
+from typing import Any
+
+import orjson
+from fastapi import Response
+from pydantic import TypeAdapter
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses the weak comparison, so W/ prefixes are ignored.
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def _carry_headers(target: Response, response: Response | None) -> Response:
+    # FastAPI only merges the handler's ``response`` headers (ETag, pagination)
+    # into responses it builds itself, not into ones the handler returns.
+    if response is not None:
+        target.headers.raw.extend(response.headers.raw)
+    return target
+
+
+def validated_json(
+    adapter: TypeAdapter,
+    content: Any,
+    response: Response | None = None,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Serialize ``content`` that already matches ``adapter``'s type.
+
+    Skips the ``response_model`` validation FastAPI would otherwise run again
+    over rows the ORM or a schema constructor has just built.
+    """
+    target = Response(adapter.dump_json(content), media_type=JSON_MEDIA_TYPE, headers=headers)
+    return _carry_headers(target, response)
+
+
+def orjson_response(
+    content: Any,
+    response: Response | None = None,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """Serialize plain dicts and lists, such as column projections, with orjson.
+
+    UUIDs, dates and enums are encoded natively, as ``jsonable_encoder`` would.
+    """
+    target = Response(orjson.dumps(content), media_type=JSON_MEDIA_TYPE, headers=headers)
+    return _carry_headers(target, response)
@@ -7,7 +7,21 @@ from passlib.context import CryptContext
 
 from app.core.config import settings
 
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+# Hashes below the configured rounds are flagged by verify_and_update and
+# rewritten on the next successful login.
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    deprecated="auto",
+    pbkdf2_sha256__default_rounds=settings.password_pbkdf2_rounds,
+    pbkdf2_sha256__min_rounds=settings.password_pbkdf2_rounds,
+)
+
+
+def configure_password_context() -> None:
+    pwd_context.update(
+        pbkdf2_sha256__default_rounds=settings.password_pbkdf2_rounds,
+        pbkdf2_sha256__min_rounds=settings.password_pbkdf2_rounds,
+    )
 
 
 def hash_password(password: str) -> str:
@@ -18,7 +32,15 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def create_access_token(subject: UUID, role: str, school_id: UUID | None) -> str:
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
+def create_access_token(
+    subject: UUID, role: str, school_id: UUID | None, token_version: int = 0
+) -> str:
     expire = datetime.now(timezone.utc) + timedelta(
         minutes=settings.jwt_expires_minutes
     )
@@ -26,6 +48,7 @@ def create_access_token(subject: UUID, role: str, school_id: UUID | None) -> str
         "sub": str(subject),
         "role": role,
         "school_id": str(school_id) if school_id else None,
+        "ver": token_version,
         "exp": expire,
     }
     return jwt.encode(payload, settings.jwt_secret, algorithm=settings.jwt_algorithm)
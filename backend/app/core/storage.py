@@ -0,0 +1,19 @@
+from pathlib import Path
+from uuid import UUID
+
+from app.core.config import settings
+
+
+def get_storage_base() -> Path:
+    base = Path(settings.storage_dir)
+    return base if base.is_absolute() else (Path.cwd() / base)
+
+
+def ensure_dir(path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+
+
+def school_dir(school_id: UUID, kind: str) -> Path:
+    target = get_storage_base() / str(school_id) / kind
+    ensure_dir(target)
+    return target
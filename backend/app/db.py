@@ -1,26 +1,180 @@
 from pathlib import Path
 
-from alembic import command
-from alembic.config import Config
+from sqlalchemy import event, make_url
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import StaticPool
 from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
+from app.core.instrumentation import install_query_listeners
 
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+psycopg",
+}
 
-def get_engine():
-    connect_args = {}
-    if settings.database_url.startswith("sqlite"):
-        connect_args = {"check_same_thread": False}
-    return create_engine(settings.database_url, connect_args=connect_args)
+_engine: Engine | None = None
+_async_engine: AsyncEngine | None = None
+_pinned: Connection | None = None
 
 
-def get_session():
+def _is_sqlite(url: str) -> bool:
+    return url.startswith("sqlite")
+
+
+def _is_sqlite_memory(url: str) -> bool:
+    return url in ("sqlite://", "sqlite:///:memory:") or "mode=memory" in url
+
+
+def _engine_kwargs(url: str) -> dict:
+    kwargs: dict = {"pool_pre_ping": settings.db_pool_pre_ping}
+    if _is_sqlite(url):
+        kwargs["connect_args"] = {"check_same_thread": False}
+        if _is_sqlite_memory(url):
+            # One connection for every thread, or each would see its own database.
+            kwargs["poolclass"] = StaticPool
+            return kwargs
+    elif url.startswith("postgresql") and settings.db_statement_timeout_ms > 0:
+        kwargs["connect_args"] = {
+            "options": f"-c statement_timeout={settings.db_statement_timeout_ms}"
+        }
+    kwargs.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle,
+    )
+    return kwargs
+
+
+def _sqlite_pragmas(url: str) -> list[str]:
+    pragmas = []
+    if not _is_sqlite_memory(url):
+        pragmas.append(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+    pragmas.extend(
+        [
+            f"PRAGMA synchronous={settings.sqlite_synchronous}",
+            f"PRAGMA busy_timeout={int(settings.sqlite_busy_timeout_ms)}",
+            f"PRAGMA cache_size=-{int(settings.sqlite_cache_size_kib)}",
+            "PRAGMA temp_store=MEMORY",
+        ]
+    )
+    return pragmas
+
+
+def _install_sqlite_pragmas(engine: Engine, url: str) -> None:
+    pragmas = _sqlite_pragmas(url)
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, _connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for pragma in pragmas:
+                cursor.execute(pragma)
+        finally:
+            cursor.close()
+
+
+def build_engine(url: str | None = None) -> Engine:
+    url = url or settings.database_url
+    engine = create_engine(url, **_engine_kwargs(url))
+    if _is_sqlite(url):
+        _install_sqlite_pragmas(engine, url)
+    if settings.db_instrumentation:
+        install_query_listeners(engine)
+    return engine
+
+
+def async_database_url(url: str) -> str:
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver configured for {parsed.get_backend_name()}")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def build_async_engine(url: str | None = None) -> AsyncEngine:
+    url = url or settings.database_url
+    engine = create_async_engine(async_database_url(url), **_engine_kwargs(url))
+    if _is_sqlite(url):
+        _install_sqlite_pragmas(engine.sync_engine, url)
+    if settings.db_instrumentation:
+        install_query_listeners(engine.sync_engine)
+    return engine
+
+
+def use_engines(engine: Engine | None, async_engine: AsyncEngine | None = None) -> None:
+    """Make an app's engines the ones ``get_engine``/``get_async_engine`` return."""
+    global _engine, _async_engine
+    _engine = engine
+    _async_engine = async_engine
+
+
+def pin_connection(connection: Connection | None) -> None:
+    """Open every ORM session on ``connection`` instead of the engine, or stop.
+
+    Tests run each case inside one outer transaction (and savepoint) on a
+    shared database this way, and roll it back afterwards.
+    """
+    global _pinned
+    _pinned = connection
+
+
+def get_bind() -> Engine | Connection:
+    return _pinned if _pinned is not None else get_engine()
+
+
+def get_engine() -> Engine:
+    global _engine
+    if _engine is None:
+        _engine = build_engine()
+    return _engine
+
+
+def get_async_engine() -> AsyncEngine:
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = build_async_engine()
+    return _async_engine
+
+
+def reset_engine_after_fork() -> None:
+    global _engine, _async_engine
+    if _engine is not None:
+        _engine.dispose(close=False)
+        _engine = None
+    if _async_engine is not None:
+        _async_engine.sync_engine.dispose(close=False)
+        _async_engine = None
+
+
+def get_pool_stats() -> dict:
     engine = get_engine()
-    with Session(engine) as session:
+    pool = engine.pool
+    stats: dict = {"pool_class": type(pool).__name__}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        getter = getattr(pool, name, None)
+        stats[name] = getter() if callable(getter) else None
+    return stats
+
+
+def get_session():
+    with Session(get_bind()) as session:
+        yield session
+
+
+async def get_async_session():
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
         yield session
 
 
 def run_migrations() -> None:
+    # Alembic is only needed here and is slow to import, so keep it off startup.
+    from alembic import command
+    from alembic.config import Config
+
     base_dir = Path(__file__).resolve().parents[1]
     alembic_ini = base_dir / "alembic.ini"
     config = Config(str(alembic_ini))
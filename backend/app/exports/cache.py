@@ -0,0 +1,232 @@
+import hashlib
+import json
+from datetime import datetime, timedelta, timezone
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, NamedTuple
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import and_, or_
+from sqlmodel import Session, select
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.exports.kinds import RENDERER_VERSIONS
+from app.models import (
+    Export,
+    ExportStatus,
+    File,
+    Project,
+    School,
+    SchoolBranding,
+    Session as ProjectSession,
+    Student,
+    StudentHours,
+)
+
+FINGERPRINT_YIELD_PER = 1000
+LOGO_READ_CHUNK = 64 * 1024
+
+# (path, size, mtime_ns) -> sha256 of the logo bytes, so unchanged logos are not re-read.
+_logo_digests: dict[tuple[str, int, int], str] = {}
+
+
+class StoredExport(NamedTuple):
+    school_id: UUID
+    file_path: str
+
+
+def _build_stored_exports() -> TTLCache:
+    return TTLCache(
+        maxsize=settings.export_lookup_cache_size,
+        ttl=settings.export_lookup_cache_ttl_seconds,
+    )
+
+
+# Done exports never change, so downloads check the tenant against this
+# instead of reading the export row again.
+stored_exports = _build_stored_exports()
+
+
+def reset_stored_exports() -> None:
+    global stored_exports
+    stored_exports = _build_stored_exports()
+
+
+def _feed(digest: "hashlib._Hash", label: str, values: Iterable[Any]) -> None:
+    digest.update(label.encode())
+    digest.update(b"\x00")
+    digest.update(
+        json.dumps(jsonable_encoder(list(values)), separators=(",", ":")).encode()
+    )
+    digest.update(b"\x00")
+
+
+def _feed_rows(digest: "hashlib._Hash", label: str, rows: Iterable[Any]) -> None:
+    digest.update(label.encode())
+    for row in rows:
+        digest.update(
+            json.dumps(jsonable_encoder(list(row)), separators=(",", ":")).encode()
+        )
+        digest.update(b"\n")
+    digest.update(b"\x00")
+
+
+def _logo_digest(logo: File | None) -> str | None:
+    if not logo or not logo.url:
+        return None
+    path = Path(logo.url)
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    key = (str(path), stat.st_size, stat.st_mtime_ns)
+    cached = _logo_digests.get(key)
+    if cached is not None:
+        return cached
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(LOGO_READ_CHUNK):
+            digest.update(chunk)
+    _logo_digests[key] = digest.hexdigest()
+    return _logo_digests[key]
+
+
+def _feed_school(digest: "hashlib._Hash", session: Session, school_id: UUID) -> None:
+    school = session.exec(select(School).where(School.id == school_id)).first()
+    branding = session.exec(
+        select(SchoolBranding).where(SchoolBranding.school_id == school_id)
+    ).first()
+    logo = None
+    if branding and branding.logo_file_id:
+        logo = session.exec(
+            select(File).where(
+                File.id == branding.logo_file_id, File.school_id == school_id
+            )
+        ).first()
+
+    if school:
+        _feed(
+            digest,
+            "school",
+            [
+                school.id,
+                school.name,
+                school.address,
+                school.city,
+                school.province,
+                school.email,
+                school.phone,
+            ],
+        )
+    if branding:
+        _feed(
+            digest,
+            "branding",
+            [branding.header_text, branding.footer_text, branding.logo_file_id],
+        )
+    if logo:
+        _feed(digest, "logo", [logo.url, _logo_digest(logo)])
+
+
+def _feed_register(
+    digest: "hashlib._Hash", session: Session, school_id: UUID, project_id: UUID
+) -> None:
+    project = session.exec(
+        select(Project).where(Project.id == project_id, Project.school_id == school_id)
+    ).first()
+    if project:
+        _feed(digest, "project", [project.id, project.title, project.status])
+
+    sessions = session.exec(
+        select(ProjectSession.start, ProjectSession.end, ProjectSession.planned_hours)
+        .where(
+            ProjectSession.project_id == project_id,
+            ProjectSession.school_id == school_id,
+        )
+        .order_by(ProjectSession.start, ProjectSession.id)
+        .execution_options(yield_per=FINGERPRINT_YIELD_PER)
+    )
+    _feed_rows(digest, "sessions", sessions)
+
+    # The rollup is refreshed inside every attendance write, so it tracks hours,
+    # statuses and approvals without hashing the raw attendance rows.
+    totals = session.exec(
+        select(
+            Student.id,
+            Student.last_name,
+            Student.first_name,
+            StudentHours.total_hours,
+            StudentHours.attendance_count,
+            StudentHours.present_count,
+            StudentHours.approved_provider_count,
+            StudentHours.approved_school_count,
+        )
+        .join(Student, Student.id == StudentHours.student_id)
+        .where(
+            StudentHours.project_id == project_id,
+            StudentHours.school_id == school_id,
+            Student.school_id == school_id,
+        )
+        .order_by(Student.id)
+        .execution_options(yield_per=FINGERPRINT_YIELD_PER)
+    )
+    _feed_rows(digest, "students", totals)
+
+
+def export_fingerprint(
+    session: Session, school_id: UUID, kind: str, project_id: UUID | None = None
+) -> str | None:
+    version = RENDERER_VERSIONS.get(kind)
+    if version is None:
+        return None
+    digest = hashlib.sha256()
+    _feed(digest, "kind", [kind, version, school_id, project_id])
+    _feed_school(digest, session, school_id)
+    if kind == "attendance_register" and project_id is not None:
+        _feed_register(digest, session, school_id, project_id)
+    return digest.hexdigest()
+
+
+def export_lease_cutoff() -> datetime:
+    """Exports still running since before this are treated as lost."""
+    return datetime.now(timezone.utc) - timedelta(seconds=settings.export_lease_seconds)
+
+
+def find_cached_export(
+    session: Session, school_id: UUID, kind: str, content_hash: str
+) -> Export | None:
+    # In-flight rows are shared only while live: a job stuck past its lease
+    # must not keep the same export from being rendered again.
+    candidates = session.exec(
+        select(Export)
+        .where(
+            Export.school_id == school_id,
+            Export.kind == kind,
+            Export.content_hash == content_hash,
+            or_(
+                Export.status.in_([ExportStatus.done, ExportStatus.pending]),
+                and_(
+                    Export.status == ExportStatus.running,
+                    Export.started_at >= export_lease_cutoff(),
+                ),
+            ),
+        )
+        .order_by(Export.created_at.desc())
+    ).all()
+    for export_row in candidates:
+        if export_row.status != ExportStatus.done or Path(export_row.file_path).exists():
+            return export_row
+    return None
+
+
+def remember_stored_export(export_row: Export) -> StoredExport:
+    stored = StoredExport(export_row.school_id, export_row.file_path)
+    if export_row.status == ExportStatus.done:
+        stored_exports.set(export_row.id, stored)
+    return stored
+
+
+def lookup_stored_export(export_id: UUID) -> StoredExport | None:
+    return stored_exports.get(export_id)
@@ -0,0 +1,309 @@
+import logging
+import os
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from importlib import import_module
+from time import monotonic, perf_counter
+from typing import NamedTuple
+from uuid import UUID, uuid4
+
+from sqlalchemy import update
+from sqlmodel import Session, select
+
+from app.core.compression import write_precompressed
+from app.core.config import settings
+from app.core.metrics import EXPORT_FAILURES, EXPORT_FILE_BYTES, EXPORT_RENDER_SECONDS
+from app.core.storage import school_dir
+from app.db import get_bind, reset_engine_after_fork
+from app.exports.cache import export_fingerprint, export_lease_cutoff, find_cached_export
+from app.exports.kinds import RENDER_MODULE, ExportRenderError, get_renderer
+from app.models import Export, ExportStatus
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_MIN_INTERVAL_SECONDS = 0.5
+
+_executor: Executor | None = None
+_dispatcher: "ExportDispatcher | None" = None
+
+
+class ExportOutcome(NamedTuple):
+    kind: str
+    ok: bool
+    seconds: float
+    size_bytes: int | None = None
+
+
+def record_export_outcome(outcome: ExportOutcome | None) -> None:
+    # Called in the API process: process-pool workers have their own registry.
+    if outcome is None:
+        return
+    if not outcome.ok:
+        EXPORT_FAILURES.inc(outcome.kind)
+        return
+    EXPORT_RENDER_SECONDS.observe(outcome.seconds, outcome.kind)
+    if outcome.size_bytes is not None:
+        EXPORT_FILE_BYTES.observe(outcome.size_bytes, outcome.kind)
+
+
+def enqueue_export(
+    session: Session, school_id: UUID, kind: str, project_id: UUID | None = None
+) -> Export:
+    content_hash = export_fingerprint(session, school_id, kind, project_id)
+    if content_hash is not None:
+        cached = find_cached_export(session, school_id, kind, content_hash)
+        if cached is not None:
+            return cached
+
+    export_id = uuid4()
+    export_row = Export(
+        id=export_id,
+        school_id=school_id,
+        kind=kind,
+        project_id=project_id,
+        file_path=str(school_dir(school_id, "exports") / f"{export_id}.pdf"),
+        status=ExportStatus.pending,
+        content_hash=content_hash,
+    )
+    session.add(export_row)
+    session.commit()
+
+    if settings.export_executor == "inline":
+        record_export_outcome(run_export_job(export_id))
+        session.refresh(export_row)
+    elif _dispatcher is not None:
+        _dispatcher.notify()
+    return export_row
+
+
+def claim_next_export(session: Session) -> UUID | None:
+    query = (
+        select(Export.id)
+        .where(Export.status == ExportStatus.pending)
+        .order_by(Export.created_at)
+        .limit(1)
+    )
+    if session.get_bind().dialect.name == "postgresql":
+        query = query.with_for_update(skip_locked=True)
+    export_id = session.exec(query).first()
+    if export_id is None:
+        session.rollback()
+        return None
+    result = session.exec(
+        update(Export)
+        .where(Export.id == export_id, Export.status == ExportStatus.pending)
+        .values(status=ExportStatus.running, started_at=datetime.now(timezone.utc))
+    )
+    session.commit()
+    return export_id if result.rowcount == 1 else None
+
+
+def requeue_stale_exports(session: Session) -> int:
+    """Put ``running`` exports whose lease has expired back in the queue.
+
+    A worker that crashed or was killed mid-render leaves its row running, and
+    the dispatcher only claims pending rows.
+    """
+    cutoff = export_lease_cutoff()
+    result = session.exec(
+        update(Export)
+        .where(
+            Export.status == ExportStatus.running,
+            (Export.started_at < cutoff) | Export.started_at.is_(None),
+        )
+        .values(status=ExportStatus.pending, started_at=None, progress=0)
+    )
+    session.commit()
+    return result.rowcount
+
+
+def _set_progress(export_id: UUID, progress: int) -> None:
+    with Session(get_bind()) as session:
+        session.exec(
+            update(Export).where(Export.id == export_id).values(progress=progress)
+        )
+        session.commit()
+
+
+def _progress_reporter(export_id: UUID):
+    last_report = 0.0
+
+    def report(progress: int) -> None:
+        nonlocal last_report
+        now = monotonic()
+        if now - last_report < PROGRESS_MIN_INTERVAL_SECONDS:
+            return
+        last_report = now
+        _set_progress(export_id, max(0, min(99, progress)))
+
+    return report
+
+
+def _finish(export_id: UUID, values: dict) -> None:
+    with Session(get_bind()) as session:
+        session.exec(update(Export).where(Export.id == export_id).values(**values))
+        session.commit()
+
+
+def run_export_job(export_id: UUID) -> ExportOutcome | None:
+    started = perf_counter()
+    with Session(get_bind()) as session:
+        export_row = session.exec(select(Export).where(Export.id == export_id)).first()
+        if export_row is None:
+            return None
+        kind = export_row.kind
+        file_path = export_row.file_path
+        if export_row.status == ExportStatus.pending:
+            export_row.status = ExportStatus.running
+            export_row.started_at = datetime.now(timezone.utc)
+            session.commit()
+        try:
+            renderer = get_renderer(export_row.kind)
+            if renderer is None:
+                raise ExportRenderError(f"Unknown export kind: {export_row.kind}")
+            renderer(session, export_row, _progress_reporter(export_id))
+        except Exception as exc:
+            session.rollback()
+            if not isinstance(exc, ExportRenderError):
+                logger.exception("Export %s failed", export_id)
+            elapsed = perf_counter() - started
+            _finish(
+                export_id,
+                {
+                    "status": ExportStatus.failed,
+                    "error": str(exc)[:500] or type(exc).__name__,
+                    "duration_ms": int(elapsed * 1000),
+                    "finished_at": datetime.now(timezone.utc),
+                },
+            )
+            return ExportOutcome(kind, False, elapsed)
+
+    try:
+        # Written before the row is marked done, so every download can use them.
+        write_precompressed(file_path)
+    except OSError:
+        logger.warning("Could not precompress export %s", export_id, exc_info=True)
+    elapsed = perf_counter() - started
+    _finish(
+        export_id,
+        {
+            "status": ExportStatus.done,
+            "progress": 100,
+            "error": None,
+            "duration_ms": int(elapsed * 1000),
+            "finished_at": datetime.now(timezone.utc),
+        },
+    )
+    try:
+        size_bytes = os.path.getsize(file_path)
+    except OSError:
+        size_bytes = None
+    return ExportOutcome(kind, True, elapsed, size_bytes)
+
+
+class ExportDispatcher:
+    def __init__(self, executor: Executor, max_in_flight: int, poll_interval: float) -> None:
+        self._executor = executor
+        self._slots = threading.BoundedSemaphore(max(1, max_in_flight))
+        self._poll_interval = poll_interval
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="export-dispatcher", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._wakeup.set()
+        self._thread.join(timeout=5)
+
+    def notify(self) -> None:
+        self._wakeup.set()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                claimed = self._drain()
+            except Exception:
+                logger.exception("Export dispatcher failed to claim jobs")
+                claimed = False
+            if not claimed:
+                self._wakeup.wait(self._poll_interval)
+                self._wakeup.clear()
+
+    def _drain(self) -> bool:
+        claimed_any = False
+        while not self._stop.is_set() and self._slots.acquire(blocking=False):
+            with Session(get_bind()) as session:
+                export_id = claim_next_export(session)
+            if export_id is None:
+                self._slots.release()
+                break
+            future = self._executor.submit(run_export_job, export_id)
+            future.add_done_callback(
+                lambda done, export_id=export_id: self._on_done(export_id, done)
+            )
+            claimed_any = True
+        return claimed_any
+
+    def _on_done(self, export_id: UUID, future: Future) -> None:
+        self._slots.release()
+        self._wakeup.set()
+        if future.cancelled():
+            _finish(export_id, {"status": ExportStatus.pending, "started_at": None})
+            return
+        exc = future.exception()
+        if exc is None:
+            record_export_outcome(future.result())
+            return
+        logger.error("Export worker crashed on %s: %r", export_id, exc)
+        _finish(
+            export_id,
+            {
+                "status": ExportStatus.failed,
+                "error": f"Worker crashed: {type(exc).__name__}",
+                "finished_at": datetime.now(timezone.utc),
+            },
+        )
+
+
+def _init_export_worker() -> None:
+    reset_engine_after_fork()
+    # Pay for the PDF stack when the worker starts, not on its first job.
+    import_module(RENDER_MODULE)
+
+
+def _build_executor() -> Executor:
+    workers = max(1, settings.export_workers)
+    if settings.export_executor == "thread":
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="export")
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_export_worker)
+
+
+def start_export_workers() -> None:
+    global _executor, _dispatcher
+    if settings.export_executor == "inline" or _dispatcher is not None:
+        return
+    with Session(get_bind()) as session:
+        requeued = requeue_stale_exports(session)
+    if requeued:
+        logger.warning("Requeued %d exports left running by a lost worker", requeued)
+    _executor = _build_executor()
+    _dispatcher = ExportDispatcher(
+        _executor, settings.export_workers, settings.export_poll_interval_seconds
+    )
+    _dispatcher.start()
+
+
+def stop_export_workers() -> None:
+    global _executor, _dispatcher
+    if _dispatcher is not None:
+        _dispatcher.stop()
+        _dispatcher = None
+    if _executor is not None:
+        _executor.shutdown(wait=True, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,22 @@
+from importlib import import_module
+
+
+class ExportRenderError(Exception):
+    pass
+
+
+# Bump a kind's version whenever its layout changes so cached PDFs are re-rendered.
+RENDERER_VERSIONS: dict[str, int] = {
+    "school_header": 1,
+    "attendance_register": 2,
+}
+
+RENDER_MODULE = "app.exports.render"
+
+
+# ReportLab and Pillow are only needed by export jobs, so the render module is
+# imported on first use rather than with app.main.
+def get_renderer(kind: str):
+    if kind not in RENDERER_VERSIONS:
+        return None
+    return import_module(RENDER_MODULE).RENDERERS[kind]
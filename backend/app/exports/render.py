@@ -0,0 +1,279 @@
+from collections.abc import Callable
+from datetime import datetime, timezone
+from uuid import UUID
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfgen import canvas
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.exports.kinds import ExportRenderError
+from app.models import (
+    Export,
+    File,
+    Project,
+    School,
+    SchoolBranding,
+    Session as ProjectSession,
+    Student,
+    StudentHours,
+)
+
+ProgressCallback = Callable[[int], None]
+
+REGISTER_LINE_HEIGHT = 12
+REGISTER_TITLE_BLOCK = 40
+REGISTER_BOTTOM_MARGIN = 60
+REGISTER_YIELD_PER = 500
+
+
+def _draw_school_header(
+    c: canvas.Canvas,
+    school: School,
+    branding: SchoolBranding | None,
+    logo: File | None,
+    page_width: float,
+    page_height: float,
+) -> float:
+    text_y = page_height - 80
+    c.setFont("Helvetica-Bold", 16)
+    c.drawString(72, text_y, school.name)
+    c.setFont("Helvetica", 10)
+    c.drawString(72, text_y - 16, f"{school.address}, {school.city} ({school.province})")
+    c.drawString(72, text_y - 32, f"{school.email} | {school.phone}")
+
+    if branding and branding.header_text:
+        c.setFont("Helvetica-Bold", 12)
+        c.drawString(72, text_y - 56, branding.header_text)
+
+    if logo and logo.url and logo.url.lower().endswith((".png", ".jpg", ".jpeg")):
+        try:
+            image = ImageReader(logo.url)
+            c.drawImage(image, page_width - 160, page_height - 120, width=80, height=80, mask="auto")
+        except Exception:
+            pass
+
+    return text_y - 72
+
+
+def _format_dt(value: datetime) -> str:
+    return value.astimezone(timezone.utc).strftime("%d/%m/%Y %H:%M")
+
+
+def _load_school(
+    session: Session, school_id: UUID
+) -> tuple[School, SchoolBranding | None, File | None]:
+    school = session.exec(select(School).where(School.id == school_id)).first()
+    if not school:
+        raise ExportRenderError("School not found")
+
+    branding = session.exec(
+        select(SchoolBranding).where(SchoolBranding.school_id == school_id)
+    ).first()
+
+    logo = None
+    if branding and branding.logo_file_id:
+        logo = session.exec(
+            select(File).where(
+                File.id == branding.logo_file_id,
+                File.school_id == school_id,
+            )
+        ).first()
+    return school, branding, logo
+
+
+def render_school_header(
+    session: Session, export: Export, on_progress: ProgressCallback
+) -> None:
+    school, branding, logo = _load_school(session, export.school_id)
+
+    c = canvas.Canvas(export.file_path, pagesize=letter)
+    width, height = letter
+
+    _draw_school_header(c, school, branding, logo, width, height)
+
+    if branding and branding.footer_text:
+        c.setFont("Helvetica", 10)
+        c.drawString(72, 40, branding.footer_text)
+
+    c.showPage()
+    c.save()
+
+
+class _RegisterPages:
+    def __init__(
+        self,
+        c: canvas.Canvas,
+        school: School,
+        branding: SchoolBranding | None,
+        logo: File | None,
+        project: Project,
+        total_lines: int,
+        generated_at: datetime,
+    ) -> None:
+        self.c = c
+        self.school = school
+        self.branding = branding
+        self.logo = logo
+        self.project = project
+        self.generated_at = generated_at
+        self.width, self.height = letter
+        self.page = 0
+        self.cursor_y = 0.0
+        self.total_pages = self._count_pages(total_lines)
+
+    def _first_page_top(self) -> float:
+        return self.height - 80 - 72 - REGISTER_TITLE_BLOCK
+
+    def _next_page_top(self) -> float:
+        return self.height - 72
+
+    def _capacity(self, top: float) -> int:
+        return int((top - REGISTER_BOTTOM_MARGIN) // REGISTER_LINE_HEIGHT)
+
+    def _count_pages(self, total_lines: int) -> int:
+        first = self._capacity(self._first_page_top())
+        if total_lines <= first:
+            return 1
+        return 1 + -(-(total_lines - first) // self._capacity(self._next_page_top()))
+
+    def start_page(self) -> None:
+        self.page += 1
+        if self.page == 1:
+            top = _draw_school_header(
+                self.c, self.school, self.branding, self.logo, self.width, self.height
+            )
+            self.c.setFont("Helvetica-Bold", 12)
+            self.c.drawString(72, top - 12, "Registro Presenze PCTO")
+            self.c.setFont("Helvetica", 10)
+            self.c.drawString(
+                72, top - 28, f"Progetto: {self.project.title} ({self.project.status})"
+            )
+            self.cursor_y = self._first_page_top()
+        else:
+            self.c.setFont("Helvetica-Bold", 10)
+            self.c.drawString(
+                72,
+                self.height - 48,
+                f"{self.school.name} - Registro Presenze PCTO - {self.project.title}",
+            )
+            self.cursor_y = self._next_page_top()
+        self._draw_footer()
+
+    def _draw_footer(self) -> None:
+        self.c.setFont("Helvetica", 8)
+        self.c.drawString(72, 24, f"Generato il {_format_dt(self.generated_at)}")
+        self.c.drawRightString(
+            self.width - 72, 24, f"Pagina {self.page} di {self.total_pages}"
+        )
+        if self.branding and self.branding.footer_text:
+            self.c.setFont("Helvetica", 10)
+            self.c.drawString(72, 40, self.branding.footer_text)
+
+    def line(self, text: str, font: str = "Helvetica", size: int = 9, indent: int = 84) -> None:
+        if self.cursor_y - REGISTER_LINE_HEIGHT < REGISTER_BOTTOM_MARGIN:
+            self.c.showPage()
+            self.start_page()
+        self.cursor_y -= REGISTER_LINE_HEIGHT
+        self.c.setFont(font, size)
+        self.c.drawString(indent, self.cursor_y, text)
+
+    def heading(self, text: str) -> None:
+        self.line(text, font="Helvetica-Bold", size=10, indent=72)
+
+    def finish(self) -> None:
+        self.c.showPage()
+        self.c.save()
+
+
+def render_attendance_register(
+    session: Session, export: Export, on_progress: ProgressCallback
+) -> None:
+    school_id = export.school_id
+    project = session.exec(
+        select(Project).where(
+            Project.id == export.project_id, Project.school_id == school_id
+        )
+    ).first()
+    if not project:
+        raise ExportRenderError("Project not found")
+
+    school, branding, logo = _load_school(session, school_id)
+
+    session_count = session.exec(
+        select(func.count(ProjectSession.id)).where(
+            ProjectSession.project_id == project.id,
+            ProjectSession.school_id == school_id,
+        )
+    ).one()
+    student_count = session.exec(
+        select(func.count()).where(
+            StudentHours.project_id == project.id,
+            StudentHours.school_id == school_id,
+        )
+    ).one()
+    total_rows = max(1, session_count + student_count)
+    # Two headings plus the blank line between the sections.
+    total_lines = session_count + student_count + 3
+
+    c = canvas.Canvas(export.file_path, pagesize=letter, pageCompression=1)
+    pages = _RegisterPages(
+        c, school, branding, logo, project, total_lines, datetime.now(timezone.utc)
+    )
+    pages.start_page()
+    drawn = 0
+
+    pages.heading("Sessioni")
+    session_rows = session.exec(
+        select(ProjectSession.start, ProjectSession.end, ProjectSession.planned_hours)
+        .where(
+            ProjectSession.project_id == project.id,
+            ProjectSession.school_id == school_id,
+        )
+        .order_by(ProjectSession.start, ProjectSession.id)
+        .execution_options(yield_per=REGISTER_YIELD_PER)
+    )
+    for start, end, planned_hours in session_rows:
+        pages.line(f"{_format_dt(start)} - {_format_dt(end)} ({planned_hours}h)")
+        drawn += 1
+        on_progress(drawn * 100 // total_rows)
+
+    pages.line("")
+    pages.heading("Totale ore studenti")
+    student_rows = session.exec(
+        select(
+            Student.last_name,
+            Student.first_name,
+            StudentHours.total_hours,
+            StudentHours.attendance_count,
+            StudentHours.approved_provider_count,
+            StudentHours.approved_school_count,
+        )
+        .join(Student, Student.id == StudentHours.student_id)
+        .where(
+            StudentHours.project_id == project.id,
+            StudentHours.school_id == school_id,
+            Student.school_id == school_id,
+        )
+        .order_by(Student.last_name, Student.first_name, Student.id)
+        .execution_options(yield_per=REGISTER_YIELD_PER)
+    )
+    for last_name, first_name, total_hours, count, provider_count, school_count in student_rows:
+        provider_label = "approvato" if provider_count == count else "in attesa"
+        school_label = "approvato" if school_count == count else "in attesa"
+        pages.line(
+            f"{last_name} {first_name} - {total_hours}h "
+            f"(tutor aziendale: {provider_label}, "
+            f"tutor scolastico: {school_label})"
+        )
+        drawn += 1
+        on_progress(drawn * 100 // total_rows)
+
+    pages.finish()
+
+
+RENDERERS: dict[str, Callable[[Session, Export, ProgressCallback], None]] = {
+    "school_header": render_school_header,
+    "attendance_register": render_attendance_register,
+}
@@ -0,0 +1,274 @@
+import codecs
+import csv
+from collections.abc import Iterable, Iterator
+from itertools import islice
+from typing import Any, BinaryIO
+from uuid import UUID, uuid4
+
+from sqlalchemy import insert, tuple_
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+
+from app.models import ClassRoom, Student
+from app.schemas import StudentImportError, StudentImportReport
+from app.versions import Collection, bump_versions
+
+IMPORT_CHUNK_SIZE = 2000
+DEFAULT_REQUIRED_HOURS = 150
+
+REQUIRED_COLUMNS = ("first_name", "last_name", "year", "section")
+COLUMN_ALIASES = {
+    "first_name": "first_name",
+    "nome": "first_name",
+    "last_name": "last_name",
+    "cognome": "last_name",
+    "year": "year",
+    "anno": "year",
+    "section": "section",
+    "sezione": "section",
+    "pcto_required_hours": "pcto_required_hours",
+    "ore_pcto": "pcto_required_hours",
+}
+
+_INSERT_BY_DIALECT = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+ClassKey = tuple[int, str]
+Row = tuple[int, dict[str, Any]]
+
+
+class StudentImportFormatError(Exception):
+    pass
+
+
+def detect_format(filename: str | None, content_type: str | None) -> str:
+    name = (filename or "").lower()
+    content_type = (content_type or "").lower()
+    if name.endswith(".xlsx") or "spreadsheetml" in content_type:
+        return "xlsx"
+    if name.endswith(".csv") or content_type in {"text/csv", "application/csv"}:
+        return "csv"
+    raise StudentImportFormatError("Invalid file type")
+
+
+def _normalize_header(header: Iterable[Any]) -> list[str | None]:
+    columns = []
+    for cell in header:
+        name = str(cell).strip().lower().replace(" ", "_") if cell is not None else ""
+        columns.append(COLUMN_ALIASES.get(name))
+    missing = [name for name in REQUIRED_COLUMNS if name not in columns]
+    if missing:
+        raise StudentImportFormatError(f"Missing columns: {', '.join(missing)}")
+    return columns
+
+
+def _rows(records: Iterator[Iterable[Any]]) -> Iterator[Row]:
+    header = next(records, None)
+    if header is None:
+        raise StudentImportFormatError("Empty file")
+    columns = _normalize_header(header)
+    # Row numbers follow the spreadsheet: the header is row 1.
+    for row_number, record in enumerate(records, start=2):
+        values = {
+            column: value
+            for column, value in zip(columns, record)
+            if column is not None
+        }
+        if all(value is None or str(value).strip() == "" for value in values.values()):
+            continue
+        yield row_number, values
+
+
+def _csv_records(stream: BinaryIO) -> Iterator[list[str]]:
+    text = codecs.getreader("utf-8-sig")(stream)
+    sample = text.readline()
+    delimiter = ";" if sample.count(";") > sample.count(",") else ","
+    yield from csv.reader([sample], delimiter=delimiter)
+    yield from csv.reader(text, delimiter=delimiter)
+
+
+def _xlsx_records(stream: BinaryIO) -> Iterator[tuple[Any, ...]]:
+    try:
+        from openpyxl import load_workbook
+    except ImportError as exc:
+        raise StudentImportFormatError("XLSX import is not available") from exc
+
+    try:
+        workbook = load_workbook(stream, read_only=True, data_only=True)
+    except Exception as exc:
+        raise StudentImportFormatError("Invalid XLSX file") from exc
+    try:
+        yield from workbook.worksheets[0].iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def read_rows(stream: BinaryIO, file_format: str) -> Iterator[Row]:
+    records = _xlsx_records(stream) if file_format == "xlsx" else _csv_records(stream)
+    return _rows(records)
+
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value).strip()
+
+
+def _integer(value: Any) -> int | None:
+    text = _text(value)
+    if not text:
+        return None
+    try:
+        number = float(text.replace(",", "."))
+    except ValueError:
+        return None
+    return int(number) if number.is_integer() else None
+
+
+def validate_row(values: dict[str, Any]) -> tuple[dict[str, Any] | None, list[str]]:
+    errors = []
+    first_name = _text(values.get("first_name"))
+    last_name = _text(values.get("last_name"))
+    section = _text(values.get("section"))
+    year = _integer(values.get("year"))
+    if not first_name:
+        errors.append("first_name is required")
+    if not last_name:
+        errors.append("last_name is required")
+    if year is None:
+        errors.append("year must be an integer")
+    if not section:
+        errors.append("section is required")
+
+    hours = DEFAULT_REQUIRED_HOURS
+    if _text(values.get("pcto_required_hours")):
+        hours = _integer(values.get("pcto_required_hours"))
+        if hours is None:
+            errors.append("pcto_required_hours must be an integer")
+        elif hours < 0:
+            errors.append("pcto_required_hours must be >= 0")
+
+    if errors:
+        return None, errors
+    return {
+        "first_name": first_name,
+        "last_name": last_name,
+        "year": year,
+        "section": section,
+        "pcto_required_hours": hours,
+    }, []
+
+
+def _chunks(rows: Iterator[Row], size: int) -> Iterator[list[Row]]:
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def _find_classrooms(
+    session: Session, school_id: UUID, keys: set[ClassKey]
+) -> dict[ClassKey, UUID]:
+    found = session.exec(
+        select(ClassRoom.year, ClassRoom.section, ClassRoom.id).where(
+            ClassRoom.school_id == school_id,
+            tuple_(ClassRoom.year, ClassRoom.section).in_(keys),
+        )
+    ).all()
+    return {(year, section): class_id for year, section, class_id in found}
+
+
+def _create_classrooms(
+    session: Session, school_id: UUID, keys: set[ClassKey]
+) -> tuple[dict[ClassKey, UUID], int]:
+    """Create the missing classes; return all of ``keys`` and how many were new."""
+    insert_stmt = _INSERT_BY_DIALECT.get(session.get_bind().dialect.name)
+    values = [
+        {
+            "id": uuid4(),
+            "school_id": school_id,
+            "name": f"{year}{section}",
+            "year": year,
+            "section": section,
+        }
+        for year, section in sorted(keys)
+    ]
+    if insert_stmt is None:
+        # No ON CONFLICT here: skip the ones that exist, and let the unique
+        # index reject a concurrent import that creates the same class.
+        existing = _find_classrooms(session, school_id, keys)
+        values = [row for row in values if (row["year"], row["section"]) not in existing]
+        if values:
+            session.exec(insert(ClassRoom).values(values))
+    else:
+        # A concurrent import may have created some of them; re-read the winners.
+        session.exec(insert_stmt(ClassRoom).values(values).on_conflict_do_nothing())
+    classrooms = _find_classrooms(session, school_id, keys)
+    # Only rows carrying an id generated here were inserted by this call.
+    generated = {row["id"] for row in values}
+    return classrooms, sum(class_id in generated for class_id in classrooms.values())
+
+
+def import_students(
+    session: Session,
+    school_id: UUID,
+    rows: Iterator[Row],
+    dry_run: bool = False,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+) -> StudentImportReport:
+    report = StudentImportReport(dry_run=dry_run)
+    classrooms: dict[ClassKey, UUID] = {}
+    planned_classes: set[ClassKey] = set()
+
+    for chunk in _chunks(rows, chunk_size):
+        valid: list[dict[str, Any]] = []
+        for row_number, values in chunk:
+            report.total_rows += 1
+            student, errors = validate_row(values)
+            if errors:
+                report.errors.append(StudentImportError(row=row_number, errors=errors))
+            else:
+                valid.append(student)
+        if not valid:
+            continue
+
+        unresolved = {
+            (student["year"], student["section"]) for student in valid
+        } - classrooms.keys() - planned_classes
+        if unresolved:
+            classrooms.update(_find_classrooms(session, school_id, unresolved))
+            missing = unresolved - classrooms.keys()
+            if missing and dry_run:
+                planned_classes |= missing
+                report.created_classes += len(missing)
+            elif missing:
+                created, created_count = _create_classrooms(session, school_id, missing)
+                classrooms.update(created)
+                report.created_classes += created_count
+                if created_count:
+                    bump_versions(session, school_id, Collection.classes)
+
+        if not dry_run:
+            session.exec(
+                insert(Student),
+                params=[
+                    {
+                        "id": uuid4(),
+                        "school_id": school_id,
+                        "class_id": classrooms[(student["year"], student["section"])],
+                        "first_name": student["first_name"],
+                        "last_name": student["last_name"],
+                        "pcto_required_hours": student["pcto_required_hours"],
+                    }
+                    for student in valid
+                ],
+            )
+            bump_versions(session, school_id, Collection.students)
+            session.commit()
+        report.imported += len(valid)
+
+    if dry_run:
+        session.rollback()
+    return report
@@ -1,8 +1,12 @@
 from app.models.models import (
+    ApprovalEvent,
+    ApprovalRole,
     Attendance,
     AttendanceStatus,
     ClassRoom,
+    CollectionVersion,
     Export,
+    ExportStatus,
     File,
     Project,
     ProjectStatus,
@@ -11,15 +15,20 @@ from app.models.models import (
     Session,
     SessionStatus,
     Student,
+    StudentHours,
     User,
     UserRole,
 )
 
 __all__ = [
+    "ApprovalEvent",
+    "ApprovalRole",
     "Attendance",
     "AttendanceStatus",
     "ClassRoom",
+    "CollectionVersion",
     "Export",
+    "ExportStatus",
     "File",
     "Project",
     "ProjectStatus",
@@ -28,6 +37,7 @@ __all__ = [
     "Session",
     "SessionStatus",
     "Student",
+    "StudentHours",
     "User",
     "UserRole",
 ]
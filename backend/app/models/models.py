@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlalchemy import Column, Enum as SAEnum
+from sqlalchemy import JSON, Column, Enum as SAEnum, Index
 from sqlmodel import Field, SQLModel
 
 
@@ -33,6 +33,18 @@ class SessionStatus(str, Enum):
     done = "done"
 
 
+class ApprovalRole(str, Enum):
+    provider = "provider"
+    school = "school"
+
+
+class ExportStatus(str, Enum):
+    pending = "pending"
+    running = "running"
+    done = "done"
+    failed = "failed"
+
+
 class School(SQLModel, table=True):
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     name: str
@@ -63,11 +75,27 @@ class SchoolBranding(SQLModel, table=True):
 
 
 class Export(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_export_status_created", "status", "created_at"),
+        Index("ix_export_school_kind_hash", "school_id", "kind", "content_hash"),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     school_id: UUID = Field(foreign_key="school.id")
     kind: str
     file_path: str
+    project_id: Optional[UUID] = None
+    status: ExportStatus = Field(
+        default=ExportStatus.done,
+        sa_column=Column(SAEnum(ExportStatus), nullable=False),
+    )
+    progress: int = 0
+    error: Optional[str] = None
+    duration_ms: Optional[int] = None
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    content_hash: Optional[str] = None
 
 
 class User(SQLModel, table=True):
@@ -76,9 +104,17 @@ class User(SQLModel, table=True):
     role: UserRole = Field(sa_column=Column(SAEnum(UserRole), nullable=False))
     email: str = Field(index=True, unique=True)
     password_hash: str
+    is_active: bool = True
+    token_version: int = 0
 
 
 class ClassRoom(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ix_classroom_school_year_section", "school_id", "year", "section", unique=True
+        ),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     school_id: UUID = Field(foreign_key="school.id")
     name: str
@@ -87,6 +123,8 @@ class ClassRoom(SQLModel, table=True):
 
 
 class Student(SQLModel, table=True):
+    __table_args__ = (Index("ix_student_school_class", "school_id", "class_id"),)
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     school_id: UUID = Field(foreign_key="school.id")
     class_id: UUID = Field(foreign_key="classroom.id")
@@ -96,6 +134,8 @@ class Student(SQLModel, table=True):
 
 
 class Project(SQLModel, table=True):
+    __table_args__ = (Index("ix_project_school_class", "school_id", "class_id"),)
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     school_id: UUID = Field(foreign_key="school.id")
     class_id: UUID = Field(foreign_key="classroom.id")
@@ -114,6 +154,11 @@ class Project(SQLModel, table=True):
 
 
 class Session(SQLModel, table=True):
+    __table_args__ = (
+        Index("ix_session_school_project_start", "school_id", "project_id", "start"),
+        Index("ix_session_school_series", "school_id", "series_id"),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     school_id: UUID = Field(foreign_key="school.id")
     project_id: UUID = Field(foreign_key="project.id")
@@ -125,9 +170,21 @@ class Session(SQLModel, table=True):
         default=SessionStatus.scheduled,
         sa_column=Column(SAEnum(SessionStatus), nullable=False),
     )
+    series_id: Optional[UUID] = None
 
 
 class Attendance(SQLModel, table=True):
+    __table_args__ = (
+        Index(
+            "ux_attendance_school_session_student",
+            "school_id",
+            "session_id",
+            "student_id",
+            unique=True,
+        ),
+        Index("ix_attendance_school_student", "school_id", "student_id"),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     school_id: UUID = Field(foreign_key="school.id")
     session_id: UUID = Field(foreign_key="session.id")
@@ -138,3 +195,48 @@ class Attendance(SQLModel, table=True):
     hours: float
     approved_by_provider: bool = False
     approved_by_school: bool = False
+
+
+class StudentHours(SQLModel, table=True):
+    __tablename__ = "student_hours"
+    __table_args__ = (
+        Index("ix_student_hours_school_student", "school_id", "student_id"),
+        Index("ix_student_hours_school_project", "school_id", "project_id"),
+    )
+
+    student_id: UUID = Field(foreign_key="student.id", primary_key=True)
+    project_id: UUID = Field(foreign_key="project.id", primary_key=True)
+    school_id: UUID = Field(foreign_key="school.id")
+    total_hours: float = 0.0
+    attendance_count: int = 0
+    present_count: int = 0
+    approved_provider_count: int = 0
+    approved_school_count: int = 0
+    last_session_end: Optional[datetime] = None
+
+
+class ApprovalEvent(SQLModel, table=True):
+    __tablename__ = "approval_event"
+    __table_args__ = (
+        Index("ix_approval_event_school_project", "school_id", "project_id", "created_at"),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    school_id: UUID = Field(foreign_key="school.id")
+    # No foreign key: the audit trail outlives deleted projects.
+    project_id: UUID
+    session_id: Optional[UUID] = None
+    attendance_id: Optional[UUID] = None
+    user_id: UUID = Field(foreign_key="user.id")
+    role: ApprovalRole = Field(sa_column=Column(SAEnum(ApprovalRole), nullable=False))
+    student_ids: Optional[list[str]] = Field(default=None, sa_column=Column(JSON))
+    approved_count: int = 0
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class CollectionVersion(SQLModel, table=True):
+    __tablename__ = "collection_version"
+
+    school_id: UUID = Field(foreign_key="school.id", primary_key=True)
+    collection: str = Field(primary_key=True, max_length=32)
+    version: int = 0
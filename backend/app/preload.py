@@ -0,0 +1,30 @@
+import gc
+from importlib import import_module
+
+from app.db import reset_engine_after_fork
+from app.exports.kinds import RENDER_MODULE
+
+# Imported lazily by request handlers; a forking server loads them once in the
+# master so every worker shares the pages instead of importing its own copy.
+LAZY_MODULES = (RENDER_MODULE, "openpyxl")
+
+
+def preload() -> None:
+    """Warm the app in a pre-fork master, e.g. gunicorn's ``when_ready`` hook."""
+    from app.main import app
+
+    for name in LAZY_MODULES:
+        try:
+            import_module(name)
+        except ImportError:
+            pass
+    app.openapi()
+    # Move everything loaded so far out of the collector's reach, so collections
+    # in the workers do not write to (and un-share) the inherited pages.
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork() -> None:
+    """Per-worker setup after the fork, e.g. gunicorn's ``post_fork`` hook."""
+    reset_engine_after_fork()
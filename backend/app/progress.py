@@ -0,0 +1,52 @@
+import math
+from uuid import UUID
+
+from app.schemas import ProjectProgress
+
+LABEL_NOT_STARTED = "Non iniziato"
+LABEL_IN_PROGRESS = "In corso"
+LABEL_COMPLETED = "Completato"
+
+BADGE_VARIANTS = {
+    LABEL_NOT_STARTED: "draft",
+    LABEL_IN_PROGRESS: "active",
+    LABEL_COMPLETED: "closed",
+}
+
+
+def js_round(value: float) -> int:
+    # Math.round semantics: halves round towards +infinity, unlike round().
+    return math.floor(value + 0.5)
+
+
+def compute_project_progress(
+    project_id: UUID,
+    total_hours: float | None,
+    completed_hours: float,
+    planned_done_hours: float,
+    session_count: int = 0,
+) -> ProjectProgress:
+    """Server-side twin of computeProjectProgress in frontend/lib/progress.ts.
+
+    ``completed_hours`` is the attendance hours logged on done sessions and
+    ``planned_done_hours`` their planned hours; keep the two in step.
+    """
+    used_hours = completed_hours if completed_hours > 0 else planned_done_hours
+    total = total_hours or 0
+    progress_pct = min(100, js_round(used_hours / total * 100)) if total > 0 else 0
+    label = LABEL_IN_PROGRESS
+    if used_hours <= 0 or progress_pct == 0:
+        label = LABEL_NOT_STARTED
+    elif progress_pct >= 100:
+        label = LABEL_COMPLETED
+    return ProjectProgress(
+        project_id=project_id,
+        total_hours=total_hours,
+        session_count=session_count,
+        completed_hours=completed_hours,
+        planned_done_hours=planned_done_hours,
+        used_hours=used_hours,
+        progress_pct=progress_pct,
+        label=label,
+        badge_variant=BADGE_VARIANTS[label],
+    )
@@ -0,0 +1,338 @@
+from datetime import date, datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import case, func, select as sa_select
+from sqlmodel import select
+
+from app.core.pagination import LIKE_ESCAPE, like_prefix
+from app.models import (
+    Attendance,
+    AttendanceStatus,
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    SessionStatus,
+    Student,
+    StudentHours,
+)
+from app.progress import compute_project_progress, js_round
+from app.schemas import (
+    AttendanceRead,
+    Dashboard,
+    DashboardClassHours,
+    DashboardDay,
+    ProjectProgress,
+    StudentMetric,
+    StudentProjectSummary,
+    StudentSummary,
+)
+
+PROJECT_ORDER = [Project.start_date, Project.id]
+CLASS_ORDER = [ClassRoom.year, ClassRoom.section, ClassRoom.id]
+STUDENT_ORDER = [Student.last_name, Student.first_name, Student.id]
+SESSION_ORDER = [ProjectSession.start, ProjectSession.id]
+
+
+def project_list_query(
+    school_id: UUID,
+    status_filter: ProjectStatus | None = None,
+    class_id: UUID | None = None,
+    start_from: date | None = None,
+    start_to: date | None = None,
+    title_prefix: str | None = None,
+):
+    query = select(Project).where(Project.school_id == school_id)
+    if status_filter:
+        query = query.where(Project.status == status_filter)
+    if class_id:
+        query = query.where(Project.class_id == class_id)
+    if start_from:
+        query = query.where(Project.start_date >= start_from)
+    if start_to:
+        query = query.where(Project.start_date <= start_to)
+    if title_prefix:
+        query = query.where(
+            Project.title.ilike(like_prefix(title_prefix), escape=LIKE_ESCAPE)
+        )
+    return query
+
+
+def class_list_query(school_id: UUID, year: int | None = None, section: str | None = None):
+    query = select(ClassRoom).where(ClassRoom.school_id == school_id)
+    if year is not None:
+        query = query.where(ClassRoom.year == year)
+    if section:
+        query = query.where(ClassRoom.section == section)
+    return query
+
+
+def classroom_query(school_id: UUID, class_id: UUID):
+    return select(ClassRoom).where(
+        ClassRoom.id == class_id, ClassRoom.school_id == school_id
+    )
+
+
+def student_list_query(
+    school_id: UUID, class_id: UUID | None = None, name_prefix: str | None = None
+):
+    query = select(Student).where(Student.school_id == school_id)
+    if class_id:
+        query = query.where(Student.class_id == class_id)
+    if name_prefix:
+        query = query.where(
+            Student.last_name.ilike(like_prefix(name_prefix), escape=LIKE_ESCAPE)
+        )
+    return query
+
+
+def project_query(school_id: UUID, project_id: UUID):
+    return select(Project).where(
+        Project.id == project_id, Project.school_id == school_id
+    )
+
+
+def session_list_query(
+    school_id: UUID,
+    project_id: UUID,
+    status_filter: SessionStatus | None = None,
+    start_from: datetime | None = None,
+    start_to: datetime | None = None,
+):
+    query = select(ProjectSession).where(
+        ProjectSession.project_id == project_id,
+        ProjectSession.school_id == school_id,
+    )
+    if status_filter:
+        query = query.where(ProjectSession.status == status_filter)
+    if start_from:
+        query = query.where(ProjectSession.start >= start_from)
+    if start_to:
+        query = query.where(ProjectSession.start <= start_to)
+    return query
+
+
+def student_metrics_query(school_id: UUID):
+    return (
+        select(
+            Student.id,
+            func.coalesce(func.sum(StudentHours.total_hours), 0.0),
+        )
+        .outerjoin(
+            StudentHours,
+            (StudentHours.student_id == Student.id)
+            & (StudentHours.school_id == school_id),
+        )
+        .where(Student.school_id == school_id)
+        .group_by(Student.id)
+    )
+
+
+def student_metrics(rows) -> list[StudentMetric]:
+    return [
+        StudentMetric(student_id=row[0], completed_hours=float(row[1] or 0.0))
+        for row in rows
+    ]
+
+
+def student_with_class_query(school_id: UUID, student_id: UUID):
+    return select(Student, ClassRoom).where(
+        Student.id == student_id,
+        Student.school_id == school_id,
+        ClassRoom.id == Student.class_id,
+    )
+
+
+def student_project_hours_query(school_id: UUID, student_id: UUID):
+    return (
+        select(
+            Project.id,
+            Project.title,
+            Project.status,
+            StudentHours.total_hours,
+            StudentHours.last_session_end,
+        )
+        .join(Project, Project.id == StudentHours.project_id)
+        .where(
+            StudentHours.student_id == student_id,
+            StudentHours.school_id == school_id,
+            Project.school_id == school_id,
+        )
+        .order_by(Project.title)
+    )
+
+
+def student_summary(
+    student: Student, classroom: ClassRoom, project_rows
+) -> StudentSummary:
+    total_hours = sum(float(row[3] or 0.0) for row in project_rows)
+    return StudentSummary(
+        id=student.id,
+        first_name=student.first_name,
+        last_name=student.last_name,
+        class_id=student.class_id,
+        class_year=classroom.year,
+        class_section=classroom.section,
+        pcto_required_hours=student.pcto_required_hours,
+        completed_hours_total=float(total_hours or 0.0),
+        by_project=[
+            StudentProjectSummary(
+                project_id=row[0],
+                title=row[1],
+                status=row[2],
+                completed_hours=float(row[3] or 0.0),
+                last_session_end=row[4],
+            )
+            for row in project_rows
+        ],
+    )
+
+
+def session_query(school_id: UUID, session_id: UUID):
+    return select(ProjectSession).where(
+        ProjectSession.id == session_id, ProjectSession.school_id == school_id
+    )
+
+
+def attendance_read_query(school_id: UUID, session_id: UUID):
+    return select(Attendance.student_id, Attendance.status, Attendance.hours).where(
+        Attendance.session_id == session_id, Attendance.school_id == school_id
+    )
+
+
+def attendance_reads(rows) -> list[AttendanceRead]:
+    return [
+        AttendanceRead(student_id=row.student_id, status=row.status, hours=row.hours)
+        for row in rows
+    ]
+
+
+def project_progress_query(school_id: UUID):
+    session_hours = (
+        sa_select(
+            Attendance.session_id.label("session_id"),
+            func.sum(Attendance.hours).label("hours"),
+        )
+        .where(Attendance.school_id == school_id)
+        .group_by(Attendance.session_id)
+        .subquery()
+    )
+    all_sessions = ProjectSession.__table__.alias("all_sessions")
+    session_count = (
+        sa_select(func.count(all_sessions.c.id))
+        .where(
+            all_sessions.c.project_id == Project.id,
+            all_sessions.c.school_id == school_id,
+        )
+        .scalar_subquery()
+    )
+    return (
+        sa_select(
+            Project.id,
+            Project.total_hours,
+            func.coalesce(func.sum(session_hours.c.hours), 0.0),
+            func.coalesce(func.sum(ProjectSession.planned_hours), 0.0),
+            session_count,
+        )
+        .select_from(Project)
+        .outerjoin(
+            ProjectSession,
+            (ProjectSession.project_id == Project.id)
+            & (ProjectSession.school_id == school_id)
+            & (ProjectSession.status == SessionStatus.done),
+        )
+        .outerjoin(session_hours, session_hours.c.session_id == ProjectSession.id)
+        .where(Project.school_id == school_id)
+        .group_by(Project.id, Project.total_hours)
+        .order_by(Project.start_date, Project.id)
+    )
+
+
+def project_progress(rows) -> list[ProjectProgress]:
+    return [
+        compute_project_progress(
+            row[0],
+            row[1],
+            float(row[2] or 0.0),
+            float(row[3] or 0.0),
+            session_count=row[4] or 0,
+        )
+        for row in rows
+    ]
+
+
+def dashboard_totals_query(school_id: UUID):
+    return sa_select(
+        sa_select(func.count(ProjectSession.id))
+        .where(ProjectSession.school_id == school_id)
+        .scalar_subquery(),
+        func.coalesce(func.sum(Attendance.hours), 0.0),
+        func.count(Attendance.id),
+        func.coalesce(
+            func.sum(case((Attendance.status == AttendanceStatus.present, 1), else_=0)),
+            0,
+        ),
+    ).where(Attendance.school_id == school_id)
+
+
+def dashboard_since(days: int) -> datetime:
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    return today - timedelta(days=days - 1)
+
+
+def hours_by_day_query(school_id: UUID, since: datetime):
+    day = func.date(ProjectSession.start)
+    return (
+        sa_select(day, func.sum(Attendance.hours))
+        .join(ProjectSession, ProjectSession.id == Attendance.session_id)
+        .where(
+            Attendance.school_id == school_id,
+            ProjectSession.school_id == school_id,
+            ProjectSession.start >= since,
+        )
+        .group_by(day)
+        .order_by(day)
+    )
+
+
+def hours_by_class_query(school_id: UUID):
+    return (
+        sa_select(
+            ClassRoom.id,
+            ClassRoom.year,
+            ClassRoom.section,
+            func.sum(Attendance.hours),
+        )
+        .join(Student, Student.id == Attendance.student_id)
+        .join(ClassRoom, ClassRoom.id == Student.class_id)
+        .where(
+            Attendance.school_id == school_id,
+            Student.school_id == school_id,
+            ClassRoom.school_id == school_id,
+        )
+        .group_by(ClassRoom.id, ClassRoom.year, ClassRoom.section)
+        .order_by(ClassRoom.year, ClassRoom.section)
+    )
+
+
+def dashboard(progress_rows, totals, day_rows, class_rows) -> Dashboard:
+    total_sessions, total_hours, attendance_count, present_count = totals
+    return Dashboard(
+        total_projects=len(progress_rows),
+        total_sessions=total_sessions or 0,
+        total_hours=float(total_hours or 0.0),
+        presence_pct=(
+            js_round(present_count / attendance_count * 100) if attendance_count else 0
+        ),
+        hours_by_day=[
+            DashboardDay(date=date.fromisoformat(str(row[0])[:10]), hours=float(row[1] or 0.0))
+            for row in day_rows
+        ],
+        hours_by_class=[
+            DashboardClassHours(
+                class_id=row[0], label=f"{row[1]}{row[2]}", hours=float(row[3] or 0.0)
+            )
+            for row in class_rows
+        ],
+        projects=project_progress(progress_rows),
+    )
@@ -0,0 +1,164 @@
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta, timezone
+from uuid import UUID
+from zoneinfo import ZoneInfo
+
+from sqlalchemy import bindparam, update
+from sqlmodel import Session, select
+
+from app.models import Session as ProjectSession, SessionStatus
+
+MAX_OCCURRENCES = 500
+
+Occurrence = tuple[datetime, datetime]
+
+
+class RecurrenceError(Exception):
+    pass
+
+
+def zone(tz_name: str) -> ZoneInfo:
+    try:
+        return ZoneInfo(tz_name)
+    except (KeyError, ValueError) as exc:  # ZoneInfoNotFoundError is a KeyError
+        raise RecurrenceError(f"Unknown timezone: {tz_name}") from exc
+
+
+def as_utc(value: datetime) -> datetime:
+    # SQLite hands datetimes back naive; everything is stored in UTC.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def expand_occurrences(
+    weekdays: Iterable[int],
+    start_time: time,
+    end_time: time,
+    start_date: date,
+    end_date: date,
+    exclude_dates: Iterable[date] = (),
+    tz_name: str = "UTC",
+) -> list[Occurrence]:
+    days = set(weekdays)
+    if not days or not days <= set(range(7)):
+        raise RecurrenceError("weekdays must be between 0 (Monday) and 6 (Sunday)")
+    if end_time <= start_time:
+        raise RecurrenceError("End must be after start")
+    if end_date < start_date:
+        raise RecurrenceError("end_date must be on or after start_date")
+    tz = zone(tz_name)
+
+    excluded = set(exclude_dates)
+    occurrences: list[Occurrence] = []
+    day = start_date
+    while day <= end_date:
+        if day.weekday() in days and day not in excluded:
+            if len(occurrences) == MAX_OCCURRENCES:
+                raise RecurrenceError(
+                    f"Recurrence expands to more than {MAX_OCCURRENCES} sessions"
+                )
+            occurrences.append(
+                (
+                    datetime.combine(day, start_time, tz).astimezone(timezone.utc),
+                    datetime.combine(day, end_time, tz).astimezone(timezone.utc),
+                )
+            )
+        day += timedelta(days=1)
+    return occurrences
+
+
+def find_overlaps(
+    session: Session,
+    school_id: UUID,
+    project_id: UUID,
+    occurrences: list[Occurrence],
+    exclude_ids: Iterable[UUID] = (),
+) -> set[int]:
+    """Return the indexes of occurrences that overlap a stored session."""
+    if not occurrences:
+        return set()
+    query = select(ProjectSession.start, ProjectSession.end).where(
+        ProjectSession.school_id == school_id,
+        ProjectSession.project_id == project_id,
+        ProjectSession.start < max(end for _, end in occurrences),
+        ProjectSession.end > min(start for start, _ in occurrences),
+    )
+    excluded = list(exclude_ids)
+    if excluded:
+        # Only the sessions being moved; the rest of their series still counts.
+        query = query.where(ProjectSession.id.not_in(excluded))
+    existing = sorted(
+        (as_utc(start), as_utc(end)) for start, end in session.exec(query).all()
+    )
+    starts = [start for start, _ in existing]
+    latest_end: list[datetime] = []
+    for _, end in existing:
+        latest_end.append(max(end, latest_end[-1]) if latest_end else end)
+
+    overlapping = set()
+    for index, (start, end) in enumerate(occurrences):
+        # Every stored session before `position` starts before this one ends,
+        # so they overlap iff the latest of their ends is after its start.
+        position = bisect_left(starts, end)
+        if position and latest_end[position - 1] > start:
+            overlapping.add(index)
+    return overlapping
+
+
+def local_midnight_utc(day: date, tz_name: str) -> datetime:
+    return datetime.combine(day, time(0), zone(tz_name)).astimezone(timezone.utc)
+
+
+def series_query(school_id: UUID, series_id: UUID, from_date: date | None, tz_name: str):
+    query = select(
+        ProjectSession.id,
+        ProjectSession.project_id,
+        ProjectSession.start,
+        ProjectSession.end,
+    ).where(
+        ProjectSession.school_id == school_id,
+        ProjectSession.series_id == series_id,
+        ProjectSession.status == SessionStatus.scheduled,
+    )
+    if from_date is not None:
+        query = query.where(ProjectSession.start >= local_midnight_utc(from_date, tz_name))
+    return query.order_by(ProjectSession.start)
+
+
+def move_occurrences(
+    rows: Iterable[tuple[UUID, datetime, datetime]],
+    start_time: time | None,
+    end_time: time | None,
+    shift: timedelta,
+    tz_name: str,
+) -> list[tuple[UUID, datetime, datetime]]:
+    tz = zone(tz_name)
+    moved = []
+    for session_id, start, end in rows:
+        start, end = as_utc(start) + shift, as_utc(end) + shift
+        local_day = start.astimezone(tz).date()
+        if start_time is not None:
+            start = datetime.combine(local_day, start_time, tz).astimezone(timezone.utc)
+        if end_time is not None:
+            end = datetime.combine(local_day, end_time, tz).astimezone(timezone.utc)
+        if end <= start:
+            raise RecurrenceError("End must be after start")
+        moved.append((session_id, start, end))
+    return moved
+
+
+def update_session_times(
+    session: Session, moved: list[tuple[UUID, datetime, datetime]]
+) -> None:
+    table = ProjectSession.__table__
+    session.connection().execute(
+        update(table)
+        .where(table.c.id == bindparam("session_id"))
+        .values(start=bindparam("new_start"), end=bindparam("new_end")),
+        [
+            {"session_id": session_id, "new_start": start, "new_end": end}
+            for session_id, start, end in moved
+        ],
+    )
@@ -0,0 +1,90 @@
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.core.cache import MemoryCache, SQLiteCache
+from app.core.config import settings
+from app.core.storage import get_storage_base
+from app.versions import Collection, pop_bumped
+
+# What each cached read is computed from; a write to any of them drops it.
+STUDENT_METRICS_TAGS = (
+    Collection.students,
+    Collection.projects,
+    Collection.sessions,
+    Collection.attendance,
+)
+STUDENT_SUMMARY_TAGS = (Collection.classes, *STUDENT_METRICS_TAGS)
+BRANDING_TAGS = (Collection.branding,)
+
+
+def _cache_path() -> Path:
+    if settings.response_cache_path:
+        return Path(settings.response_cache_path)
+    return get_storage_base() / "cache" / "responses.sqlite3"
+
+
+def _build_backend() -> MemoryCache | SQLiteCache:
+    if settings.response_cache_backend == "sqlite":
+        return SQLiteCache(
+            _cache_path(),
+            maxsize=settings.response_cache_size,
+            ttl=settings.response_cache_ttl_seconds,
+        )
+    return MemoryCache(
+        maxsize=settings.response_cache_size,
+        ttl=settings.response_cache_ttl_seconds,
+    )
+
+
+response_cache = _build_backend()
+
+
+def reset_response_cache() -> None:
+    global response_cache
+    response_cache = _build_backend()
+
+
+def _namespaces(school_id: UUID, tags: Sequence[Collection]) -> list[str]:
+    return [f"{school_id}:{tag.value}" for tag in tags]
+
+
+def response_key(school_id: UUID, tags: Sequence[Collection], name: str, *params) -> str:
+    """Key for one cached read, scoped to the school and its tags' generations.
+
+    Take the key before computing the value: a write committed meanwhile moves
+    the generation on, so the value lands under a key no later read asks for.
+    """
+    generations = response_cache.generations(_namespaces(school_id, tags))
+    state = ",".join(f"{tag.value}={gen}" for tag, gen in zip(tags, generations))
+    return ":".join([str(school_id), name, *map(str, params), state])
+
+
+def get_cached(key: str) -> Any | None:
+    return response_cache.get(key)
+
+
+def set_cached(key: str, value: Any) -> Any:
+    """Store ``value`` as JSON-compatible data and return what was stored."""
+    encoded = jsonable_encoder(value)
+    response_cache.set(key, encoded)
+    return encoded
+
+
+def invalidate(school_id: UUID, tags: Sequence[Collection]) -> None:
+    response_cache.bump_generations(_namespaces(school_id, tags))
+
+
+def cache_stats() -> dict:
+    return response_cache.stats()
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    for school_id, collections in pop_bumped(session).items():
+        invalidate(school_id, sorted(collections))
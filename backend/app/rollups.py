@@ -0,0 +1,161 @@
+from collections import defaultdict
+from collections.abc import Iterable
+from uuid import UUID
+
+from sqlalchemy import Connection, case, delete, event, func, insert, select
+from sqlmodel import Session
+
+from app.db import get_bind
+from app.models import (
+    Attendance,
+    AttendanceStatus,
+    Session as ProjectSession,
+    StudentHours,
+)
+
+attendance = Attendance.__table__
+project_session = ProjectSession.__table__
+student_hours = StudentHours.__table__
+
+ROLLUP_COLUMNS = [
+    "school_id",
+    "student_id",
+    "project_id",
+    "total_hours",
+    "attendance_count",
+    "present_count",
+    "approved_provider_count",
+    "approved_school_count",
+    "last_session_end",
+]
+
+
+def _aggregate_query(school_id: UUID | None, student_ids: set[UUID] | None):
+    query = (
+        select(
+            attendance.c.school_id,
+            attendance.c.student_id,
+            project_session.c.project_id,
+            func.coalesce(func.sum(attendance.c.hours), 0.0),
+            func.count(),
+            func.sum(case((attendance.c.status == AttendanceStatus.present, 1), else_=0)),
+            func.sum(case((attendance.c.approved_by_provider, 1), else_=0)),
+            func.sum(case((attendance.c.approved_by_school, 1), else_=0)),
+            func.max(project_session.c.end),
+        )
+        .join(project_session, project_session.c.id == attendance.c.session_id)
+        .group_by(
+            attendance.c.school_id,
+            attendance.c.student_id,
+            project_session.c.project_id,
+        )
+    )
+    if school_id is not None:
+        query = query.where(
+            attendance.c.school_id == school_id,
+            project_session.c.school_id == school_id,
+        )
+    if student_ids is not None:
+        query = query.where(attendance.c.student_id.in_(student_ids))
+    return query
+
+
+def _refresh(
+    conn: Connection, school_id: UUID | None, student_ids: set[UUID] | None
+) -> None:
+    cleanup = delete(student_hours)
+    if school_id is not None:
+        cleanup = cleanup.where(student_hours.c.school_id == school_id)
+    if student_ids is not None:
+        cleanup = cleanup.where(student_hours.c.student_id.in_(student_ids))
+    conn.execute(cleanup)
+    conn.execute(
+        insert(student_hours).from_select(
+            ROLLUP_COLUMNS, _aggregate_query(school_id, student_ids)
+        )
+    )
+
+
+def refresh_student_hours(
+    session: Session, school_id: UUID, student_ids: Iterable[UUID]
+) -> None:
+    ids = set(student_ids)
+    if ids:
+        _refresh(session.connection(), school_id, ids)
+
+
+def drop_project_hours(session: Session, school_id: UUID, project_id: UUID) -> None:
+    session.connection().execute(
+        delete(student_hours).where(
+            student_hours.c.school_id == school_id,
+            student_hours.c.project_id == project_id,
+        )
+    )
+
+
+def drop_student_hours(session: Session, school_id: UUID, student_id: UUID) -> None:
+    session.connection().execute(
+        delete(student_hours).where(
+            student_hours.c.school_id == school_id,
+            student_hours.c.student_id == student_id,
+        )
+    )
+
+
+def session_student_ids(session: Session, school_id: UUID, session_id: UUID) -> set[UUID]:
+    return set(
+        session.exec(
+            select(Attendance.student_id).where(
+                Attendance.school_id == school_id,
+                Attendance.session_id == session_id,
+            )
+        )
+        .scalars()
+        .all()
+    )
+
+
+def sessions_student_ids(
+    session: Session, school_id: UUID, session_ids: Iterable[UUID]
+) -> set[UUID]:
+    return set(
+        session.exec(
+            select(Attendance.student_id)
+            .where(
+                Attendance.school_id == school_id,
+                Attendance.session_id.in_(list(session_ids)),
+            )
+            .distinct()
+        )
+        .scalars()
+        .all()
+    )
+
+
+def rebuild_student_hours(session: Session, school_id: UUID | None = None) -> None:
+    _refresh(session.connection(), school_id, None)
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_after_orm_flush(session: Session, _flush_context) -> None:
+    touched: dict[UUID, set[UUID]] = defaultdict(set)
+    changed = [
+        *session.new,
+        *session.deleted,
+        *(instance for instance in session.dirty if session.is_modified(instance)),
+    ]
+    for instance in changed:
+        if isinstance(instance, Attendance):
+            touched[instance.school_id].add(instance.student_id)
+    for school_id, student_ids in touched.items():
+        _refresh(session.connection(), school_id, student_ids)
+
+
+def main() -> None:
+    with Session(get_bind()) as session:
+        rebuild_student_hours(session)
+        session.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+from collections import Counter
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import BaseModel
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.approvals import approve_attendance
+from app.attendance import bulk_upsert_attendance
+from app.core.deps import get_current_user
+from app.core.responses import validated_json
+from app.db import get_session
+from app.reads import (
+    attendance_read_query,
+    attendance_reads,
+    project_query,
+    session_query,
+)
+from app.rollups import refresh_student_hours
+from app.models import (
+    ApprovalRole,
+    Attendance,
+    AttendanceStatus,
+    Session as ProjectSession,
+    Student,
+    User,
+)
+from app.schemas import ATTENDANCE_READ_LIST, ApprovalResult, AttendanceRead
+from app.versions import Collection, bump_versions, versioned
+
+router = APIRouter()
+
+
+class AttendanceUpsertItem(BaseModel):
+    student_id: UUID
+    status: AttendanceStatus
+    hours: float
+
+
+class AttendanceBulkItem(BaseModel):
+    session_id: UUID
+    student_id: UUID
+    status: AttendanceStatus
+    hours: float
+
+
+class ApprovalRequest(BaseModel):
+    role: ApprovalRole
+    student_ids: list[UUID] | None = None
+
+
+class AttendanceBulkUpsert(BaseModel):
+    items: list[AttendanceBulkItem]
+
+
+@router.post("/v1/sessions/{session_id}/attendance")
+def upsert_attendance(
+    session_id: UUID,
+    items: list[AttendanceUpsertItem],
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    project_session = session.exec(
+        select(ProjectSession).where(
+            ProjectSession.id == session_id,
+            ProjectSession.school_id == current_user.school_id,
+        )
+    ).first()
+    if not project_session:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    student_ids = [item.student_id for item in items]
+    if not student_ids:
+        return {"updated": 0}
+
+    found = session.exec(
+        select(func.count(Student.id)).where(
+            Student.school_id == current_user.school_id,
+            Student.id.in_(set(student_ids)),
+        )
+    ).one()
+    if found != len(set(student_ids)):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Student not found")
+
+    bulk_upsert_attendance(
+        session,
+        current_user.school_id,
+        ((session_id, item.student_id, item.status, item.hours) for item in items),
+    )
+    refresh_student_hours(session, current_user.school_id, student_ids)
+    bump_versions(session, current_user.school_id, Collection.attendance)
+    session.commit()
+    return {"updated": len(items)}
+
+
+@router.post("/v1/attendance/bulk")
+def upsert_attendance_bulk(
+    payload: AttendanceBulkUpsert,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    if not payload.items:
+        return {"updated": 0}
+
+    session_ids = {item.session_id for item in payload.items}
+    found_sessions = session.exec(
+        select(func.count(ProjectSession.id)).where(
+            ProjectSession.school_id == current_user.school_id,
+            ProjectSession.id.in_(session_ids),
+        )
+    ).one()
+    if found_sessions != len(session_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+
+    student_ids = {item.student_id for item in payload.items}
+    found_students = session.exec(
+        select(func.count(Student.id)).where(
+            Student.school_id == current_user.school_id,
+            Student.id.in_(student_ids),
+        )
+    ).one()
+    if found_students != len(student_ids):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Student not found")
+
+    updated = bulk_upsert_attendance(
+        session,
+        current_user.school_id,
+        (
+            (item.session_id, item.student_id, item.status, item.hours)
+            for item in payload.items
+        ),
+    )
+    refresh_student_hours(session, current_user.school_id, student_ids)
+    bump_versions(session, current_user.school_id, Collection.attendance)
+    session.commit()
+    return {"updated": updated}
+
+
+@router.get(
+    "/v1/sessions/{session_id}/attendance",
+    response_model=list[AttendanceRead],
+    dependencies=[Depends(versioned(Collection.sessions, Collection.attendance))],
+)
+def get_attendance(
+    session_id: UUID,
+    response: Response,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="User has no school"
+        )
+    project_session = session.exec(
+        session_query(current_user.school_id, session_id)
+    ).first()
+    if not project_session:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    rows = session.exec(
+        attendance_read_query(current_user.school_id, session_id)
+    ).all()
+    return validated_json(ATTENDANCE_READ_LIST, attendance_reads(rows), response)
+
+
+def _approval_result(role: ApprovalRole, approved: Counter) -> ApprovalResult:
+    return ApprovalResult(
+        role=role, approved=sum(approved.values()), students=len(approved)
+    )
+
+
+@router.post("/v1/sessions/{session_id}/approve", response_model=ApprovalResult)
+def approve_session(
+    session_id: UUID,
+    payload: ApprovalRequest,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ApprovalResult:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="User has no school"
+        )
+    project_session = session.exec(
+        session_query(current_user.school_id, session_id)
+    ).first()
+    if not project_session:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    approved = approve_attendance(
+        session,
+        current_user.school_id,
+        project_session.project_id,
+        current_user.id,
+        payload.role,
+        session_id=session_id,
+        student_ids=payload.student_ids,
+    )
+    session.commit()
+    return _approval_result(payload.role, approved)
+
+
+@router.post("/v1/projects/{project_id}/approve", response_model=ApprovalResult)
+def approve_project(
+    project_id: UUID,
+    payload: ApprovalRequest,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ApprovalResult:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="User has no school"
+        )
+    project = session.exec(project_query(current_user.school_id, project_id)).first()
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    approved = approve_attendance(
+        session,
+        current_user.school_id,
+        project_id,
+        current_user.id,
+        payload.role,
+        student_ids=payload.student_ids,
+    )
+    session.commit()
+    return _approval_result(payload.role, approved)
+
+
+def _approve_single(
+    attendance_id: UUID, role: ApprovalRole, session: Session, current_user: User
+) -> dict:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="User has no school"
+        )
+    row = session.exec(
+        select(Attendance.session_id, ProjectSession.project_id)
+        .join(ProjectSession, ProjectSession.id == Attendance.session_id)
+        .where(
+            Attendance.id == attendance_id,
+            Attendance.school_id == current_user.school_id,
+        )
+    ).first()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    approve_attendance(
+        session,
+        current_user.school_id,
+        row.project_id,
+        current_user.id,
+        role,
+        session_id=row.session_id,
+        attendance_id=attendance_id,
+    )
+    session.commit()
+    return {"status": "ok"}
+
+
+@router.post("/v1/attendance/{attendance_id}/approve/provider")
+def approve_attendance_provider(
+    attendance_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    return _approve_single(attendance_id, ApprovalRole.provider, session, current_user)
+
+
+@router.post("/v1/attendance/{attendance_id}/approve/school")
+def approve_attendance_school(
+    attendance_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    return _approve_single(attendance_id, ApprovalRole.school, session, current_user)
@@ -0,0 +1,94 @@
+import math
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import BaseModel
+from sqlmodel import Session, select
+
+from app.core.config import Settings
+from app.core.hashing import HashQueueFull, verify_and_update
+from app.core.ratelimit import SlidingWindowLimiter
+from app.core.security import create_access_token
+from app.db import get_session
+from app.models import User
+
+router = APIRouter()
+
+
+class LoginRequest(BaseModel):
+    email: str
+    password: str
+
+
+def login_limiters(config: Settings) -> tuple[SlidingWindowLimiter, SlidingWindowLimiter]:
+    return (
+        SlidingWindowLimiter(
+            config.login_rate_limit_email_attempts, config.login_rate_limit_window_seconds
+        ),
+        SlidingWindowLimiter(
+            config.login_rate_limit_ip_attempts, config.login_rate_limit_window_seconds
+        ),
+    )
+
+
+def _find_user_by_email(session: Session, email: str) -> User | None:
+    return session.exec(select(User).where(User.email == email)).first()
+
+
+def _store_password_hash(session: Session, user: User, password_hash: str) -> None:
+    user.password_hash = password_hash
+    session.add(user)
+    session.commit()
+
+
+@router.post("/v1/auth/login")
+async def login(
+    payload: LoginRequest,
+    request: Request,
+    session: Session = Depends(get_session),
+) -> dict:
+    email_login_limiter = request.app.state.email_login_limiter
+    ip_login_limiter = request.app.state.ip_login_limiter
+    email_key = payload.email.strip().lower()
+    ip_key = request.client.host if request.client else "unknown"
+    retry_after = max(
+        email_login_limiter.retry_after(email_key),
+        ip_login_limiter.retry_after(ip_key),
+    )
+    if retry_after > 0:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+    user = await run_in_threadpool(_find_user_by_email, session, payload.email)
+    verified, new_hash = False, None
+    if user:
+        try:
+            verified, new_hash = await verify_and_update(
+                payload.password, user.password_hash
+            )
+        except HashQueueFull:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Login temporarily unavailable",
+                headers={"Retry-After": "1"},
+            ) from None
+    if not user or not verified:
+        email_login_limiter.hit(email_key)
+        ip_login_limiter.hit(ip_key)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials"
+        )
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Inactive user"
+        )
+    email_login_limiter.reset(email_key)
+    if new_hash:
+        await run_in_threadpool(_store_password_hash, session, user, new_hash)
+    token = create_access_token(
+        user.id, user.role, user.school_id, user.token_version
+    )
+    return {"access_token": token, "token_type": "bearer"}
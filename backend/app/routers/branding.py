@@ -0,0 +1,147 @@
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File as UploadFileField,
+    HTTPException,
+    UploadFile,
+    status,
+)
+from pydantic import BaseModel
+from sqlmodel import Session, select
+
+from app.core.deps import get_current_user
+from app.core.storage import school_dir
+from app.db import get_session
+from app.models import File, SchoolBranding, User
+from app.response_cache import BRANDING_TAGS, get_cached, response_key, set_cached
+
+router = APIRouter()
+
+
+class BrandingResponse(BaseModel):
+    header_text: str | None = None
+    footer_text: str | None = None
+    primary_color: str | None = None
+    logo_file_id: UUID | None = None
+    updated_at: datetime | None = None
+
+
+class BrandingUpdate(BaseModel):
+    header_text: str | None = None
+    footer_text: str | None = None
+    primary_color: str | None = None
+    logo_file_id: UUID | None = None
+
+
+@router.get("/v1/school/branding", response_model=BrandingResponse)
+def get_branding(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> BrandingResponse:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="User has no school"
+        )
+    key = response_key(current_user.school_id, BRANDING_TAGS, "branding")
+    cached = get_cached(key)
+    if cached is not None:
+        return cached
+    branding = session.exec(
+        select(SchoolBranding).where(SchoolBranding.school_id == current_user.school_id)
+    ).first()
+    if not branding:
+        return set_cached(key, BrandingResponse())
+    return set_cached(
+        key,
+        BrandingResponse(
+            header_text=branding.header_text,
+            footer_text=branding.footer_text,
+            primary_color=branding.primary_color,
+            logo_file_id=branding.logo_file_id,
+            updated_at=branding.updated_at,
+        ),
+    )
+
+
+@router.patch("/v1/school/branding", response_model=BrandingResponse)
+def update_branding(
+    payload: BrandingUpdate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> BrandingResponse:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="User has no school"
+        )
+    branding = session.exec(
+        select(SchoolBranding).where(SchoolBranding.school_id == current_user.school_id)
+    ).first()
+    if not branding:
+        branding = SchoolBranding(school_id=current_user.school_id)
+        session.add(branding)
+
+    data = payload.model_dump(exclude_unset=True)
+    if "logo_file_id" in data and data["logo_file_id"]:
+        logo = session.exec(
+            select(File).where(
+                File.id == data["logo_file_id"],
+                File.school_id == current_user.school_id,
+            )
+        ).first()
+        if not logo:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+
+    for key, value in data.items():
+        setattr(branding, key, value)
+    branding.updated_at = datetime.now(timezone.utc)
+    session.commit()
+    session.refresh(branding)
+    return BrandingResponse(
+        header_text=branding.header_text,
+        footer_text=branding.footer_text,
+        primary_color=branding.primary_color,
+        logo_file_id=branding.logo_file_id,
+        updated_at=branding.updated_at,
+    )
+
+
+@router.post("/v1/files/upload-logo")
+def upload_logo(
+    upload: UploadFile = UploadFileField(...),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="User has no school"
+        )
+    content_type = (upload.content_type or "").lower()
+    allowed = {
+        "image/png": "png",
+        "image/jpeg": "jpg",
+        "image/jpg": "jpg",
+        "image/svg+xml": "svg",
+    }
+    if content_type not in allowed:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid file type")
+
+    file_id = uuid4()
+    ext = allowed[content_type]
+    target_dir = school_dir(current_user.school_id, "logos")
+    file_path = target_dir / f"{file_id}.{ext}"
+    with file_path.open("wb") as handle:
+        handle.write(upload.file.read())
+
+    file_row = File(
+        id=file_id,
+        school_id=current_user.school_id,
+        name=upload.filename or f"logo.{ext}",
+        content_type=content_type,
+        url=str(file_path),
+    )
+    session.add(file_row)
+    session.commit()
+    return {"file_id": str(file_id)}
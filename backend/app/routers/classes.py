@@ -0,0 +1,170 @@
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from pydantic import BaseModel
+from sqlmodel import Session, select
+
+from app.core.deps import get_current_user
+from app.core.pagination import PageParams, page_params, paginate
+from app.db import get_session
+from app.reads import CLASS_ORDER, class_list_query
+from app.models import ClassRoom, Student, User
+from app.schemas import CLASS_LIST
+from app.versions import Collection, versioned
+
+router = APIRouter()
+
+
+class ClassCreate(BaseModel):
+    year: int
+    section: str
+
+
+class ClassUpdate(BaseModel):
+    year: int | None = None
+    section: str | None = None
+    name: str | None = None
+
+
+@router.post("/v1/classes", response_model=ClassRoom)
+def create_class(
+    payload: ClassCreate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ClassRoom:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    exists = session.exec(
+        select(ClassRoom).where(
+            ClassRoom.school_id == current_user.school_id,
+            ClassRoom.year == payload.year,
+            ClassRoom.section == payload.section,
+        )
+    ).first()
+    if exists:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Classe già esistente")
+
+    class_name = f"{payload.year}{payload.section}"
+    class_row = ClassRoom(
+        school_id=current_user.school_id,
+        name=class_name,
+        year=payload.year,
+        section=payload.section,
+    )
+    session.add(class_row)
+    session.commit()
+    session.refresh(class_row)
+    return class_row
+
+
+@router.patch("/v1/classes/{class_id}", response_model=ClassRoom)
+def update_class(
+    class_id: UUID,
+    payload: ClassUpdate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ClassRoom:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    class_row = session.exec(
+        select(ClassRoom).where(
+            ClassRoom.id == class_id,
+            ClassRoom.school_id == current_user.school_id,
+        )
+    ).first()
+    if not class_row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    data = payload.model_dump(exclude_unset=True)
+    next_year = data.get("year", class_row.year)
+    next_section = data.get("section", class_row.section)
+    if (
+        next_year != class_row.year
+        or next_section != class_row.section
+    ):
+        exists = session.exec(
+            select(ClassRoom).where(
+                ClassRoom.school_id == current_user.school_id,
+                ClassRoom.year == next_year,
+                ClassRoom.section == next_section,
+                ClassRoom.id != class_id,
+            )
+        ).first()
+        if exists:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Classe già esistente"
+            )
+
+    if "name" not in data:
+        data["name"] = f"{next_year}{next_section}"
+
+    for key, value in data.items():
+        setattr(class_row, key, value)
+    session.commit()
+    session.refresh(class_row)
+    return class_row
+
+
+@router.delete("/v1/classes/{class_id}")
+def delete_class(
+    class_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    class_row = session.exec(
+        select(ClassRoom).where(
+            ClassRoom.id == class_id,
+            ClassRoom.school_id == current_user.school_id,
+        )
+    ).first()
+    if not class_row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    has_students = session.exec(
+        select(Student.id).where(
+            Student.class_id == class_id,
+            Student.school_id == current_user.school_id,
+        )
+    ).first()
+    if has_students:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Impossibile eliminare: la classe ha studenti",
+        )
+
+    session.delete(class_row)
+    session.commit()
+    return {"deleted": True}
+
+
+@router.get(
+    "/v1/classes",
+    response_model=list[ClassRoom],
+    dependencies=[Depends(versioned(Collection.classes))],
+)
+def list_classes(
+    response: Response,
+    year: int | None = None,
+    section: str | None = None,
+    page: PageParams = Depends(page_params),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    query = class_list_query(current_user.school_id, year, section)
+    return paginate(session, query, ClassRoom, CLASS_ORDER, page, response, CLASS_LIST)
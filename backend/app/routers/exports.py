@@ -0,0 +1,132 @@
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import BaseModel
+from sqlmodel import Session, select
+
+from app.core.deps import get_current_user
+from app.core.downloads import stored_file_response
+from app.db import get_session
+from app.exports.cache import lookup_stored_export, remember_stored_export
+from app.exports.jobs import enqueue_export
+from app.models import Export, ExportStatus, Project, School, User
+
+router = APIRouter()
+
+
+class ExportJob(BaseModel):
+    export_id: UUID
+    kind: str
+    status: ExportStatus
+    progress: int
+    error: str | None = None
+    duration_ms: int | None = None
+    created_at: datetime
+    finished_at: datetime | None = None
+
+
+def _export_job(export_row: Export) -> ExportJob:
+    return ExportJob(
+        export_id=export_row.id,
+        kind=export_row.kind,
+        status=export_row.status,
+        progress=export_row.progress,
+        error=export_row.error,
+        duration_ms=export_row.duration_ms,
+        created_at=export_row.created_at,
+        finished_at=export_row.finished_at,
+    )
+
+
+@router.post(
+    "/v1/exports/school-header",
+    response_model=ExportJob,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def export_school_header(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ExportJob:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="User has no school"
+        )
+    school = session.exec(
+        select(School).where(School.id == current_user.school_id)
+    ).first()
+    if not school:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="School not found")
+
+    export_row = enqueue_export(session, current_user.school_id, "school_header")
+    return _export_job(export_row)
+
+
+@router.post(
+    "/v1/exports/projects/{project_id}/attendance-register",
+    response_model=ExportJob,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def export_attendance_register(
+    project_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ExportJob:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="User has no school"
+        )
+    project = session.exec(
+        select(Project).where(
+            Project.id == project_id, Project.school_id == current_user.school_id
+        )
+    ).first()
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    export_row = enqueue_export(
+        session, current_user.school_id, "attendance_register", project_id=project.id
+    )
+    return _export_job(export_row)
+
+
+@router.get("/v1/exports/{export_id}", response_model=ExportJob)
+def get_export(
+    export_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ExportJob:
+    export_row = session.exec(
+        select(Export).where(
+            Export.id == export_id, Export.school_id == current_user.school_id
+        )
+    ).first()
+    if not export_row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    return _export_job(export_row)
+
+
+@router.get("/v1/exports/{export_id}/download")
+def download_export(
+    export_id: UUID,
+    request: Request,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    stored = lookup_stored_export(export_id)
+    if stored is None:
+        export_row = session.exec(
+            select(Export).where(
+                Export.id == export_id, Export.school_id == current_user.school_id
+            )
+        ).first()
+        if not export_row:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+        if export_row.status != ExportStatus.done:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT, detail="Export not ready"
+            )
+        stored = remember_stored_export(export_row)
+    if stored.school_id != current_user.school_id:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    return stored_file_response(request, stored.file_path, "application/pdf")
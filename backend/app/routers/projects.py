@@ -0,0 +1,280 @@
+from datetime import date
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from app.core.deps import get_current_user
+from app.core.pagination import PageParams, page_params, paginate
+from app.db import get_session
+from app.reads import (
+    PROJECT_ORDER,
+    dashboard,
+    dashboard_since,
+    dashboard_totals_query,
+    hours_by_class_query,
+    hours_by_day_query,
+    project_list_query,
+    project_progress,
+    project_progress_query,
+)
+from app.rollups import drop_project_hours
+from app.models import (
+    Attendance,
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    User,
+)
+from app.schemas import PROJECT_LIST, Dashboard, ProjectProgress
+from app.versions import Collection, bump_versions, versioned
+
+router = APIRouter()
+
+
+class ProjectCreate(BaseModel):
+    title: str
+    status: ProjectStatus
+    start_date: date
+    end_date: date
+    class_id: UUID
+    description: str | None = None
+    school_tutor_name: str | None = None
+    provider_expert_name: str | None = None
+    total_hours: float | None = None
+
+
+class ProjectUpdate(BaseModel):
+    title: str | None = None
+    status: ProjectStatus | None = None
+    start_date: date | None = None
+    end_date: date | None = None
+    class_id: UUID | None = None
+    description: str | None = None
+    school_tutor_name: str | None = None
+    provider_expert_name: str | None = None
+    total_hours: float | None = None
+
+
+@router.post("/v1/projects", response_model=Project)
+def create_project(
+    payload: ProjectCreate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Project:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    if payload.total_hours is not None and payload.total_hours < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="total_hours must be >= 0",
+        )
+    classroom = session.exec(
+        select(ClassRoom).where(
+            ClassRoom.id == payload.class_id,
+            ClassRoom.school_id == current_user.school_id,
+        )
+    ).first()
+    if not classroom:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    project = Project(
+        school_id=current_user.school_id,
+        class_id=payload.class_id,
+        title=payload.title,
+        status=payload.status,
+        start_date=payload.start_date,
+        end_date=payload.end_date,
+        description=payload.description,
+        school_tutor_name=payload.school_tutor_name,
+        provider_expert_name=payload.provider_expert_name,
+        total_hours=payload.total_hours,
+    )
+    session.add(project)
+    session.commit()
+    session.refresh(project)
+    return project
+
+
+@router.get(
+    "/v1/projects",
+    response_model=list[Project],
+    dependencies=[Depends(versioned(Collection.projects))],
+)
+def list_projects(
+    response: Response,
+    status_filter: ProjectStatus | None = Query(default=None, alias="status"),
+    class_id: UUID | None = None,
+    start_from: date | None = None,
+    start_to: date | None = None,
+    title_prefix: str | None = None,
+    page: PageParams = Depends(page_params),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    query = project_list_query(
+        current_user.school_id,
+        status_filter,
+        class_id,
+        start_from,
+        start_to,
+        title_prefix,
+    )
+    return paginate(session, query, Project, PROJECT_ORDER, page, response, PROJECT_LIST)
+
+
+@router.get("/v1/projects/progress", response_model=list[ProjectProgress])
+def list_project_progress(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> list[ProjectProgress]:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    rows = session.exec(project_progress_query(current_user.school_id)).all()
+    return project_progress(rows)
+
+
+@router.get("/v1/dashboard", response_model=Dashboard)
+def get_dashboard(
+    days: int = Query(default=30, ge=1, le=366),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Dashboard:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    school_id = current_user.school_id
+    progress_rows = session.exec(project_progress_query(school_id)).all()
+    totals = session.exec(dashboard_totals_query(school_id)).one()
+    day_rows = session.exec(hours_by_day_query(school_id, dashboard_since(days))).all()
+    class_rows = session.exec(hours_by_class_query(school_id)).all()
+    return dashboard(progress_rows, totals, day_rows, class_rows)
+
+
+@router.get("/v1/projects/{project_id}", response_model=Project)
+def get_project(
+    project_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Project:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    project = session.exec(
+        select(Project).where(
+            Project.id == project_id, Project.school_id == current_user.school_id
+        )
+    ).first()
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    return project
+
+
+@router.patch("/v1/projects/{project_id}", response_model=Project)
+@router.patch("/v1/projects/{project_id}/", response_model=Project)
+def update_project(
+    project_id: UUID,
+    payload: ProjectUpdate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Project:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    project = session.exec(
+        select(Project).where(
+            Project.id == project_id, Project.school_id == current_user.school_id
+        )
+    ).first()
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    data = payload.model_dump(exclude_unset=True)
+    if "total_hours" in data and data["total_hours"] is not None:
+        if data["total_hours"] < 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="total_hours must be >= 0",
+            )
+    if "class_id" in data:
+        classroom = session.exec(
+            select(ClassRoom).where(
+                ClassRoom.id == data["class_id"],
+                ClassRoom.school_id == current_user.school_id,
+            )
+        ).first()
+        if not classroom:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    for key, value in data.items():
+        setattr(project, key, value)
+    session.commit()
+    session.refresh(project)
+    return project
+
+
+@router.delete("/v1/projects/{project_id}")
+def delete_project(
+    project_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    project = session.exec(
+        select(Project).where(
+            Project.id == project_id, Project.school_id == current_user.school_id
+        )
+    ).first()
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    session_ids = list(
+        session.exec(
+            select(ProjectSession.id).where(
+                ProjectSession.project_id == project_id,
+                ProjectSession.school_id == current_user.school_id,
+            )
+        ).all()
+    )
+    if session_ids:
+        session.exec(
+            delete(Attendance).where(
+                Attendance.session_id.in_(session_ids),
+                Attendance.school_id == current_user.school_id,
+            )
+        )
+    session.exec(
+        delete(ProjectSession).where(
+            ProjectSession.project_id == project_id,
+            ProjectSession.school_id == current_user.school_id,
+        )
+    )
+    drop_project_hours(session, current_user.school_id, project_id)
+    bump_versions(
+        session, current_user.school_id, Collection.sessions, Collection.attendance
+    )
+    session.delete(project)
+    session.commit()
+    return {"deleted": True}
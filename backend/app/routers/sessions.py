@@ -0,0 +1,446 @@
+from datetime import date, datetime, time, timedelta
+from uuid import UUID, uuid4
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel
+from sqlalchemy import delete, insert, update
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.deps import get_current_user
+from app.core.pagination import PageParams, page_params, paginate
+from app.db import get_session
+from app.reads import SESSION_ORDER, project_query, session_list_query
+from app.recurrence import (
+    RecurrenceError,
+    expand_occurrences,
+    find_overlaps,
+    move_occurrences,
+    series_query,
+    update_session_times,
+    zone,
+)
+from app.rollups import refresh_student_hours, session_student_ids, sessions_student_ids
+from app.models import (
+    Attendance,
+    Project,
+    Session as ProjectSession,
+    SessionStatus,
+    User,
+)
+from app.schemas import SESSION_LIST, RecurringSessionsResult, SeriesUpdateResult
+from app.versions import Collection, bump_versions, versioned
+
+router = APIRouter()
+
+
+class SessionCreate(BaseModel):
+    start: datetime
+    end: datetime
+    planned_hours: float
+    topic: str | None = None
+    status: SessionStatus | None = None
+
+
+class SessionUpdate(BaseModel):
+    start: datetime | None = None
+    end: datetime | None = None
+    planned_hours: float | None = None
+    topic: str | None = None
+    status: SessionStatus | None = None
+
+
+class RecurringSessionCreate(BaseModel):
+    weekdays: list[int]
+    start_time: time
+    end_time: time
+    start_date: date
+    end_date: date
+    exclude_dates: list[date] = []
+    timezone: str | None = None
+    planned_hours: float | None = None
+    topic: str | None = None
+    skip_conflicts: bool = False
+
+
+class SeriesUpdate(BaseModel):
+    shift_days: int = 0
+    start_time: time | None = None
+    end_time: time | None = None
+    planned_hours: float | None = None
+    topic: str | None = None
+    from_date: date | None = None
+    timezone: str | None = None
+
+
+@router.post("/v1/projects/{project_id}/sessions", response_model=ProjectSession)
+def create_session(
+    project_id: UUID,
+    payload: SessionCreate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ProjectSession:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    project = session.exec(
+        select(Project).where(
+            Project.id == project_id, Project.school_id == current_user.school_id
+        )
+    ).first()
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    if payload.end <= payload.start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="End must be after start"
+        )
+    if payload.planned_hours < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="planned_hours must be >= 0",
+        )
+    new_session = ProjectSession(
+        school_id=current_user.school_id,
+        project_id=project.id,
+        start=payload.start,
+        end=payload.end,
+        planned_hours=payload.planned_hours,
+        topic=payload.topic,
+        status=payload.status or SessionStatus.scheduled,
+    )
+    session.add(new_session)
+    session.commit()
+    session.refresh(new_session)
+    return new_session
+
+
+def _timezone_name(requested: str | None) -> str:
+    tz_name = requested or settings.school_timezone
+    try:
+        zone(tz_name)
+    except RecurrenceError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    return tz_name
+
+
+def _overlap_detail(occurrences: list[tuple[datetime, datetime]], tz_name: str) -> str:
+    tz = zone(tz_name)
+    days = sorted({start.astimezone(tz).date().isoformat() for start, _ in occurrences})
+    return f"Overlaps existing sessions: {', '.join(days)}"
+
+
+@router.post(
+    "/v1/projects/{project_id}/sessions/recurring",
+    response_model=RecurringSessionsResult,
+)
+def create_recurring_sessions(
+    project_id: UUID,
+    payload: RecurringSessionCreate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> RecurringSessionsResult:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    tz_name = _timezone_name(payload.timezone)
+    project = session.exec(project_query(current_user.school_id, project_id)).first()
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    if payload.planned_hours is not None and payload.planned_hours < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="planned_hours must be >= 0",
+        )
+    try:
+        occurrences = expand_occurrences(
+            payload.weekdays,
+            payload.start_time,
+            payload.end_time,
+            payload.start_date,
+            payload.end_date,
+            payload.exclude_dates,
+            tz_name,
+        )
+    except RecurrenceError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+    if not occurrences:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Recurrence has no sessions"
+        )
+
+    overlaps = find_overlaps(session, current_user.school_id, project_id, occurrences)
+    conflicting = [occurrences[index] for index in sorted(overlaps)]
+    if conflicting and not payload.skip_conflicts:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=_overlap_detail(conflicting, tz_name),
+        )
+
+    series_id = uuid4()
+    values = [
+        {
+            "id": uuid4(),
+            "school_id": current_user.school_id,
+            "project_id": project_id,
+            "series_id": series_id,
+            "start": start,
+            "end": end,
+            "planned_hours": (
+                payload.planned_hours
+                if payload.planned_hours is not None
+                else round((end - start).total_seconds() / 3600, 2)
+            ),
+            "topic": payload.topic,
+            "status": SessionStatus.scheduled,
+        }
+        for index, (start, end) in enumerate(occurrences)
+        if index not in overlaps
+    ]
+    if values:
+        session.exec(insert(ProjectSession).values(values))
+        bump_versions(session, current_user.school_id, Collection.sessions)
+    session.commit()
+    tz = zone(tz_name)
+    return RecurringSessionsResult(
+        series_id=series_id,
+        created=len(values),
+        skipped=[start.astimezone(tz).date() for start, _ in conflicting],
+    )
+
+
+@router.get(
+    "/v1/projects/{project_id}/sessions",
+    response_model=list[ProjectSession],
+    dependencies=[Depends(versioned(Collection.projects, Collection.sessions))],
+)
+def list_sessions(
+    project_id: UUID,
+    response: Response,
+    status_filter: SessionStatus | None = Query(default=None, alias="status"),
+    start_from: datetime | None = None,
+    start_to: datetime | None = None,
+    page: PageParams = Depends(page_params),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    project = session.exec(project_query(current_user.school_id, project_id)).first()
+    if not project:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    query = session_list_query(
+        current_user.school_id, project_id, status_filter, start_from, start_to
+    )
+    return paginate(
+        session, query, ProjectSession, SESSION_ORDER, page, response, SESSION_LIST
+    )
+
+
+@router.patch("/v1/sessions/{session_id}", response_model=ProjectSession)
+def update_session(
+    session_id: UUID,
+    payload: SessionUpdate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> ProjectSession:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    project_session = session.exec(
+        select(ProjectSession).where(
+            ProjectSession.id == session_id,
+            ProjectSession.school_id == current_user.school_id,
+        )
+    ).first()
+    if not project_session:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    data = payload.model_dump(exclude_unset=True)
+    next_start = data.get("start", project_session.start)
+    next_end = data.get("end", project_session.end)
+    if next_end <= next_start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="End must be after start"
+        )
+    if payload.planned_hours is not None and payload.planned_hours < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="planned_hours must be >= 0",
+        )
+
+    for key, value in data.items():
+        setattr(project_session, key, value)
+    if "end" in data:
+        session.flush()
+        refresh_student_hours(
+            session,
+            current_user.school_id,
+            session_student_ids(session, current_user.school_id, session_id),
+        )
+    session.commit()
+    session.refresh(project_session)
+    return project_session
+
+
+@router.delete("/v1/sessions/{session_id}")
+def delete_session(
+    session_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    project_session = session.exec(
+        select(ProjectSession).where(
+            ProjectSession.id == session_id,
+            ProjectSession.school_id == current_user.school_id,
+        )
+    ).first()
+    if not project_session:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    student_ids = session_student_ids(session, current_user.school_id, session_id)
+    session.exec(
+        delete(Attendance).where(
+            Attendance.session_id == session_id,
+            Attendance.school_id == current_user.school_id,
+        )
+    )
+    session.delete(project_session)
+    session.flush()
+    refresh_student_hours(session, current_user.school_id, student_ids)
+    bump_versions(session, current_user.school_id, Collection.attendance)
+    session.commit()
+    return {"deleted": True}
+
+
+@router.patch("/v1/sessions/series/{series_id}", response_model=SeriesUpdateResult)
+def update_session_series(
+    series_id: UUID,
+    payload: SeriesUpdate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> SeriesUpdateResult:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    if payload.planned_hours is not None and payload.planned_hours < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="planned_hours must be >= 0",
+        )
+    tz_name = _timezone_name(payload.timezone)
+    rows = session.exec(
+        series_query(current_user.school_id, series_id, payload.from_date, tz_name)
+    ).all()
+    if not rows:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    session_ids = [row.id for row in rows]
+
+    data = payload.model_dump(
+        exclude_unset=True, include={"planned_hours", "topic"}
+    )
+    if data:
+        session.exec(
+            update(ProjectSession)
+            .where(
+                ProjectSession.school_id == current_user.school_id,
+                ProjectSession.id.in_(session_ids),
+            )
+            .values(**data)
+        )
+        bump_versions(session, current_user.school_id, Collection.sessions)
+
+    if payload.shift_days or payload.start_time or payload.end_time:
+        try:
+            moved = move_occurrences(
+                [(row.id, row.start, row.end) for row in rows],
+                payload.start_time,
+                payload.end_time,
+                timedelta(days=payload.shift_days),
+                tz_name,
+            )
+        except RecurrenceError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+            ) from exc
+        occurrences = [(start, end) for _, start, end in moved]
+        overlaps = find_overlaps(
+            session,
+            current_user.school_id,
+            rows[0].project_id,
+            occurrences,
+            exclude_ids=session_ids,
+        )
+        if overlaps:
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail=_overlap_detail(
+                    [occurrences[index] for index in sorted(overlaps)], tz_name
+                ),
+            )
+        update_session_times(session, moved)
+        bump_versions(session, current_user.school_id, Collection.sessions)
+        refresh_student_hours(
+            session,
+            current_user.school_id,
+            sessions_student_ids(session, current_user.school_id, session_ids),
+        )
+    session.commit()
+    return SeriesUpdateResult(series_id=series_id, updated=len(session_ids))
+
+
+@router.delete("/v1/sessions/series/{series_id}")
+def cancel_session_series(
+    series_id: UUID,
+    from_date: date | None = None,
+    timezone_name: str | None = Query(default=None, alias="timezone"),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    tz_name = _timezone_name(timezone_name)
+    rows = session.exec(
+        series_query(current_user.school_id, series_id, from_date, tz_name)
+    ).all()
+    if not rows:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    session_ids = [row.id for row in rows]
+
+    student_ids = sessions_student_ids(session, current_user.school_id, session_ids)
+    session.exec(
+        delete(Attendance).where(
+            Attendance.school_id == current_user.school_id,
+            Attendance.session_id.in_(session_ids),
+        )
+    )
+    session.exec(
+        delete(ProjectSession).where(
+            ProjectSession.school_id == current_user.school_id,
+            ProjectSession.id.in_(session_ids),
+        )
+    )
+    refresh_student_hours(session, current_user.school_id, student_ids)
+    bump_versions(
+        session, current_user.school_id, Collection.sessions, Collection.attendance
+    )
+    session.commit()
+    return {"deleted": len(session_ids)}
@@ -0,0 +1,284 @@
+from uuid import UUID
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File as UploadFileField,
+    HTTPException,
+    Response,
+    UploadFile,
+    status,
+)
+from pydantic import BaseModel
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.core.deps import get_current_user
+from app.core.pagination import PageParams, page_params, paginate
+from app.db import get_session
+from app.imports import (
+    StudentImportFormatError,
+    detect_format,
+    import_students,
+    read_rows,
+)
+from app.reads import (
+    STUDENT_ORDER,
+    classroom_query,
+    student_list_query,
+    student_metrics,
+    student_metrics_query,
+    student_project_hours_query,
+    student_summary,
+    student_with_class_query,
+)
+from app.response_cache import (
+    STUDENT_METRICS_TAGS,
+    STUDENT_SUMMARY_TAGS,
+    get_cached,
+    response_key,
+    set_cached,
+)
+from app.rollups import drop_student_hours
+from app.models import Attendance, ClassRoom, Student, User
+from app.schemas import (
+    STUDENT_LIST,
+    StudentImportReport,
+    StudentMetric,
+    StudentSummary,
+)
+from app.versions import Collection, bump_versions, versioned
+
+router = APIRouter()
+
+
+class StudentCreate(BaseModel):
+    class_id: UUID
+    first_name: str
+    last_name: str
+    pcto_required_hours: int | None = None
+
+
+class StudentUpdate(BaseModel):
+    class_id: UUID | None = None
+    first_name: str | None = None
+    last_name: str | None = None
+    pcto_required_hours: int | None = None
+
+
+@router.post("/v1/students", response_model=Student)
+def create_student(
+    payload: StudentCreate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Student:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    classroom = session.exec(
+        select(ClassRoom).where(
+            ClassRoom.id == payload.class_id,
+            ClassRoom.school_id == current_user.school_id,
+        )
+    ).first()
+    if not classroom:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    if payload.pcto_required_hours is not None and payload.pcto_required_hours < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="pcto_required_hours must be >= 0",
+        )
+    student = Student(
+        school_id=current_user.school_id,
+        class_id=payload.class_id,
+        first_name=payload.first_name,
+        last_name=payload.last_name,
+        pcto_required_hours=payload.pcto_required_hours or 150,
+    )
+    session.add(student)
+    session.commit()
+    session.refresh(student)
+    return student
+
+
+@router.post("/v1/students/import", response_model=StudentImportReport)
+def import_students_file(
+    upload: UploadFile = UploadFileField(...),
+    dry_run: bool = False,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> StudentImportReport:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="User has no school"
+        )
+    try:
+        file_format = detect_format(upload.filename, upload.content_type)
+        return import_students(
+            session,
+            current_user.school_id,
+            read_rows(upload.file, file_format),
+            dry_run=dry_run,
+            chunk_size=settings.student_import_chunk_size,
+        )
+    except (StudentImportFormatError, UnicodeDecodeError) as exc:
+        session.rollback()
+        detail = str(exc) if isinstance(exc, StudentImportFormatError) else "Invalid encoding"
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail) from exc
+
+
+@router.get(
+    "/v1/students",
+    response_model=list[Student],
+    dependencies=[Depends(versioned(Collection.classes, Collection.students))],
+)
+def list_students(
+    response: Response,
+    class_id: UUID | None = None,
+    name_prefix: str | None = None,
+    page: PageParams = Depends(page_params),
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Response:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    if class_id:
+        classroom = session.exec(
+            classroom_query(current_user.school_id, class_id)
+        ).first()
+        if not classroom:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    query = student_list_query(current_user.school_id, class_id, name_prefix)
+    return paginate(session, query, Student, STUDENT_ORDER, page, response, STUDENT_LIST)
+
+
+@router.patch("/v1/students/{student_id}", response_model=Student)
+def update_student(
+    student_id: UUID,
+    payload: StudentUpdate,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> Student:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    student = session.exec(
+        select(Student).where(
+            Student.id == student_id,
+            Student.school_id == current_user.school_id,
+        )
+    ).first()
+    if not student:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    data = payload.model_dump(exclude_unset=True)
+    if "class_id" in data:
+        classroom = session.exec(
+            select(ClassRoom).where(
+                ClassRoom.id == data["class_id"],
+                ClassRoom.school_id == current_user.school_id,
+            )
+        ).first()
+        if not classroom:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    if "pcto_required_hours" in data and data["pcto_required_hours"] is not None:
+        if data["pcto_required_hours"] < 0:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="pcto_required_hours must be >= 0",
+            )
+
+    for key, value in data.items():
+        setattr(student, key, value)
+    session.commit()
+    session.refresh(student)
+    return student
+
+
+@router.delete("/v1/students/{student_id}")
+def delete_student(
+    student_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> dict:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    student = session.exec(
+        select(Student).where(
+            Student.id == student_id,
+            Student.school_id == current_user.school_id,
+        )
+    ).first()
+    if not student:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    session.exec(
+        delete(Attendance).where(
+            Attendance.student_id == student_id,
+            Attendance.school_id == current_user.school_id,
+        )
+    )
+    drop_student_hours(session, current_user.school_id, student_id)
+    bump_versions(session, current_user.school_id, Collection.attendance)
+    session.delete(student)
+    session.commit()
+    return {"deleted": True}
+
+
+@router.get("/v1/students/metrics", response_model=list[StudentMetric])
+def list_student_metrics(
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> list[StudentMetric]:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    key = response_key(current_user.school_id, STUDENT_METRICS_TAGS, "student_metrics")
+    cached = get_cached(key)
+    if cached is not None:
+        return cached
+    rows = session.exec(student_metrics_query(current_user.school_id)).all()
+    return set_cached(key, student_metrics(rows))
+
+
+@router.get("/v1/students/{student_id}/summary", response_model=StudentSummary)
+def get_student_summary(
+    student_id: UUID,
+    session: Session = Depends(get_session),
+    current_user: User = Depends(get_current_user),
+) -> StudentSummary:
+    if not current_user.school_id:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="User has no school",
+        )
+    key = response_key(
+        current_user.school_id, STUDENT_SUMMARY_TAGS, "student_summary", student_id
+    )
+    cached = get_cached(key)
+    if cached is not None:
+        return cached
+    row = session.exec(
+        student_with_class_query(current_user.school_id, student_id)
+    ).first()
+    if not row:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+    student, classroom = row
+
+    project_rows = session.exec(
+        student_project_hours_query(current_user.school_id, student_id)
+    ).all()
+    return set_cached(key, student_summary(student, classroom, project_rows))
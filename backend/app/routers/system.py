@@ -0,0 +1,109 @@
+from uuid import UUID
+
+from anyio import to_thread
+from fastapi import APIRouter, Depends, Response
+
+from app.core import deps
+from app.core.deps import require_metrics_access, require_platform_admin, require_school
+from app.core.hashing import queue_depth as password_hash_queue_depth
+from app.core.metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE, REGISTRY
+from app.db import get_pool_stats
+from app.models import User
+from app.response_cache import cache_stats
+
+router = APIRouter()
+
+
+@router.get("/health")
+def health() -> dict:
+    return {"status": "ok"}
+
+
+@router.get("/health/db-pool", dependencies=[Depends(require_platform_admin)])
+def health_db_pool() -> dict:
+    return get_pool_stats()
+
+
+def _cache_stats() -> dict[str, dict]:
+    return {"response": cache_stats(), "auth_user": deps.user_cache.stats()}
+
+
+@router.get("/health/cache", dependencies=[Depends(require_platform_admin)])
+def health_cache() -> dict:
+    return _cache_stats()
+
+
+POOL_STATES = {
+    "size": "size",
+    "checked_in": "checkedin",
+    "checked_out": "checkedout",
+    "overflow": "overflow",
+}
+
+
+def _pool_samples() -> dict:
+    stats = get_pool_stats()
+    return {(state,): stats.get(key) for state, key in POOL_STATES.items()}
+
+
+def _threadpool_samples() -> dict:
+    limiter = to_thread.current_default_thread_limiter()
+    return {
+        ("busy",): limiter.borrowed_tokens,
+        ("capacity",): limiter.total_tokens,
+        ("waiting",): limiter.statistics().tasks_waiting,
+    }
+
+
+REGISTRY.callback_gauge(
+    "db_pool_connections", "SQLAlchemy pool connections by state.", _pool_samples, ("state",)
+)
+REGISTRY.callback_gauge(
+    "threadpool_tokens",
+    "Worker threads used by sync handlers: busy, capacity and tasks waiting.",
+    _threadpool_samples,
+    ("state",),
+)
+REGISTRY.callback_counter(
+    "cache_requests_total",
+    "Cache lookups by cache and result (hit or miss), in this process.",
+    lambda: {
+        (cache, result): stats[key]
+        for cache, stats in _cache_stats().items()
+        for result, key in (("hit", "hits"), ("miss", "misses"))
+    },
+    ("cache", "result"),
+)
+REGISTRY.callback_counter(
+    "cache_evictions_total",
+    "Cache entries dropped for size or age, in this process.",
+    lambda: {(cache,): stats["evictions"] for cache, stats in _cache_stats().items()},
+    ("cache",),
+)
+REGISTRY.callback_gauge(
+    "cache_entries",
+    "Entries currently held by each cache.",
+    lambda: {(cache,): stats["entries"] for cache, stats in _cache_stats().items()},
+    ("cache",),
+)
+REGISTRY.callback_gauge(
+    "login_password_hash_queue_depth",
+    "Password verifications queued or running in the hash executor.",
+    lambda: {(): password_hash_queue_depth()},
+)
+
+
+@router.get(
+    "/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_access)]
+)
+async def metrics() -> Response:
+    # Async so the threadpool gauge is read on the event loop, not from a worker.
+    return Response(content=REGISTRY.render(), media_type=METRICS_CONTENT_TYPE)
+
+
+@router.get("/v1/schools/{school_id}/guarded")
+def guarded_route(
+    school_id: UUID,
+    _current_user: User = Depends(require_school),
+) -> dict:
+    return {"school_id": str(school_id)}
@@ -0,0 +1,122 @@
+from datetime import date, datetime
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.models import (
+    ApprovalRole,
+    AttendanceStatus,
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session,
+    Student,
+)
+
+
+class ApprovalResult(BaseModel):
+    role: ApprovalRole
+    approved: int
+    students: int
+
+
+class AttendanceRead(BaseModel):
+    student_id: UUID
+    status: AttendanceStatus
+    hours: float
+
+
+class StudentMetric(BaseModel):
+    student_id: UUID
+    completed_hours: float
+
+
+class StudentProjectSummary(BaseModel):
+    project_id: UUID
+    title: str
+    status: ProjectStatus
+    completed_hours: float
+    last_session_end: datetime | None
+
+
+class StudentSummary(BaseModel):
+    id: UUID
+    first_name: str
+    last_name: str
+    class_id: UUID
+    class_year: int
+    class_section: str
+    pcto_required_hours: int
+    completed_hours_total: float
+    by_project: list[StudentProjectSummary]
+
+
+ProgressLabel = Literal["Non iniziato", "In corso", "Completato"]
+ProgressBadgeVariant = Literal["draft", "active", "closed"]
+
+
+class ProjectProgress(BaseModel):
+    project_id: UUID
+    total_hours: float | None
+    session_count: int = 0
+    completed_hours: float
+    planned_done_hours: float
+    used_hours: float
+    progress_pct: int
+    label: ProgressLabel
+    badge_variant: ProgressBadgeVariant
+
+
+class DashboardDay(BaseModel):
+    date: date
+    hours: float
+
+
+class DashboardClassHours(BaseModel):
+    class_id: UUID
+    label: str
+    hours: float
+
+
+class Dashboard(BaseModel):
+    total_projects: int
+    total_sessions: int
+    total_hours: float
+    presence_pct: int
+    hours_by_day: list[DashboardDay]
+    hours_by_class: list[DashboardClassHours]
+    projects: list[ProjectProgress]
+
+
+class StudentImportError(BaseModel):
+    row: int
+    errors: list[str]
+
+
+class StudentImportReport(BaseModel):
+    dry_run: bool = False
+    total_rows: int = 0
+    imported: int = 0
+    created_classes: int = 0
+    errors: list[StudentImportError] = []
+
+
+class RecurringSessionsResult(BaseModel):
+    series_id: UUID
+    created: int
+    skipped: list[date]
+
+
+class SeriesUpdateResult(BaseModel):
+    series_id: UUID
+    updated: int
+
+
+# Built once at import; list handlers serialize already-validated rows with
+# these instead of letting response_model validate every row again.
+PROJECT_LIST = TypeAdapter(list[Project])
+CLASS_LIST = TypeAdapter(list[ClassRoom])
+STUDENT_LIST = TypeAdapter(list[Student])
+SESSION_LIST = TypeAdapter(list[Session])
+ATTENDANCE_READ_LIST = TypeAdapter(list[AttendanceRead])
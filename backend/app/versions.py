@@ -0,0 +1,204 @@
+from collections import defaultdict
+from collections.abc import Callable, Iterable, Sequence
+from enum import Enum
+from hashlib import blake2b
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy import Connection, event, insert as portable_insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.deps import get_current_user, get_current_user_async
+from app.core.responses import etag_matches
+from app.db import get_async_session, get_session
+from app.models import (
+    Attendance,
+    ClassRoom,
+    CollectionVersion,
+    Project,
+    SchoolBranding,
+    Session as ProjectSession,
+    Student,
+    User,
+)
+
+# Clients revalidate every time; an unchanged collection costs one small read.
+CACHE_CONTROL = "private, no-cache"
+
+collection_version = CollectionVersion.__table__
+
+_INSERT_BY_DIALECT = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+
+class Collection(str, Enum):
+    projects = "projects"
+    classes = "classes"
+    students = "students"
+    sessions = "sessions"
+    attendance = "attendance"
+    branding = "branding"
+
+
+MODEL_COLLECTIONS = {
+    Project: Collection.projects,
+    ClassRoom: Collection.classes,
+    Student: Collection.students,
+    ProjectSession: Collection.sessions,
+    Attendance: Collection.attendance,
+    SchoolBranding: Collection.branding,
+}
+
+# Collections bumped in a session's open transaction, by school.
+BUMPED_INFO_KEY = "bumped_collections"
+
+
+def _bump(conn: Connection, school_id: UUID, collections: Iterable[Collection]) -> None:
+    insert = _INSERT_BY_DIALECT.get(conn.dialect.name)
+    # Sorted so concurrent writers lock the counter rows in the same order.
+    ordered = sorted(set(collections))
+    if insert is None:
+        _bump_without_upsert(conn, school_id, ordered)
+        return
+    stmt = insert(collection_version).values(
+        [
+            {"school_id": school_id, "collection": collection.value, "version": 1}
+            for collection in ordered
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["school_id", "collection"],
+        set_={"version": collection_version.c.version + 1},
+    )
+    conn.execute(stmt)
+
+
+def _bump_without_upsert(
+    conn: Connection, school_id: UUID, collections: Sequence[Collection]
+) -> None:
+    for collection in collections:
+        result = conn.execute(
+            update(collection_version)
+            .where(
+                collection_version.c.school_id == school_id,
+                collection_version.c.collection == collection.value,
+            )
+            .values(version=collection_version.c.version + 1)
+        )
+        if result.rowcount == 0:
+            conn.execute(
+                portable_insert(collection_version).values(
+                    school_id=school_id, collection=collection.value, version=1
+                )
+            )
+
+
+def bump_versions(session: Session, school_id: UUID, *collections: Collection) -> None:
+    """Advance the school's counters for ``collections`` in the open transaction.
+
+    ORM changes are picked up on flush; call this after Core statements that
+    insert, update or delete rows a versioned read returns.
+    """
+    if collections:
+        _bump(session.connection(), school_id, collections)
+        _record(session, school_id, collections)
+
+
+def _record(session: Session, school_id: UUID, collections: Iterable[Collection]) -> None:
+    session.info.setdefault(BUMPED_INFO_KEY, defaultdict(set))[school_id].update(collections)
+
+
+def pop_bumped(session: Session) -> dict[UUID, set[Collection]]:
+    """Collections bumped since the last call, for hooks run after commit.
+
+    A rolled-back transaction leaves its entries behind, which at worst makes
+    the next commit's hooks do extra work.
+    """
+    return session.info.pop(BUMPED_INFO_KEY, {})
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_after_orm_flush(session: Session, _flush_context) -> None:
+    touched: dict[UUID, set[Collection]] = defaultdict(set)
+    changed = [
+        *session.new,
+        *session.deleted,
+        *(instance for instance in session.dirty if session.is_modified(instance)),
+    ]
+    for instance in changed:
+        collection = MODEL_COLLECTIONS.get(type(instance))
+        if collection is not None:
+            touched[instance.school_id].add(collection)
+    for school_id, collections in touched.items():
+        _bump(session.connection(), school_id, collections)
+        _record(session, school_id, collections)
+
+
+def versions_query(school_id: UUID, collections: Sequence[Collection]):
+    return select(collection_version.c.collection, collection_version.c.version).where(
+        collection_version.c.school_id == school_id,
+        collection_version.c.collection.in_([collection.value for collection in collections]),
+    )
+
+
+def collection_etag(
+    school_id: UUID, collections: Sequence[Collection], rows: Iterable[tuple[str, int]]
+) -> str:
+    versions = dict(rows)
+    state = ",".join(
+        f"{collection.value}={versions.get(collection.value, 0)}"
+        for collection in collections
+    )
+    digest = blake2b(f"{school_id}:{state}".encode(), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _conditional(request: Request, response: Response, etag: str) -> None:
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+
+
+def versioned(*collections: Collection) -> Callable[..., None]:
+    """Dependency tagging a read with the school's ``collections`` versions.
+
+    Sets a weak ETag, or answers 304 when ``If-None-Match`` already has it,
+    before the handler queries anything else. The versions are read first, so
+    a concurrent write can only make the tag older than the body, never newer.
+    """
+
+    def check(
+        request: Request,
+        response: Response,
+        session: Annotated[Session, Depends(get_session)],
+        current_user: Annotated[User, Depends(get_current_user)],
+    ) -> None:
+        school_id = current_user.school_id
+        if school_id:
+            rows = session.exec(versions_query(school_id, collections)).all()
+            _conditional(request, response, collection_etag(school_id, collections, rows))
+
+    return check
+
+
+def versioned_async(*collections: Collection) -> Callable[..., None]:
+    """``versioned`` for routes served from the async engine."""
+
+    async def check(
+        request: Request,
+        response: Response,
+        session: Annotated[AsyncSession, Depends(get_async_session)],
+        current_user: Annotated[User, Depends(get_current_user_async)],
+    ) -> None:
+        school_id = current_user.school_id
+        if school_id:
+            rows = (await session.exec(versions_query(school_id, collections))).all()
+            _conditional(request, response, collection_etag(school_id, collections, rows))
+
+    return check
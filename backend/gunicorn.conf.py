@@ -0,0 +1,15 @@
+# Pre-forking deployment: gunicorn -c gunicorn.conf.py app.main:app
+# (gunicorn and uvicorn workers are not in requirements.txt; install them to use this.)
+from app.preload import post_fork as reset_worker, preload
+
+preload_app = True
+worker_class = "uvicorn.workers.UvicornWorker"
+bind = "0.0.0.0:8000"
+
+
+def when_ready(server) -> None:
+    preload()
+
+
+def post_fork(server, worker) -> None:
+    reset_worker()
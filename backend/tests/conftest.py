@@ -1,33 +1,110 @@
-import importlib
 import os
+from contextlib import contextmanager
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import SQLModel
 
+# Savepoints opened by the per-test transaction, not by the code under test.
+HARNESS_STATEMENTS = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
 
-@pytest.fixture()
-def client(tmp_path, monkeypatch):
-    db_path = tmp_path / "test.db"
-    storage_path = tmp_path / "storage"
-    monkeypatch.setenv("DATABASE_URL", f"sqlite:///{db_path}")
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "file_db: run against a fresh SQLite file and the app's own engine "
+        "(pool, pragmas, worker threads) instead of the shared rolled-back database",
+    )
+
+
+def _test_settings(tmp_path, monkeypatch, database_url: str):
+    monkeypatch.setenv("DATABASE_URL", database_url)
     monkeypatch.setenv("JWT_SECRET", "test-secret")
     monkeypatch.setenv("JWT_ALGORITHM", "HS256")
     monkeypatch.setenv("JWT_EXPIRES_MINUTES", "60")
-    monkeypatch.setenv("STORAGE_DIR", str(storage_path))
+    monkeypatch.setenv("STORAGE_DIR", str(tmp_path / "storage"))
+    monkeypatch.setenv("EXPORT_EXECUTOR", "inline")
+    monkeypatch.setenv("PASSWORD_HASH_EXECUTOR", "inline")
+
+    from app.core.config import Settings
+
+    return Settings()
+
+
+@pytest.fixture(scope="session")
+def shared_engine():
+    from app.db import build_engine
+
+    engine = build_engine("sqlite://")
 
-    import app.core.config as config
-    import app.core.deps as deps
-    import app.core.security as security
-    import app.db as db
-    import app.main as main
+    # pysqlite manages transactions itself and mishandles SAVEPOINT; let
+    # SQLAlchemy emit BEGIN so the per-test outer transaction really holds.
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, _connection_record) -> None:
+        dbapi_connection.isolation_level = None
 
-    importlib.reload(config)
-    importlib.reload(db)
-    importlib.reload(deps)
-    importlib.reload(security)
-    importlib.reload(main)
+    @event.listens_for(engine, "begin")
+    def _begin(connection) -> None:
+        connection.exec_driver_sql("BEGIN")
+
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def client(request, tmp_path, monkeypatch):
+    from app.db import get_engine, pin_connection
+    from app.main import create_app
+
+    file_db = request.node.get_closest_marker("file_db") is not None
+    if file_db or os.environ.get("DB_ASYNC") == "true":
+        # The async engine cannot see another connection's in-memory database.
+        config = _test_settings(tmp_path, monkeypatch, f"sqlite:///{tmp_path / 'test.db'}")
+        app = create_app(config)
+        SQLModel.metadata.create_all(get_engine())
+        with TestClient(app) as client:
+            yield client
+        return
+
+    engine = request.getfixturevalue("shared_engine")
+    config = _test_settings(tmp_path, monkeypatch, "sqlite://")
+    connection = engine.connect()
+    transaction = connection.begin()
+    # Sessions opened on a connection inside a savepoint each take their own
+    # savepoint, so commits and rollbacks in the app stay within this test.
+    connection.begin_nested()
+    pin_connection(connection)
+    try:
+        with TestClient(create_app(config, engine=engine)) as client:
+            yield client
+    finally:
+        pin_connection(None)
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture()
+def assert_max_queries(client):
+    from app.core.config import settings
+    from app.core.instrumentation import capture_queries
+    from app.db import get_async_engine, get_engine
 
-    db.create_all()
+    @contextmanager
+    def check(limit: int):
+        engines = [get_engine()]
+        if settings.db_async:
+            engines.append(get_async_engine().sync_engine)
+        with capture_queries(*engines) as stats:
+            yield stats
+        statements = [
+            statement
+            for statement in stats.statements.elements()
+            if not statement.startswith(HARNESS_STATEMENTS)
+        ]
+        assert len(statements) <= limit, (
+            f"{len(statements)} queries, budget {limit}:\n" + "\n".join(statements)
+        )
 
-    with TestClient(main.app) as client:
-        yield client
+    return check
@@ -0,0 +1,202 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from app.db import get_bind
+from app.models import (
+    ApprovalEvent,
+    ApprovalRole,
+    Attendance,
+    AttendanceStatus,
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    Student,
+    StudentHours,
+)
+from app.rollups import rebuild_student_hours
+from tests.utils import create_school_with_admin
+
+
+def _login(client, email: str, password: str) -> str:
+    response = client.post(
+        "/v1/auth/login", json={"email": email, "password": password}
+    )
+    assert response.status_code == 200
+    return response.json()["access_token"]
+
+
+def _seed(session: Session, suffix: str, sessions: int = 3, students: int = 4):
+    school, admin = create_school_with_admin(session, suffix)
+    classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+    session.add(classroom)
+    session.flush()
+    project = Project(
+        school_id=school.id,
+        class_id=classroom.id,
+        title="Stage",
+        status=ProjectStatus.active,
+        start_date=date(2026, 2, 1),
+        end_date=date(2026, 3, 1),
+    )
+    session.add(project)
+    session.flush()
+    student_rows = [
+        Student(
+            school_id=school.id,
+            class_id=classroom.id,
+            first_name=f"Nome{index}",
+            last_name=f"Cognome{index}",
+        )
+        for index in range(students)
+    ]
+    session.add_all(student_rows)
+    start = datetime(2026, 2, 2, 9, 0, tzinfo=timezone.utc)
+    session_rows = [
+        ProjectSession(
+            school_id=school.id,
+            project_id=project.id,
+            start=start + timedelta(days=index),
+            end=start + timedelta(days=index, hours=3),
+            planned_hours=3.0,
+        )
+        for index in range(sessions)
+    ]
+    session.add_all(session_rows)
+    session.flush()
+    session.add_all(
+        Attendance(
+            school_id=school.id,
+            session_id=project_session.id,
+            student_id=student.id,
+            status=AttendanceStatus.present,
+            hours=3.0,
+        )
+        for project_session in session_rows
+        for student in student_rows
+    )
+    session.commit()
+    return (
+        admin,
+        project.id,
+        [row.id for row in session_rows],
+        [row.id for row in student_rows],
+    )
+
+
+def _rollups(project_id) -> dict:
+    with Session(get_bind()) as session:
+        rows = session.exec(
+            select(StudentHours).where(StudentHours.project_id == project_id)
+        ).all()
+        return {
+            row.student_id: (row.approved_provider_count, row.approved_school_count)
+            for row in rows
+        }
+
+
+def test_session_and_project_approval_counts_and_rollups(client):
+    with Session(get_bind()) as session:
+        admin, project_id, session_ids, student_ids = _seed(session, "A")
+        _, other_project, other_sessions, _ = _seed(session, "B")
+    token = _login(client, admin["email"], "admin123!")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    bind = get_bind()
+    updates: list[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE attendance"):
+            updates.append(statement)
+
+    event.listen(bind, "before_cursor_execute", count)
+    try:
+        by_session = client.post(
+            f"/v1/sessions/{session_ids[0]}/approve",
+            json={"role": "provider", "student_ids": [str(s) for s in student_ids[:2]]},
+            headers=headers,
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", count)
+    assert by_session.status_code == 200
+    assert by_session.json() == {"role": "provider", "approved": 2, "students": 2}
+    assert len(updates) == 1
+
+    by_project = client.post(
+        f"/v1/projects/{project_id}/approve", json={"role": "provider"}, headers=headers
+    )
+    assert by_project.json() == {"role": "provider", "approved": 10, "students": 4}
+
+    again = client.post(
+        f"/v1/projects/{project_id}/approve", json={"role": "provider"}, headers=headers
+    )
+    assert again.json()["approved"] == 0
+
+    school = client.post(
+        f"/v1/projects/{project_id}/approve", json={"role": "school"}, headers=headers
+    )
+    assert school.json() == {"role": "school", "approved": 12, "students": 4}
+
+    incremental = _rollups(project_id)
+    with Session(bind) as session:
+        rebuild_student_hours(session)
+        session.commit()
+    assert incremental == _rollups(project_id)
+    assert set(incremental.values()) == {(3, 3)}
+    assert set(_rollups(other_project).values()) == {(0, 0)}
+
+    with Session(bind) as session:
+        events = session.exec(
+            select(ApprovalEvent)
+            .where(ApprovalEvent.project_id == project_id)
+            .order_by(ApprovalEvent.created_at)
+        ).all()
+    assert [(e.role, e.approved_count) for e in events] == [
+        (ApprovalRole.provider, 2),
+        (ApprovalRole.provider, 10),
+        (ApprovalRole.provider, 0),
+        (ApprovalRole.school, 12),
+    ]
+    assert events[0].session_id == session_ids[0]
+    assert events[0].student_ids == sorted(str(s) for s in student_ids[:2])
+
+    cross_tenant = client.post(
+        f"/v1/sessions/{other_sessions[0]}/approve",
+        json={"role": "school"},
+        headers=headers,
+    )
+    assert cross_tenant.status_code == 404
+    invalid_role = client.post(
+        f"/v1/projects/{project_id}/approve", json={"role": "tutor"}, headers=headers
+    )
+    assert invalid_role.status_code == 422
+
+
+@pytest.mark.file_db
+def test_deleting_an_approved_project_keeps_its_approval_events(client):
+    engine = get_bind()
+
+    @event.listens_for(engine, "connect")
+    def _enforce_foreign_keys(dbapi_connection, _connection_record) -> None:
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    engine.dispose()
+    with Session(engine) as session:
+        admin, project_id, _, _ = _seed(session, "A", sessions=1, students=1)
+    token = _login(client, admin["email"], "admin123!")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    approved = client.post(
+        f"/v1/projects/{project_id}/approve", json={"role": "school"}, headers=headers
+    )
+    assert approved.status_code == 200
+    assert client.delete(f"/v1/projects/{project_id}", headers=headers).status_code == 200
+
+    with Session(engine) as session:
+        events = session.exec(
+            select(ApprovalEvent).where(ApprovalEvent.project_id == project_id)
+        ).all()
+    assert [row.approved_count for row in events] == [1]
@@ -0,0 +1,162 @@
+import inspect
+from datetime import date, datetime, timezone
+
+import pytest
+from fastapi.routing import APIRoute, iter_route_contexts
+from sqlmodel import Session
+
+from app.core.security import create_access_token
+from app.db import get_bind
+from app.models import (
+    Attendance,
+    AttendanceStatus,
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    Student,
+)
+from tests.utils import create_school_with_admin
+
+ASYNC_READS = {
+    "/v1/projects",
+    "/v1/classes",
+    "/v1/students",
+    "/v1/students/metrics",
+    "/v1/students/{student_id}/summary",
+    "/v1/projects/{project_id}/sessions",
+    "/v1/sessions/{session_id}/attendance",
+    "/v1/projects/progress",
+    "/v1/dashboard",
+}
+
+
+@pytest.fixture()
+def async_client(monkeypatch, request):
+    monkeypatch.setenv("DB_ASYNC", "true")
+    return request.getfixturevalue("client")
+
+
+def _endpoints(app) -> dict[tuple[str, str], object]:
+    return {
+        (route.path, method): route.endpoint
+        for route in iter_route_contexts(app.routes)
+        if isinstance(route.original_route, APIRoute)
+        for method in route.methods
+    }
+
+
+def test_read_routes_are_async_only_when_enabled(async_client):
+    endpoints = _endpoints(async_client.app)
+    for path in ASYNC_READS:
+        assert inspect.iscoroutinefunction(endpoints[(path, "GET")]), path
+    assert not inspect.iscoroutinefunction(endpoints[("/v1/projects", "POST")])
+    # Swapped in place, not added alongside the sync routes.
+    assert len(endpoints) == sum(
+        len(route.methods)
+        for route in iter_route_contexts(async_client.app.routes)
+        if isinstance(route.original_route, APIRoute)
+    )
+
+
+def test_sync_read_routes_by_default(client):
+    endpoints = _endpoints(client.app)
+    for path in ASYNC_READS:
+        assert not inspect.iscoroutinefunction(endpoints[(path, "GET")]), path
+
+
+def test_async_reads_paginate_and_summarise(async_client):
+    client = async_client
+    bind = get_bind()
+    with Session(bind) as session:
+        school, admin = create_school_with_admin(session, "A")
+        classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+        session.add(classroom)
+        session.flush()
+        students = [
+            Student(
+                school_id=school.id,
+                class_id=classroom.id,
+                first_name=f"Nome{index}",
+                last_name=f"Cognome{index}",
+            )
+            for index in range(3)
+        ]
+        project = Project(
+            school_id=school.id,
+            class_id=classroom.id,
+            title="PCTO",
+            status=ProjectStatus.active,
+            start_date=date(2026, 2, 1),
+            end_date=date(2026, 2, 28),
+        )
+        session.add_all([*students, project])
+        session.flush()
+        project_session = ProjectSession(
+            school_id=school.id,
+            project_id=project.id,
+            start=datetime(2026, 2, 3, 9, 0, tzinfo=timezone.utc),
+            end=datetime(2026, 2, 3, 12, 0, tzinfo=timezone.utc),
+            planned_hours=3.0,
+        )
+        session.add(project_session)
+        session.flush()
+        session.add(
+            Attendance(
+                school_id=school.id,
+                session_id=project_session.id,
+                student_id=students[0].id,
+                status=AttendanceStatus.present,
+                hours=3.0,
+            )
+        )
+        session.commit()
+        project_id = project.id
+        session_id = project_session.id
+        student_id = students[0].id
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = client.get(
+        "/v1/students", params={"limit": 2, "include_total": True}, headers=headers
+    )
+    assert first.status_code == 200
+    assert first.headers["X-Total-Count"] == "3"
+    second = client.get(
+        "/v1/students",
+        params={"limit": 2, "cursor": first.headers["X-Next-Cursor"]},
+        headers=headers,
+    )
+    names = [row["last_name"] for row in first.json() + second.json()]
+    assert names == ["Cognome0", "Cognome1", "Cognome2"]
+    assert "X-Next-Cursor" not in second.headers
+
+    projected = client.get("/v1/projects", params={"fields": "id,title"}, headers=headers)
+    assert projected.json() == [{"id": str(project_id), "title": "PCTO"}]
+
+    sessions = client.get(f"/v1/projects/{project_id}/sessions", headers=headers)
+    assert [row["id"] for row in sessions.json()] == [str(session_id)]
+
+    attendance = client.get(f"/v1/sessions/{session_id}/attendance", headers=headers)
+    assert attendance.json() == [
+        {"student_id": str(student_id), "status": "present", "hours": 3.0}
+    ]
+
+    metrics = {
+        row["student_id"]: row["completed_hours"]
+        for row in client.get("/v1/students/metrics", headers=headers).json()
+    }
+    assert metrics[str(student_id)] == 3.0
+
+    summary = client.get(f"/v1/students/{student_id}/summary", headers=headers).json()
+    assert summary["completed_hours_total"] == 3.0
+    assert summary["by_project"][0]["title"] == "PCTO"
+
+    stale_token = client.get(
+        f"/v1/projects/{project_id}/sessions",
+        headers={
+            "Authorization": "Bearer "
+            + create_access_token(admin["id"], admin["role"], admin["school_id"], 1)
+        },
+    )
+    assert stale_token.status_code == 401
@@ -0,0 +1,162 @@
+from datetime import date, datetime, timezone
+
+from sqlmodel import Session, select
+
+from app.core.security import create_access_token
+from app.db import get_bind
+from app.models import (
+    Attendance,
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    Student,
+)
+from tests.utils import create_school_with_admin
+
+
+def _seed(session):
+    school, admin = create_school_with_admin(session, "A")
+    classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+    session.add(classroom)
+    session.flush()
+    students = [
+        Student(
+            school_id=school.id,
+            class_id=classroom.id,
+            first_name=f"Nome{index}",
+            last_name="Rossi",
+        )
+        for index in range(3)
+    ]
+    project = Project(
+        school_id=school.id,
+        class_id=classroom.id,
+        title="PCTO",
+        status=ProjectStatus.active,
+        start_date=date(2026, 2, 1),
+        end_date=date(2026, 2, 28),
+    )
+    session.add_all([*students, project])
+    session.flush()
+    project_sessions = [
+        ProjectSession(
+            school_id=school.id,
+            project_id=project.id,
+            start=datetime(2026, 2, day, 9, 0, tzinfo=timezone.utc),
+            end=datetime(2026, 2, day, 12, 0, tzinfo=timezone.utc),
+            planned_hours=3.0,
+        )
+        for day in (3, 4)
+    ]
+    session.add_all(project_sessions)
+    session.commit()
+    return (
+        admin,
+        [str(student.id) for student in students],
+        [str(item.id) for item in project_sessions],
+    )
+
+
+def test_bulk_attendance_upserts_many_sessions_in_one_statement(client, assert_max_queries):
+    bind = get_bind()
+    with Session(bind) as session:
+        admin, student_ids, session_ids = _seed(session)
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    first = client.post(
+        f"/v1/sessions/{session_ids[0]}/attendance",
+        json=[{"student_id": student_ids[0], "status": "absent", "hours": 0.0}],
+        headers=headers,
+    )
+    assert first.status_code == 200
+
+    # Plus the attendance version bump.
+    with assert_max_queries(6) as stats:
+        response = client.post(
+            "/v1/attendance/bulk",
+            json={
+                "items": [
+                    {
+                        "session_id": session_id,
+                        "student_id": student_id,
+                        "status": "present",
+                        "hours": 3.0,
+                    }
+                    for session_id in session_ids
+                    for student_id in student_ids
+                ]
+            },
+            headers=headers,
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {"updated": 6}
+    inserts = [s for s in stats.statements if s.startswith("INSERT INTO attendance")]
+    assert [stats.statements[s] for s in inserts] == [1]
+
+    with Session(bind) as session:
+        rows = session.exec(select(Attendance)).all()
+    assert len(rows) == 6
+    assert {row.hours for row in rows} == {3.0}
+
+
+def test_bulk_attendance_rejects_foreign_sessions(client):
+    bind = get_bind()
+    with Session(bind) as session:
+        _, student_ids, session_ids = _seed(session)
+        _, other_admin = create_school_with_admin(session, "B")
+    token = create_access_token(
+        other_admin["id"], other_admin["role"], other_admin["school_id"]
+    )
+
+    response = client.post(
+        "/v1/attendance/bulk",
+        json={
+            "items": [
+                {
+                    "session_id": session_ids[0],
+                    "student_id": student_ids[0],
+                    "status": "present",
+                    "hours": 3.0,
+                }
+            ]
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 404
+
+
+def test_bulk_attendance_falls_back_without_on_conflict(client, monkeypatch):
+    import app.attendance
+
+    monkeypatch.setattr(app.attendance, "_INSERT_BY_DIALECT", {})
+    with Session(get_bind()) as session:
+        admin, student_ids, session_ids = _seed(session)
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def post(status: str, hours: float, students: list[str]):
+        return client.post(
+            "/v1/attendance/bulk",
+            json={
+                "items": [
+                    {
+                        "session_id": session_ids[0],
+                        "student_id": student_id,
+                        "status": status,
+                        "hours": hours,
+                    }
+                    for student_id in students
+                ]
+            },
+            headers=headers,
+        )
+
+    assert post("absent", 0.0, student_ids[:1]).json() == {"updated": 1}
+    assert post("present", 3.0, student_ids).json() == {"updated": 3}
+
+    with Session(get_bind()) as session:
+        rows = session.exec(select(Attendance.status, Attendance.hours)).all()
+    assert sorted(rows) == [("present", 3.0)] * 3
@@ -0,0 +1,71 @@
+import importlib.util
+from pathlib import Path
+from uuid import uuid4
+
+import sqlalchemy as sa
+
+
+def _load_migration():
+    path = (
+        Path(__file__).resolve().parents[1]
+        / "alembic"
+        / "versions"
+        / "0010_tenant_composite_indexes.py"
+    )
+    spec = importlib.util.spec_from_file_location("migration_0010_indexes", path)
+    module = importlib.util.module_from_spec(spec)
+    assert spec and spec.loader
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_dedup_attendance_keeps_the_most_signed_off_row():
+    engine = sa.create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text(
+                "CREATE TABLE attendance (id TEXT PRIMARY KEY, school_id TEXT, "
+                "session_id TEXT, student_id TEXT, hours FLOAT, "
+                "approved_by_provider BOOLEAN, approved_by_school BOOLEAN)"
+            )
+        )
+        school_id = str(uuid4())
+        session_id = str(uuid4())
+        student_a = str(uuid4())
+        student_b = str(uuid4())
+        # (student, hours, approved by provider, approved by school)
+        rows = [
+            (student_a, 3.0, True, False),
+            (student_a, 2.0, True, True),
+            (student_a, 4.0, False, False),
+            (student_b, 1.0, False, False),
+            (student_b, 2.0, False, False),
+        ]
+        conn.execute(
+            sa.text(
+                "INSERT INTO attendance (id, school_id, session_id, student_id, hours, "
+                "approved_by_provider, approved_by_school) VALUES (:id, :school_id, "
+                ":session_id, :student_id, :hours, :provider, :school)"
+            ),
+            [
+                {
+                    "id": str(uuid4()),
+                    "school_id": school_id,
+                    "session_id": session_id,
+                    "student_id": student_id,
+                    "hours": hours,
+                    "provider": provider,
+                    "school": school,
+                }
+                for student_id, hours, provider, school in rows
+            ],
+        )
+
+        migration = _load_migration()
+        migration._dedup_attendance(conn)
+
+        results = conn.execute(
+            sa.text("SELECT student_id, hours FROM attendance")
+        ).fetchall()
+
+    assert sorted(results) == sorted([(student_a, 2.0), (student_b, 2.0)])
@@ -2,7 +2,7 @@ from datetime import date, datetime, timezone
 
 from sqlmodel import Session as DbSession
 
-from app.db import get_engine
+from app.db import get_bind
 from app.models import (
     Attendance,
     AttendanceStatus,
@@ -15,10 +15,10 @@ from app.models import (
 from tests.utils import create_school_with_admin
 
 
-def test_get_session_attendance_tenant_scoped(client):
+def test_get_session_attendance_tenant_scoped(client, assert_max_queries):
     from app.core.security import create_access_token
-    engine = get_engine()
-    with DbSession(engine) as session:
+    bind = get_bind()
+    with DbSession(bind) as session:
         school_a, admin_a = create_school_with_admin(session, "A")
         school_b, admin_b = create_school_with_admin(session, "B")
 
@@ -89,10 +89,12 @@ def test_get_session_attendance_tenant_scoped(client):
         attendance_1_student_id = attendance_1.student_id
         attendance_2_student_id = attendance_2.student_id
 
-    response = client.get(
-        f"/v1/sessions/{session_id}/attendance",
-        headers={"Authorization": f"Bearer {token_a}"},
-    )
+    # User, collection versions, session, attendance.
+    with assert_max_queries(4):
+        response = client.get(
+            f"/v1/sessions/{session_id}/attendance",
+            headers={"Authorization": f"Bearer {token_a}"},
+        )
     assert response.status_code == 200
     body = sorted(response.json(), key=lambda row: row["student_id"])
     assert body == sorted(
@@ -0,0 +1,87 @@
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from app.core.security import create_access_token
+from app.db import get_bind
+from app.models import User
+from tests.utils import create_school_with_admin
+
+
+def _user_selects(bind):
+    statements: list[str] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if 'FROM "user"' in statement or "FROM user" in statement:
+            statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", _before_cursor_execute)
+    return statements, _before_cursor_execute
+
+
+def test_user_lookup_is_cached_between_requests(client):
+    bind = get_bind()
+    with Session(bind) as session:
+        _, admin = create_school_with_admin(session, "A")
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    statements, listener = _user_selects(bind)
+    try:
+        for _ in range(3):
+            assert client.get("/v1/classes", headers=headers).status_code == 200
+    finally:
+        event.remove(bind, "before_cursor_execute", listener)
+    assert len(statements) == 1
+
+
+def test_revoked_and_inactive_tokens_are_rejected(client):
+    from app.core.deps import revoke_user_tokens
+
+    bind = get_bind()
+    with Session(bind) as session:
+        _, admin = create_school_with_admin(session, "A")
+    old_token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    old_headers = {"Authorization": f"Bearer {old_token}"}
+    assert client.get("/v1/classes", headers=old_headers).status_code == 200
+
+    with Session(bind) as session:
+        user = session.exec(select(User).where(User.id == admin["id"])).one()
+        revoke_user_tokens(session, user)
+        token_version = user.token_version
+
+    assert client.get("/v1/classes", headers=old_headers).status_code == 401
+
+    login = client.post(
+        "/v1/auth/login", json={"email": admin["email"], "password": "admin123!"}
+    )
+    assert login.status_code == 200
+    new_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    assert client.get("/v1/classes", headers=new_headers).status_code == 200
+
+    with Session(bind) as session:
+        user = session.exec(select(User).where(User.id == admin["id"])).one()
+        user.is_active = False
+        revoke_user_tokens(session, user)
+    assert token_version < user.token_version
+
+    assert client.get("/v1/classes", headers=new_headers).status_code == 401
+    login = client.post(
+        "/v1/auth/login", json={"email": admin["email"], "password": "admin123!"}
+    )
+    assert login.status_code == 401
+
+
+def test_committed_user_changes_drop_the_cached_user(client):
+    bind = get_bind()
+    with Session(bind) as session:
+        _, admin = create_school_with_admin(session, "A")
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/v1/classes", headers=headers).status_code == 200
+
+    with Session(bind) as session:
+        user = session.exec(select(User).where(User.id == admin["id"])).one()
+        user.is_active = False
+        session.commit()
+
+    assert client.get("/v1/classes", headers=headers).status_code == 401
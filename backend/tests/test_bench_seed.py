@@ -0,0 +1,35 @@
+from sqlmodel import Session, select
+
+from app.bench.seed import admin_email, seed
+from app.db import build_engine
+from app.models import Attendance, School, StudentHours, User
+
+
+def _snapshot(engine) -> tuple:
+    with Session(engine) as session:
+        schools = session.exec(select(School.id).order_by(School.id)).all()
+        attendance = session.exec(
+            select(Attendance.id, Attendance.status).order_by(Attendance.id)
+        ).all()
+        rollups = session.exec(select(StudentHours)).all()
+    return schools, attendance, len(rollups)
+
+
+def test_seed_is_deterministic_and_resumable(tmp_path):
+    small = build_engine(f"sqlite:///{tmp_path / 'small.db'}")
+    large = build_engine(f"sqlite:///{tmp_path / 'large.db'}")
+    sizes = {"students_per_school": 30, "sessions_per_project": 8, "class_size": 10}
+
+    first = seed(small, 2, **sizes)
+    assert first["rows"]["student"] == 60
+    assert first["rows"]["session"] == 2 * 3 * 8
+    assert seed(small, 3, **sizes)["skipped_schools"] == 2
+    seed(large, 3, **sizes)
+
+    schools, attendance, rollups = _snapshot(small)
+    assert (schools, attendance, rollups) == _snapshot(large)
+    assert rollups == 90
+    with Session(small) as session:
+        assert session.exec(select(User).where(User.email == admin_email(2))).one()
+    small.dispose()
+    large.dispose()
@@ -2,7 +2,7 @@ from pathlib import Path
 import os
 
 from sqlmodel import Session
-from app.db import get_engine
+from app.db import get_bind
 from tests.utils import create_school_with_admin
 
 
@@ -22,8 +22,8 @@ def _login(client, email: str, password: str) -> str:
 
 
 def test_branding_logo_export_and_cross_tenant_download(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         school_a, admin_a = create_school_with_admin(session, "A")
         school_b, admin_b = create_school_with_admin(session, "B")
 
@@ -54,9 +54,17 @@ def test_branding_logo_export_and_cross_tenant_download(client):
         "/v1/exports/school-header",
         headers={"Authorization": f"Bearer {token_a}"},
     )
-    assert export_response.status_code == 200
+    assert export_response.status_code == 202
     export_id = export_response.json()["export_id"]
 
+    status_response = client.get(
+        f"/v1/exports/{export_id}",
+        headers={"Authorization": f"Bearer {token_a}"},
+    )
+    assert status_response.status_code == 200
+    assert status_response.json()["status"] == "done"
+    assert status_response.json()["progress"] == 100
+
     download_b = client.get(
         f"/v1/exports/{export_id}/download",
         headers={"Authorization": f"Bearer {token_b}"},
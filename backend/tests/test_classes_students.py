@@ -1,6 +1,6 @@
 from sqlmodel import Session
 
-from app.db import get_engine
+from app.db import get_bind
 from tests.utils import create_school_with_admin
 from app.models import ClassRoom, Student
 
@@ -14,8 +14,8 @@ def _login(client, email: str, password: str) -> str:
 
 
 def test_classes_students_tenant_scoped(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         school_a, admin_a = create_school_with_admin(session, "A")
         school_b, admin_b = create_school_with_admin(session, "B")
 
@@ -77,8 +77,8 @@ def test_classes_students_tenant_scoped(client):
 
 
 def test_class_duplicate_create_and_patch(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         _, admin = create_school_with_admin(session, "A")
 
     token = _login(client, admin["email"], "admin123!")
@@ -122,8 +122,8 @@ def test_class_duplicate_create_and_patch(client):
 
 
 def test_class_delete_with_students_and_cross_tenant(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         school_a, admin_a = create_school_with_admin(session, "A")
         school_b, admin_b = create_school_with_admin(session, "B")
 
@@ -0,0 +1,99 @@
+import gzip
+import zlib
+from uuid import UUID
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+from sqlmodel import Session
+
+from app.core.compression import CompressionMiddleware, negotiate_encoding, sidecar_path
+from app.core.security import create_access_token
+from app.db import get_bind
+from app.models import Export
+from tests.utils import create_school_with_admin
+
+ROWS = [{"id": index, "name": f"Studente {index}"} for index in range(200)]
+
+
+def _client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    def large() -> JSONResponse:
+        return JSONResponse(ROWS)
+
+    @app.get("/small")
+    def small() -> JSONResponse:
+        return JSONResponse({"ok": True})
+
+    @app.get("/image")
+    def image() -> Response:
+        return Response(b"\x89PNG" * 1000, media_type="image/png")
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse(
+            (f"riga {index}\n".encode() for index in range(2000)), media_type="text/csv"
+        )
+
+    return TestClient(app)
+
+
+def test_negotiate_encoding_honours_weights():
+    assert negotiate_encoding("gzip, br", ("br", "gzip")) == "br"
+    assert negotiate_encoding("br;q=0, gzip;q=0.5", ("br", "gzip")) == "gzip"
+    assert negotiate_encoding("*", ("gzip",)) == "gzip"
+    assert negotiate_encoding("identity", ("gzip",)) is None
+    assert negotiate_encoding(None, ("gzip",)) is None
+
+
+def test_compresses_large_allowed_bodies_only():
+    client = _client()
+    headers = {"Accept-Encoding": "gzip"}
+
+    large = client.get("/large", headers=headers)
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert large.headers["Vary"] == "Accept-Encoding"
+    assert large.json() == ROWS
+    assert int(large.headers["Content-Length"]) < len(large.content)
+
+    assert "Content-Encoding" not in client.get("/small", headers=headers).headers
+    assert "Content-Encoding" not in client.get("/image", headers=headers).headers
+    plain = client.get("/large", headers={"Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+    assert plain.json() == ROWS
+
+
+def test_streamed_bodies_are_compressed_chunk_by_chunk():
+    client = _client()
+    with client.stream("GET", "/stream", headers={"Accept-Encoding": "gzip"}) as response:
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        raw = b"".join(response.iter_raw())
+    expected = "".join(f"riga {index}\n" for index in range(2000)).encode()
+    assert zlib.decompress(raw, 16 + zlib.MAX_WBITS) == expected
+
+
+def test_export_download_uses_the_precompressed_sidecar(client):
+    with Session(get_bind()) as session:
+        _, admin = create_school_with_admin(session, "A")
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    export_id = client.post("/v1/exports/school-header", headers=headers).json()["export_id"]
+    with Session(get_bind()) as session:
+        file_path = session.get(Export, UUID(export_id)).file_path
+    sidecar = sidecar_path(file_path, "gzip")
+    assert gzip.decompress(sidecar.read_bytes()) == open(file_path, "rb").read()
+
+    path = f"/v1/exports/{export_id}/download"
+    zipped = client.get(path, headers={**headers, "Accept-Encoding": "gzip"})
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert int(zipped.headers["Content-Length"]) == sidecar.stat().st_size
+    assert zipped.content.startswith(b"%PDF")
+
+    plain = client.get(path, headers={**headers, "Accept-Encoding": "identity"})
+    assert "Content-Encoding" not in plain.headers
+    assert plain.content == zipped.content
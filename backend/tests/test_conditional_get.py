@@ -0,0 +1,145 @@
+from datetime import date, datetime, timezone
+
+from sqlmodel import Session
+
+from app.core.security import create_access_token
+from app.db import get_bind
+from app.models import (
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    Student,
+)
+from tests.utils import create_school_with_admin
+
+
+def _seed(session, suffix: str):
+    school, admin = create_school_with_admin(session, suffix)
+    classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+    session.add(classroom)
+    session.flush()
+    student = Student(
+        school_id=school.id, class_id=classroom.id, first_name="Anna", last_name="Rossi"
+    )
+    project = Project(
+        school_id=school.id,
+        class_id=classroom.id,
+        title="PCTO",
+        status=ProjectStatus.active,
+        start_date=date(2026, 2, 1),
+        end_date=date(2026, 2, 28),
+    )
+    session.add_all([student, project])
+    session.flush()
+    project_session = ProjectSession(
+        school_id=school.id,
+        project_id=project.id,
+        start=datetime(2026, 2, 3, 9, 0, tzinfo=timezone.utc),
+        end=datetime(2026, 2, 3, 12, 0, tzinfo=timezone.utc),
+        planned_hours=3.0,
+    )
+    session.add(project_session)
+    session.commit()
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    return (
+        {"Authorization": f"Bearer {token}"},
+        str(classroom.id),
+        str(student.id),
+        str(project_session.id),
+    )
+
+
+def test_unchanged_list_answers_304_without_reading_the_table(client, assert_max_queries):
+    with Session(get_bind()) as session:
+        headers, *_ = _seed(session, "A")
+
+    first = client.get("/v1/projects", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+
+    with assert_max_queries(2) as stats:
+        cached = client.get("/v1/projects", headers={**headers, "If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+    assert not any("FROM project" in statement for statement in stats.statements)
+
+    # Strong and listed forms of the same tag match too.
+    listed = client.get(
+        "/v1/projects",
+        headers={**headers, "If-None-Match": f'"other", {etag.removeprefix("W/")}'},
+    )
+    assert listed.status_code == 304
+
+
+def test_writes_change_only_the_collections_they_touch(client):
+    with Session(get_bind()) as session:
+        headers, class_id, student_id, session_id = _seed(session, "A")
+
+    def etag(path: str) -> str:
+        response = client.get(path, headers=headers)
+        assert response.status_code == 200
+        return response.headers["ETag"]
+
+    attendance_path = f"/v1/sessions/{session_id}/attendance"
+    before = {path: etag(path) for path in ("/v1/classes", "/v1/projects", attendance_path)}
+
+    # Bulk upserts bypass the ORM, so the handler bumps the counter itself.
+    response = client.post(
+        "/v1/attendance/bulk",
+        json={
+            "items": [
+                {
+                    "session_id": session_id,
+                    "student_id": student_id,
+                    "status": "present",
+                    "hours": 3.0,
+                }
+            ]
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    stale = client.get(
+        attendance_path, headers={**headers, "If-None-Match": before[attendance_path]}
+    )
+    assert stale.status_code == 200
+    assert stale.json()[0]["status"] == "present"
+    assert etag("/v1/classes") == before["/v1/classes"]
+    assert etag("/v1/projects") == before["/v1/projects"]
+
+    response = client.patch(f"/v1/classes/{class_id}", json={"section": "B"}, headers=headers)
+    assert response.status_code == 200
+    assert etag("/v1/classes") != before["/v1/classes"]
+    assert etag("/v1/projects") == before["/v1/projects"]
+
+
+def test_etags_differ_between_schools(client):
+    with Session(get_bind()) as session:
+        headers_a, *_ = _seed(session, "A")
+        headers_b, *_ = _seed(session, "B")
+
+    etag_a = client.get("/v1/classes", headers=headers_a).headers["ETag"]
+    response = client.get("/v1/classes", headers={**headers_b, "If-None-Match": etag_a})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag_a
+
+
+def test_versions_bump_without_upsert_support(client, monkeypatch):
+    import app.versions
+
+    monkeypatch.setattr(app.versions, "_INSERT_BY_DIALECT", {})
+    with Session(get_bind()) as session:
+        headers, class_id, _, _ = _seed(session, "A")
+
+    tags = [client.get("/v1/classes", headers=headers).headers["ETag"]]
+    for section in ("B", "C"):
+        response = client.patch(
+            f"/v1/classes/{class_id}", json={"section": section}, headers=headers
+        )
+        assert response.status_code == 200
+        tags.append(client.get("/v1/classes", headers=headers).headers["ETag"])
+    assert len(set(tags)) == 3
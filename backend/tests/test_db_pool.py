@@ -0,0 +1,57 @@
+import pytest
+from sqlmodel import Session
+
+from app.core.security import create_access_token, hash_password
+from app.db import get_engine
+from app.models import User, UserRole
+from tests.utils import create_school_with_admin
+
+pytestmark = pytest.mark.file_db
+
+
+def _platform_admin_headers() -> dict:
+    with Session(get_engine()) as session:
+        user = User(
+            role=UserRole.platform_admin,
+            email="platform@demo.it",
+            password_hash=hash_password("admin123!"),
+        )
+        session.add(user)
+        session.commit()
+        token = create_access_token(user.id, user.role, None)
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_engine_is_shared_across_requests(client):
+    engine = get_engine()
+    assert get_engine() is engine
+    headers = _platform_admin_headers()
+
+    first = client.get("/health/db-pool", headers=headers)
+    second = client.get("/health/db-pool", headers=headers)
+    assert first.status_code == 200
+    assert second.status_code == 200
+    assert get_engine() is engine
+
+    body = second.json()
+    assert body["pool_class"] == "QueuePool"
+    assert body["checkedout"] == 0
+    assert body["size"] >= 1
+
+
+def test_pool_stats_are_for_platform_admins_only(client):
+    assert client.get("/health/db-pool").status_code == 401
+    with Session(get_engine()) as session:
+        _, admin = create_school_with_admin(session, "A")
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    response = client.get("/health/db-pool", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 403
+
+
+def test_sqlite_pragmas_applied(client):
+    engine = get_engine()
+    with engine.connect() as conn:
+        journal_mode = conn.exec_driver_sql("PRAGMA journal_mode").scalar()
+        busy_timeout = conn.exec_driver_sql("PRAGMA busy_timeout").scalar()
+    assert journal_mode == "wal"
+    assert busy_timeout == 5000
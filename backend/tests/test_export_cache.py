@@ -0,0 +1,131 @@
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from uuid import UUID
+
+from sqlmodel import Session, select
+
+from app.db import get_bind
+from app.models import (
+    ClassRoom,
+    Export,
+    ExportStatus,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    Student,
+)
+from tests.utils import create_school_with_admin
+
+
+def _login(client, email: str, password: str) -> str:
+    response = client.post(
+        "/v1/auth/login", json={"email": email, "password": password}
+    )
+    assert response.status_code == 200
+    return response.json()["access_token"]
+
+
+def _export(client, project_id, headers) -> str:
+    response = client.post(
+        f"/v1/exports/projects/{project_id}/attendance-register", headers=headers
+    )
+    assert response.status_code == 202
+    assert response.json()["status"] == "done"
+    return response.json()["export_id"]
+
+
+def test_register_export_is_reused_until_inputs_change(client):
+    bind = get_bind()
+    with Session(bind) as session:
+        school, admin = create_school_with_admin(session, "A")
+        classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+        session.add(classroom)
+        session.flush()
+        student = Student(
+            school_id=school.id, class_id=classroom.id, first_name="Luca", last_name="Rossi"
+        )
+        project = Project(
+            school_id=school.id,
+            class_id=classroom.id,
+            title="PCTO",
+            status=ProjectStatus.active,
+            start_date=date(2026, 2, 1),
+            end_date=date(2026, 2, 28),
+        )
+        session.add_all([student, project])
+        session.flush()
+        project_session = ProjectSession(
+            school_id=school.id,
+            project_id=project.id,
+            start=datetime(2026, 2, 3, 9, 0, tzinfo=timezone.utc),
+            end=datetime(2026, 2, 3, 12, 0, tzinfo=timezone.utc),
+            planned_hours=3.0,
+        )
+        session.add(project_session)
+        session.commit()
+        project_id = project.id
+        student_id = student.id
+        session_id = project_session.id
+
+    headers = {"Authorization": f"Bearer {_login(client, admin['email'], 'admin123!')}"}
+
+    first = _export(client, project_id, headers)
+    assert _export(client, project_id, headers) == first
+
+    response = client.post(
+        f"/v1/sessions/{session_id}/attendance",
+        json=[{"student_id": str(student_id), "status": "present", "hours": 3.0}],
+        headers=headers,
+    )
+    assert response.status_code == 200
+    after_attendance = _export(client, project_id, headers)
+    assert after_attendance != first
+
+    response = client.patch(
+        "/v1/school/branding", json={"footer_text": "Nuovo piè di pagina"}, headers=headers
+    )
+    assert response.status_code == 200
+    after_branding = _export(client, project_id, headers)
+    assert after_branding != after_attendance
+    assert _export(client, project_id, headers) == after_branding
+
+    with Session(bind) as session:
+        rows = session.exec(select(Export).where(Export.project_id == project_id)).all()
+    assert len(rows) == 3
+    assert len({row.content_hash for row in rows}) == 3
+
+    # A cached row whose file disappeared is rendered again instead of served.
+    Path(next(row.file_path for row in rows if str(row.id) == after_branding)).unlink()
+    assert _export(client, project_id, headers) != after_branding
+
+
+def test_only_live_in_flight_exports_are_reused(client):
+    from app.exports.cache import export_fingerprint
+
+    with Session(get_bind()) as session:
+        school, admin = create_school_with_admin(session, "A")
+        content_hash = export_fingerprint(session, school.id, "school_header")
+        stuck = Export(
+            school_id=school.id,
+            kind="school_header",
+            file_path="unused.pdf",
+            status=ExportStatus.running,
+            started_at=datetime.now(timezone.utc) - timedelta(hours=2),
+            content_hash=content_hash,
+        )
+        session.add(stuck)
+        session.commit()
+        stuck_id = str(stuck.id)
+    headers = {"Authorization": f"Bearer {_login(client, admin['email'], 'admin123!')}"}
+
+    fresh = client.post("/v1/exports/school-header", headers=headers).json()
+    assert fresh["export_id"] != stuck_id
+    assert fresh["status"] == "done"
+
+    with Session(get_bind()) as session:
+        live = session.get(Export, UUID(fresh["export_id"]))
+        live.status = ExportStatus.running
+        live.started_at = datetime.now(timezone.utc)
+        session.commit()
+    reused = client.post("/v1/exports/school-header", headers=headers).json()
+    assert reused["export_id"] == fresh["export_id"]
@@ -0,0 +1,86 @@
+from pathlib import Path
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.core.storage import get_storage_base
+from app.db import get_bind
+from tests.utils import create_school_with_admin
+
+IDENTITY = {"Accept-Encoding": "identity"}
+
+
+def _headers(session, suffix: str) -> dict:
+    _, admin = create_school_with_admin(session, suffix)
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _export(client) -> tuple[str, dict, dict]:
+    with Session(get_bind()) as session:
+        headers = _headers(session, "A")
+        other_headers = _headers(session, "B")
+    export_id = client.post("/v1/exports/school-header", headers=headers).json()["export_id"]
+    return f"/v1/exports/{export_id}/download", headers, other_headers
+
+
+def test_download_is_cacheable_conditional_and_resumable(client, assert_max_queries):
+    path, headers, other_headers = _export(client)
+    headers = {**headers, **IDENTITY}
+
+    full = client.get(path, headers=headers)
+    assert full.status_code == 200
+    assert full.headers["Cache-Control"] == "private, max-age=31536000, immutable"
+    assert full.headers["Accept-Ranges"] == "bytes"
+    etag = full.headers["ETag"]
+
+    with assert_max_queries(0):
+        again = client.get(path, headers=headers)
+        unchanged = client.get(path, headers={**headers, "If-None-Match": etag})
+        not_modified_since = client.get(
+            path, headers={**headers, "If-Modified-Since": full.headers["Last-Modified"]}
+        )
+        partial = client.get(path, headers={**headers, "Range": "bytes=0-3"})
+    assert again.content == full.content
+    assert unchanged.status_code == 304
+    assert unchanged.headers["ETag"] == etag
+    assert not_modified_since.status_code == 304
+    assert partial.status_code == 206
+    assert partial.content == b"%PDF"
+    assert partial.headers["Content-Range"] == f"bytes 0-3/{len(full.content)}"
+
+    stale = client.get(path, headers={**headers, "Range": "bytes=0-3", "If-Range": '"old"'})
+    assert stale.status_code == 200
+    assert client.get(path, headers=other_headers).status_code == 404
+
+
+def test_sidecars_get_their_own_etag(client):
+    path, headers, _ = _export(client)
+    plain = client.get(path, headers={**headers, **IDENTITY})
+    zipped = client.get(path, headers={**headers, "Accept-Encoding": "gzip"})
+    assert zipped.headers["Content-Encoding"] == "gzip"
+    assert zipped.headers["ETag"] != plain.headers["ETag"]
+    revalidated = {**headers, "Accept-Encoding": "gzip", "If-None-Match": plain.headers["ETag"]}
+    assert client.get(path, headers=revalidated).status_code == 200
+
+
+def test_proxy_modes_only_authorize(client, monkeypatch):
+    path, headers, other_headers = _export(client)
+    assert client.get(path, headers=headers).status_code == 200
+
+    monkeypatch.setattr(settings, "download_mode", "x-accel-redirect")
+    accel = client.get(path, headers=headers)
+    assert accel.status_code == 200
+    assert accel.content == b""
+    target = accel.headers["X-Accel-Redirect"]
+    assert target.startswith("/protected-storage/") and target.endswith(".pdf")
+    stored = get_storage_base() / target.removeprefix("/protected-storage/")
+    assert stored.read_bytes().startswith(b"%PDF")
+    assert accel.headers["Cache-Control"] == "private, max-age=31536000, immutable"
+    assert "Content-Encoding" not in accel.headers
+    assert client.get(path, headers=other_headers).status_code == 404
+
+    monkeypatch.setattr(settings, "download_mode", "x-sendfile")
+    sendfile = client.get(path, headers=headers)
+    assert Path(sendfile.headers["X-Sendfile"]) == stored.resolve()
@@ -0,0 +1,136 @@
+import time
+from datetime import date, datetime, timedelta, timezone
+from uuid import uuid4
+
+import pytest
+from sqlmodel import Session, select
+
+from app.db import get_bind
+from app.models import ClassRoom, Export, ExportStatus, Project, ProjectStatus
+from tests.utils import create_school_with_admin
+
+
+def _login(client, email: str, password: str) -> str:
+    response = client.post(
+        "/v1/auth/login", json={"email": email, "password": password}
+    )
+    assert response.status_code == 200
+    return response.json()["access_token"]
+
+
+def _wait_for_export(client, export_id: str, headers: dict) -> dict:
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        body = client.get(f"/v1/exports/{export_id}", headers=headers).json()
+        if body["status"] in {"done", "failed"}:
+            return body
+        time.sleep(0.05)
+    raise AssertionError("export did not finish")
+
+
+@pytest.mark.file_db
+def test_export_runs_on_worker_pool_and_can_be_polled(client):
+    import app.exports.jobs as jobs
+
+    bind = get_bind()
+    with Session(bind) as session:
+        school, admin = create_school_with_admin(session, "A")
+        classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+        session.add(classroom)
+        session.flush()
+        project = Project(
+            school_id=school.id,
+            class_id=classroom.id,
+            title="PCTO",
+            status=ProjectStatus.active,
+            start_date=date(2026, 2, 1),
+            end_date=date(2026, 2, 28),
+        )
+        session.add(project)
+        session.commit()
+        project_id = project.id
+
+    token = _login(client, admin["email"], "admin123!")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    jobs.settings.export_executor = "thread"
+    jobs.start_export_workers()
+    try:
+        response = client.post(
+            f"/v1/exports/projects/{project_id}/attendance-register", headers=headers
+        )
+        assert response.status_code == 202
+        assert response.json()["status"] in {"pending", "running", "done"}
+        body = _wait_for_export(client, response.json()["export_id"], headers)
+    finally:
+        jobs.stop_export_workers()
+        jobs.settings.export_executor = "inline"
+
+    assert body["status"] == "done"
+    assert body["progress"] == 100
+    assert body["duration_ms"] is not None
+    download = client.get(
+        f"/v1/exports/{body['export_id']}/download", headers=headers
+    )
+    assert download.status_code == 200
+
+
+def test_pending_export_is_claimed_once_and_failures_are_recorded(client):
+    from app.exports.jobs import claim_next_export, run_export_job
+
+    bind = get_bind()
+    with Session(bind) as session:
+        school, _ = create_school_with_admin(session, "A")
+        export_row = Export(
+            school_id=school.id,
+            kind="attendance_register",
+            project_id=uuid4(),
+            file_path="unused.pdf",
+            status=ExportStatus.pending,
+        )
+        session.add(export_row)
+        session.commit()
+        export_id = export_row.id
+
+    with Session(bind) as session:
+        assert claim_next_export(session) == export_id
+    with Session(bind) as session:
+        assert claim_next_export(session) is None
+
+    run_export_job(export_id)
+
+    with Session(bind) as session:
+        row = session.exec(select(Export).where(Export.id == export_id)).one()
+    assert row.status == ExportStatus.failed
+    assert row.error == "Project not found"
+
+
+def test_stale_running_exports_are_requeued(client):
+    from app.exports.jobs import requeue_stale_exports
+
+    now = datetime.now(timezone.utc)
+    with Session(get_bind()) as session:
+        school, _ = create_school_with_admin(session, "A")
+        rows = {
+            started: Export(
+                school_id=school.id,
+                kind="school_header",
+                file_path="unused.pdf",
+                status=ExportStatus.running,
+                progress=40,
+                started_at=started,
+            )
+            for started in (now - timedelta(hours=2), now - timedelta(minutes=1))
+        }
+        session.add_all(rows.values())
+        session.commit()
+        stale_id, live_id = (row.id for row in rows.values())
+
+        assert requeue_stale_exports(session) == 1
+        stale = session.get(Export, stale_id)
+        assert (stale.status, stale.started_at, stale.progress) == (
+            ExportStatus.pending,
+            None,
+            0,
+        )
+        assert session.get(Export, live_id).status == ExportStatus.running
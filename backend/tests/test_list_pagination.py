@@ -0,0 +1,170 @@
+from datetime import date, datetime, timedelta, timezone
+
+from sqlmodel import Session
+
+from app.core.security import create_access_token
+from app.db import get_bind
+from app.models import (
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    Student,
+)
+from tests.utils import create_school_with_admin
+
+
+def _seed_students(session, school_id, classroom_id, count: int) -> None:
+    for index in range(count):
+        session.add(
+            Student(
+                school_id=school_id,
+                class_id=classroom_id,
+                first_name=f"Nome{index:02d}",
+                last_name=f"Cognome{index % 5}",
+            )
+        )
+
+
+def _collect(client, url: str, headers: dict) -> tuple[list[dict], int]:
+    items: list[dict] = []
+    pages = 0
+    cursor = None
+    while True:
+        params = {"limit": 4}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        items.extend(response.json())
+        pages += 1
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            return items, pages
+
+
+def test_students_keyset_pages_are_stable_and_complete(client, assert_max_queries):
+    bind = get_bind()
+    with Session(bind) as session:
+        school, admin = create_school_with_admin(session, "A")
+        other_school, _ = create_school_with_admin(session, "B")
+        classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+        other_class = ClassRoom(school_id=other_school.id, name="4A", year=4, section="A")
+        session.add(classroom)
+        session.add(other_class)
+        session.flush()
+        _seed_students(session, school.id, classroom.id, 10)
+        _seed_students(session, other_school.id, other_class.id, 3)
+        session.commit()
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    # Collection versions, then the page.
+    with assert_max_queries(3):
+        full = client.get("/v1/students", headers=headers)
+    assert full.status_code == 200
+    assert "X-Next-Cursor" not in full.headers
+    expected = [row["id"] for row in full.json()]
+    assert len(expected) == 10
+
+    items, pages = _collect(client, "/v1/students", headers)
+    assert pages == 3
+    assert [row["id"] for row in items] == expected
+    assert [(row["last_name"], row["first_name"]) for row in items] == sorted(
+        (row["last_name"], row["first_name"]) for row in items
+    )
+
+    with assert_max_queries(3):
+        counted = client.get(
+            "/v1/students",
+            params={"limit": 2, "include_total": "true", "name_prefix": "cognome1"},
+            headers=headers,
+        )
+    assert counted.headers["X-Total-Count"] == "2"
+    assert {row["last_name"] for row in counted.json()} == {"Cognome1"}
+
+    projected = client.get(
+        "/v1/students",
+        params={"fields": "id,last_name", "limit": 3},
+        headers=headers,
+    )
+    assert projected.status_code == 200
+    assert [set(row) for row in projected.json()] == [{"id", "last_name"}] * 3
+    assert projected.headers["ETag"] == counted.headers["ETag"]
+    next_page = client.get(
+        "/v1/students",
+        params={
+            "fields": "id,last_name",
+            "limit": 3,
+            "cursor": projected.headers["X-Next-Cursor"],
+        },
+        headers=headers,
+    )
+    assert [row["id"] for row in next_page.json()] == expected[3:6]
+
+    assert (
+        client.get("/v1/students", params={"fields": "password"}, headers=headers).status_code
+        == 400
+    )
+    assert (
+        client.get("/v1/students", params={"cursor": "garbage"}, headers=headers).status_code
+        == 400
+    )
+
+
+def test_sessions_and_projects_filters(client):
+    bind = get_bind()
+    with Session(bind) as session:
+        school, admin = create_school_with_admin(session, "A")
+        classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+        session.add(classroom)
+        session.flush()
+        projects = [
+            Project(
+                school_id=school.id,
+                class_id=classroom.id,
+                title=title,
+                status=project_status,
+                start_date=date(2026, month, 1),
+                end_date=date(2026, month, 28),
+            )
+            for title, project_status, month in [
+                ("Robotica", ProjectStatus.active, 2),
+                ("Ristorazione", ProjectStatus.draft, 3),
+                ("Musei", ProjectStatus.active, 4),
+            ]
+        ]
+        session.add_all(projects)
+        session.flush()
+        start = datetime(2026, 2, 2, 9, 0, tzinfo=timezone.utc)
+        for day in range(6):
+            session.add(
+                ProjectSession(
+                    school_id=school.id,
+                    project_id=projects[0].id,
+                    start=start + timedelta(days=day),
+                    end=start + timedelta(days=day, hours=2),
+                    planned_hours=2.0,
+                )
+            )
+        session.commit()
+        project_id = projects[0].id
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    active = client.get("/v1/projects", params={"status": "active"}, headers=headers)
+    assert [row["title"] for row in active.json()] == ["Robotica", "Musei"]
+    prefixed = client.get("/v1/projects", params={"title_prefix": "Ri"}, headers=headers)
+    assert [row["title"] for row in prefixed.json()] == ["Ristorazione"]
+
+    url = f"/v1/projects/{project_id}/sessions"
+    items, pages = _collect(client, url, headers)
+    assert pages == 2
+    assert [row["start"] for row in items] == sorted(row["start"] for row in items)
+
+    ranged = client.get(
+        url,
+        params={"start_from": (start + timedelta(days=2)).isoformat()},
+        headers=headers,
+    )
+    assert len(ranged.json()) == 4
@@ -0,0 +1,101 @@
+import time
+
+import pytest
+from passlib.hash import pbkdf2_sha256
+from sqlmodel import Session, select
+
+from app.db import get_bind
+from app.models import User
+from tests.utils import create_school_with_admin
+
+
+@pytest.fixture()
+def throttled_client(monkeypatch, request):
+    monkeypatch.setenv("LOGIN_RATE_LIMIT_EMAIL_ATTEMPTS", "3")
+    monkeypatch.setenv("LOGIN_RATE_LIMIT_IP_ATTEMPTS", "7")
+    return request.getfixturevalue("client")
+
+
+def _login(client, email: str, password: str):
+    return client.post("/v1/auth/login", json={"email": email, "password": password})
+
+
+def test_failed_logins_are_throttled_per_email_and_ip(throttled_client):
+    client = throttled_client
+    with Session(get_bind()) as session:
+        _, admin = create_school_with_admin(session, "A")
+
+    for _ in range(2):
+        assert _login(client, admin["email"], "wrong").status_code == 401
+    # A success clears the per-email failures.
+    assert _login(client, admin["email"], "admin123!").status_code == 200
+    for _ in range(3):
+        assert _login(client, admin["email"], "wrong").status_code == 401
+
+    blocked = _login(client, admin["email"].upper(), "admin123!")
+    assert blocked.status_code == 429
+    assert int(blocked.headers["Retry-After"]) > 0
+
+    assert _login(client, "nobody@demo.it", "wrong").status_code == 401
+    assert _login(client, "someone@demo.it", "wrong").status_code == 401
+    assert _login(client, "another@demo.it", "wrong").status_code == 429
+
+
+def test_login_rehashes_passwords_below_configured_rounds(client):
+    from app.core.security import pwd_context
+
+    with Session(get_bind()) as session:
+        _, admin = create_school_with_admin(session, "A")
+        user = session.exec(select(User).where(User.id == admin["id"])).one()
+        user.password_hash = pbkdf2_sha256.using(rounds=1000).hash("admin123!")
+        session.add(user)
+        session.commit()
+
+    assert _login(client, admin["email"], "admin123!").status_code == 200
+
+    with Session(get_bind()) as session:
+        stored = session.exec(select(User).where(User.id == admin["id"])).one()
+    assert not pwd_context.needs_update(stored.password_hash)
+    assert pbkdf2_sha256.from_string(stored.password_hash).rounds == 29000
+    assert _login(client, admin["email"], "admin123!").status_code == 200
+
+
+def test_login_is_shed_when_hash_queue_is_full(client):
+    import app.core.hashing as hashing
+
+    with Session(get_bind()) as session:
+        _, admin = create_school_with_admin(session, "A")
+
+    hashing.settings.password_hash_executor = "thread"
+    slots = 0
+    try:
+        while hashing._acquire_slot():
+            slots += 1
+        assert hashing.queue_depth() == slots == hashing.settings.password_hash_max_queue
+        response = _login(client, admin["email"], "admin123!")
+        assert response.status_code == 503
+        assert response.headers["Retry-After"] == "1"
+
+        hashing._release_slot()
+        slots -= 1
+        assert _login(client, admin["email"], "admin123!").status_code == 200
+        assert hashing.queue_depth() == slots
+    finally:
+        for _ in range(slots):
+            hashing._release_slot()
+        hashing.stop_password_hasher()
+        hashing.settings.password_hash_executor = "inline"
+
+
+def test_sliding_window_forgets_old_hits():
+    from app.core.ratelimit import SlidingWindowLimiter
+
+    limiter = SlidingWindowLimiter(limit=2, window=0.2, maxsize=2)
+    limiter.hit("a")
+    limiter.hit("a")
+    assert 0 < limiter.retry_after("a") <= 0.2
+    time.sleep(0.25)
+    assert limiter.retry_after("a") == 0
+    for key in ("b", "c", "d"):
+        limiter.hit(key)
+    assert len(limiter) == 2
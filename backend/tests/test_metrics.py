@@ -0,0 +1,117 @@
+import re
+import threading
+
+import pytest
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.core.metrics import Registry
+from app.core.security import create_access_token, hash_password
+from app.db import get_bind
+from app.models import User, UserRole
+from tests.utils import create_school_with_admin
+
+
+def _sample(body: str, name: str, **labels: str) -> float:
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    series = f"{name}{{{label_text}}}" if labels else name
+    match = re.search(rf"^{re.escape(series)} (\S+)$", body, re.MULTILINE)
+    return float(match.group(1)) if match else 0.0
+
+
+def test_registry_text_format_and_thread_sharding():
+    registry = Registry()
+    counter = registry.counter("jobs_total", "Jobs.", ("kind",))
+    histogram = registry.histogram("job_seconds", "Job time.", ("kind",), (0.1, 1.0))
+    registry.callback_gauge("queue", "Queue.", lambda: {(): 3})
+
+    def work() -> None:
+        for _ in range(1000):
+            counter.inc("pdf")
+            histogram.observe(0.5, "pdf")
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    histogram.observe(2.0, "pdf")
+
+    body = registry.render()
+    assert "# TYPE jobs_total counter" in body
+    assert 'jobs_total{kind="pdf"} 8000' in body
+    assert 'job_seconds_bucket{kind="pdf",le="0.1"} 0' in body
+    assert 'job_seconds_bucket{kind="pdf",le="1"} 8000' in body
+    assert 'job_seconds_bucket{kind="pdf",le="+Inf"} 8001' in body
+    assert 'job_seconds_count{kind="pdf"} 8001' in body
+    assert 'job_seconds_sum{kind="pdf"} 4002' in body
+    assert "\nqueue 3\n" in body
+
+
+# Pool gauges need the app's own pooled engine.
+@pytest.mark.file_db
+def test_metrics_endpoint_reports_routes_logins_and_exports(client, monkeypatch):
+    monkeypatch.setattr(settings, "metrics_token", "scrape-secret")
+    scrape = {"Authorization": "Bearer scrape-secret"}
+    with Session(get_bind()) as session:
+        _, admin = create_school_with_admin(session, "A")
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    before = client.get("/metrics", headers=scrape).text
+    route = {"method": "GET", "route": "/v1/classes"}
+    assert client.get("/v1/classes", headers=headers).status_code == 200
+    assert client.get("/v1/classes").status_code == 401
+    login = client.post(
+        "/v1/auth/login", json={"email": admin["email"], "password": "admin123!"}
+    )
+    assert login.status_code == 200
+    export = client.post("/v1/exports/school-header", headers=headers)
+    assert export.status_code in (200, 201, 202)
+
+    response = client.get("/metrics", headers=scrape)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    body = response.text
+
+    def delta(name: str, **labels: str) -> float:
+        return _sample(body, name, **labels) - _sample(before, name, **labels)
+
+    assert delta("http_responses_total", **route, status="200") == 1
+    assert delta("http_responses_total", **route, status="401") == 1
+    assert delta("http_request_duration_seconds_count", **route) == 2
+    assert _sample(body, "http_requests_in_flight") == 1
+    assert delta("login_password_hash_seconds_count") == 1
+    assert delta("export_render_duration_seconds_count", kind="school_header") == 1
+    assert delta("export_file_size_bytes_count", kind="school_header") == 1
+    assert _sample(body, "threadpool_tokens", state="capacity") > 0
+    assert 'db_pool_connections{state="checked_out"}' in body
+    assert "login_password_hash_queue_depth 0" in body
+
+
+def test_metrics_need_the_scrape_token_or_a_platform_admin(client, monkeypatch):
+    with Session(get_bind()) as session:
+        _, admin = create_school_with_admin(session, "A")
+        platform_admin = User(
+            role=UserRole.platform_admin,
+            email="platform@demo.it",
+            password_hash=hash_password("admin123!"),
+        )
+        session.add(platform_admin)
+        session.commit()
+        platform_token = create_access_token(platform_admin.id, platform_admin.role, None)
+    school_token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+
+    def status_with(token: str | None) -> int:
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        return client.get("/metrics", headers=headers).status_code
+
+    assert status_with(None) == 401
+    assert status_with(school_token) == 403
+    assert status_with("scrape-secret") == 401
+    assert status_with(platform_token) == 200
+
+    monkeypatch.setattr(settings, "metrics_token", "scrape-secret")
+    assert status_with("scrape-secret") == 200
+    assert status_with("wrong-secret") == 401
+    assert status_with(platform_token) == 200
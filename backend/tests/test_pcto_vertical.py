@@ -5,7 +5,7 @@ from uuid import UUID
 
 from sqlmodel import Session, select
 
-from app.db import get_engine
+from app.db import get_bind
 from app.models import Attendance, ClassRoom, Student
 from tests.utils import create_school_with_admin
 
@@ -19,8 +19,8 @@ def _login(client, email: str, password: str) -> str:
 
 
 def test_pcto_vertical_slice_and_export(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         school_a, admin_a = create_school_with_admin(session, "A")
         school_b, admin_b = create_school_with_admin(session, "B")
 
@@ -94,7 +94,7 @@ def test_pcto_vertical_slice_and_export(client):
     )
     assert attendance_response.status_code == 200
 
-    with Session(engine) as session:
+    with Session(bind) as session:
         attendance_rows = session.exec(
             select(Attendance).where(Attendance.session_id == UUID(session_id))
         ).all()
@@ -117,7 +117,8 @@ def test_pcto_vertical_slice_and_export(client):
         f"/v1/exports/projects/{project_id}/attendance-register",
         headers={"Authorization": f"Bearer {token_a}"},
     )
-    assert export_response.status_code == 200
+    assert export_response.status_code == 202
+    assert export_response.json()["status"] == "done"
     export_id = export_response.json()["export_id"]
 
     download_b = client.get(
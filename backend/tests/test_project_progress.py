@@ -0,0 +1,190 @@
+import json
+import shutil
+import subprocess
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from sqlmodel import Session, select
+
+from app.core.security import create_access_token
+from app.db import get_bind
+from app.progress import js_round
+from app.models import (
+    Attendance,
+    AttendanceStatus,
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    SessionStatus,
+    Student,
+)
+from tests.utils import create_school_with_admin
+
+CASES = json.loads((Path(__file__).parent / "fixtures" / "progress_cases.json").read_text())
+FRONTEND_DIR = Path(__file__).resolve().parents[2] / "frontend"
+
+# Transpiles lib/progress.ts with the frontend's own TypeScript and runs every case.
+NODE_HARNESS = """
+const fs = require("fs");
+const path = require("path");
+const ts = require(path.join(process.argv[1], "node_modules", "typescript"));
+const source = fs.readFileSync(path.join(process.argv[1], "lib", "progress.ts"), "utf8");
+const { outputText } = ts.transpileModule(source, {
+  compilerOptions: { module: ts.ModuleKind.CommonJS, target: ts.ScriptTarget.ES2019 },
+});
+const mod = { exports: {} };
+new Function("module", "exports", outputText)(mod, mod.exports);
+const cases = JSON.parse(fs.readFileSync(0, "utf8"));
+const results = cases.map((item) => {
+  const sessions = item.sessions.map((s, i) => ({ id: String(i), ...s }));
+  const attendance = Object.fromEntries(
+    sessions.map((s) => [s.id, s.attendance.map((hours) => ({ hours }))])
+  );
+  return mod.exports.computeProjectProgress(
+    { total_hours: item.total_hours }, sessions, attendance
+  );
+});
+process.stdout.write(JSON.stringify(results));
+"""
+
+
+def _seed_cases(session: Session, school_id) -> list:
+    classroom = ClassRoom(school_id=school_id, name="4A", year=4, section="A")
+    session.add(classroom)
+    session.flush()
+    students = [
+        Student(school_id=school_id, class_id=classroom.id, first_name=f"N{i}", last_name=f"C{i}")
+        for i in range(2)
+    ]
+    session.add_all(students)
+    session.flush()
+    project_ids = []
+    for index, case in enumerate(CASES):
+        project = Project(
+            school_id=school_id,
+            class_id=classroom.id,
+            title=case["name"],
+            status=ProjectStatus.active,
+            start_date=date(2026, 1, 1) + timedelta(days=index),
+            end_date=date(2026, 12, 31),
+            total_hours=case["total_hours"],
+        )
+        session.add(project)
+        session.flush()
+        project_ids.append(project.id)
+        for offset, item in enumerate(case["sessions"]):
+            start = datetime(2026, 2, 1 + offset, 9, 0, tzinfo=timezone.utc)
+            project_session = ProjectSession(
+                school_id=school_id,
+                project_id=project.id,
+                start=start,
+                end=start + timedelta(hours=3),
+                planned_hours=item["planned_hours"],
+                status=SessionStatus(item["status"]),
+            )
+            session.add(project_session)
+            session.flush()
+            session.add_all(
+                Attendance(
+                    school_id=school_id,
+                    session_id=project_session.id,
+                    student_id=student.id,
+                    status=AttendanceStatus.present if hours else AttendanceStatus.absent,
+                    hours=hours,
+                )
+                for student, hours in zip(students, item["attendance"])
+            )
+    session.commit()
+    return project_ids
+
+
+def test_project_progress_matches_frontend_cases_in_one_query(client, assert_max_queries):
+    bind = get_bind()
+    with Session(bind) as session:
+        school, admin = create_school_with_admin(session, "A")
+        project_ids = _seed_cases(session, school.id)
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client.get("/v1/classes", headers=headers).status_code == 200
+
+    with assert_max_queries(1):
+        response = client.get("/v1/projects/progress", headers=headers)
+    assert response.status_code == 200
+
+    by_project = {row["project_id"]: row for row in response.json()}
+    for project_id, case in zip(project_ids, CASES):
+        row = by_project[str(project_id)]
+        actual = {key: row[key] for key in case["expected"]}
+        assert actual == case["expected"], case["name"]
+        assert row["session_count"] == len(case["sessions"])
+
+
+@pytest.mark.skipif(
+    shutil.which("node") is None
+    or not (FRONTEND_DIR / "node_modules" / "typescript").exists(),
+    reason="node and the frontend's typescript package are needed to run progress.ts",
+)
+def test_progress_cases_match_typescript_implementation():
+    output = subprocess.run(
+        ["node", "-e", NODE_HARNESS, str(FRONTEND_DIR)],
+        input=json.dumps(CASES),
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    for case, result in zip(CASES, json.loads(output)):
+        expected = case["expected"]
+        assert result["usedHours"] == expected["used_hours"], case["name"]
+        assert result["progressPct"] == expected["progress_pct"], case["name"]
+        assert result["label"] == expected["label"], case["name"]
+        assert result["badgeVariant"] == expected["badge_variant"], case["name"]
+
+
+def test_dashboard_aggregates_school_activity(client, assert_max_queries):
+    bind = get_bind()
+    with Session(bind) as session:
+        school, admin = create_school_with_admin(session, "A")
+        other_school, _ = create_school_with_admin(session, "B")
+        project_ids = _seed_cases(session, school.id)
+        _seed_cases(session, other_school.id)
+        project = session.get(Project, project_ids[0])
+        recent = ProjectSession(
+            school_id=school.id,
+            project_id=project.id,
+            start=datetime.now(timezone.utc) - timedelta(days=1),
+            end=datetime.now(timezone.utc) - timedelta(days=1) + timedelta(hours=2),
+            planned_hours=2,
+            status=SessionStatus.done,
+        )
+        session.add(recent)
+        session.flush()
+        student = session.exec(select(Student).where(Student.school_id == school.id)).first()
+        session.add(
+            Attendance(
+                school_id=school.id,
+                session_id=recent.id,
+                student_id=student.id,
+                status=AttendanceStatus.present,
+                hours=2,
+            )
+        )
+        session.commit()
+        recent_day = recent.start.date().isoformat()
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    with assert_max_queries(5):
+        response = client.get("/v1/dashboard", headers={"Authorization": f"Bearer {token}"})
+    body = response.json()
+
+    case_sessions = sum(len(case["sessions"]) for case in CASES)
+    case_rows = [hours for case in CASES for item in case["sessions"] for hours in item["attendance"]]
+    assert body["total_projects"] == len(CASES)
+    assert body["total_sessions"] == case_sessions + 1
+    assert body["total_hours"] == sum(case_rows) + 2
+    present = sum(1 for hours in case_rows if hours) + 1
+    assert body["presence_pct"] == js_round(present / (len(case_rows) + 1) * 100)
+    assert body["hours_by_day"] == [{"date": recent_day, "hours": 2.0}]
+    assert {row["label"] for row in body["hours_by_class"]} == {"4A"}
+    assert sum(row["hours"] for row in body["hours_by_class"]) == body["total_hours"]
+    assert len(body["projects"]) == len(CASES)
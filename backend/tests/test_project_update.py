@@ -2,7 +2,7 @@ from datetime import date
 
 from sqlmodel import Session
 
-from app.db import get_engine
+from app.db import get_bind
 from tests.utils import create_school_with_admin
 
 
@@ -15,8 +15,8 @@ def _login(client, email: str, password: str) -> str:
 
 
 def test_project_fields_create_and_patch(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         _, admin = create_school_with_admin(session, "A")
 
     token = _login(client, admin["email"], "admin123!")
@@ -91,8 +91,8 @@ def test_project_fields_create_and_patch(client):
 
 
 def test_project_patch_cross_tenant_404(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         _, admin_a = create_school_with_admin(session, "A")
         _, admin_b = create_school_with_admin(session, "B")
 
@@ -143,8 +143,8 @@ def test_project_patch_cross_tenant_404(client):
 
 
 def test_project_requires_class_id(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         _, admin = create_school_with_admin(session, "A")
 
     token = _login(client, admin["email"], "admin123!")
@@ -162,8 +162,8 @@ def test_project_requires_class_id(client):
 
 
 def test_project_create_with_other_tenant_class_returns_404(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         _, admin_a = create_school_with_admin(session, "A")
         _, admin_b = create_school_with_admin(session, "B")
 
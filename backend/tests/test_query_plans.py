@@ -0,0 +1,122 @@
+import re
+from contextlib import contextmanager
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlalchemy import event
+from sqlmodel import Session as DbSession
+
+from app.core.security import create_access_token
+from app.db import get_engine
+from app.models import (
+    Attendance,
+    AttendanceStatus,
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    Student,
+)
+from tests.utils import create_school_with_admin
+
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+
+pytestmark = pytest.mark.file_db
+
+
+@contextmanager
+def _capture_selects(engine):
+    statements: list[tuple[str, object]] = []
+
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before_cursor_execute)
+
+
+def _full_scans(engine, statements) -> list[tuple[str, str]]:
+    scans = []
+    with engine.connect() as conn:
+        for statement, parameters in statements:
+            plan = conn.exec_driver_sql(
+                f"EXPLAIN QUERY PLAN {statement}", parameters
+            ).fetchall()
+            for row in plan:
+                match = FULL_SCAN.match(row[-1])
+                if match:
+                    scans.append((match.group(1), statement))
+    return scans
+
+
+def _seed(session) -> tuple[dict, str, str]:
+    school, admin = create_school_with_admin(session, "A")
+    classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+    session.add(classroom)
+    session.flush()
+    student = Student(
+        school_id=school.id,
+        class_id=classroom.id,
+        first_name="Luca",
+        last_name="Rossi",
+    )
+    project = Project(
+        school_id=school.id,
+        class_id=classroom.id,
+        title="PCTO",
+        status=ProjectStatus.active,
+        start_date=date(2026, 2, 1),
+        end_date=date(2026, 2, 28),
+    )
+    session.add(student)
+    session.add(project)
+    session.flush()
+    project_session = ProjectSession(
+        school_id=school.id,
+        project_id=project.id,
+        start=datetime(2026, 2, 7, 10, 0, tzinfo=timezone.utc),
+        end=datetime(2026, 2, 7, 12, 0, tzinfo=timezone.utc),
+        planned_hours=2.0,
+    )
+    session.add(project_session)
+    session.flush()
+    session.add(
+        Attendance(
+            school_id=school.id,
+            session_id=project_session.id,
+            student_id=student.id,
+            status=AttendanceStatus.present,
+            hours=2.0,
+        )
+    )
+    session.commit()
+    return admin, str(student.id), str(project.id)
+
+
+def test_hot_queries_use_tenant_indexes(client):
+    engine = get_engine()
+    with DbSession(engine) as session:
+        admin, student_id, project_id = _seed(session)
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with _capture_selects(engine) as statements:
+        assert client.get("/v1/students/metrics", headers=headers).status_code == 200
+        assert (
+            client.get(f"/v1/students/{student_id}/summary", headers=headers).status_code
+            == 200
+        )
+        assert (
+            client.post(
+                f"/v1/exports/projects/{project_id}/attendance-register",
+                headers=headers,
+            ).status_code
+            == 202
+        )
+
+    assert statements
+    assert _full_scans(engine, statements) == []
@@ -0,0 +1,89 @@
+import json
+import logging
+import re
+
+import pytest
+from sqlmodel import Session
+
+from app.core.security import create_access_token
+from app.db import get_bind
+from app.models import ClassRoom
+from tests.utils import create_school_with_admin
+
+# Exact per-request counts; the shared database's savepoints would show up in them.
+pytestmark = pytest.mark.file_db
+
+SERVER_TIMING = re.compile(r'db;dur=[\d.]+;desc="(\d+) queries", app;dur=[\d.]+')
+
+
+def _headers() -> dict[str, str]:
+    with Session(get_bind()) as session:
+        school, admin = create_school_with_admin(session, "A")
+        session.add(ClassRoom(school_id=school.id, name="3A", year=3, section="A"))
+        session.commit()
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _request_logs(caplog) -> list[dict]:
+    return [
+        json.loads(record.getMessage())
+        for record in caplog.records
+        if record.name == "app.requests"
+    ]
+
+
+def test_server_timing_and_request_log(client, caplog):
+    headers = _headers()
+    with caplog.at_level(logging.INFO, logger="app.requests"):
+        response = client.get("/v1/classes", headers=headers)
+        health = client.get("/health")
+
+    assert response.status_code == 200
+    match = SERVER_TIMING.fullmatch(response.headers["Server-Timing"])
+    assert match and int(match.group(1)) >= 1
+    assert SERVER_TIMING.fullmatch(health.headers["Server-Timing"]).group(1) == "0"
+
+    classes_log, health_log = _request_logs(caplog)
+    assert classes_log["path"] == "/v1/classes"
+    assert classes_log["status"] == 200
+    assert classes_log["db_queries"] == int(match.group(1))
+    assert classes_log["db_duplicates"] == 0
+    assert health_log["db_queries"] == 0
+
+
+def test_duplicate_statements_are_flagged(client, caplog, monkeypatch):
+    from app.core import instrumentation
+
+    monkeypatch.setattr(instrumentation.settings, "db_duplicate_query_threshold", 2)
+    headers = _headers()
+
+    @client.app.get("/test/n-plus-one")
+    def n_plus_one() -> dict:
+        from sqlmodel import select
+
+        with Session(get_bind()) as session:
+            for _ in range(3):
+                session.exec(select(ClassRoom)).all()
+        return {}
+
+    with caplog.at_level(logging.INFO, logger="app.requests"):
+        assert client.get("/test/n-plus-one", headers=headers).status_code == 200
+
+    warnings = [r for r in caplog.records if r.levelno == logging.WARNING]
+    assert len(warnings) == 1
+    record = json.loads(warnings[0].getMessage())
+    assert record["db_duplicates"] == 2
+    assert record["db_top_duplicate"]["count"] == 3
+    assert "FROM classroom" in record["db_top_duplicate"]["statement"]
+
+
+def test_assert_max_queries_fails_over_budget(client, assert_max_queries):
+    headers = _headers()
+    with assert_max_queries(10) as stats:
+        client.get("/v1/classes", headers=headers)
+    assert stats.count >= 1
+
+    with pytest.raises(AssertionError, match="budget 0"):
+        with assert_max_queries(0):
+            client.get("/v1/classes", headers=headers)
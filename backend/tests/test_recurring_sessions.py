@@ -0,0 +1,271 @@
+from datetime import date, datetime, time, timezone
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlmodel import Session, select
+
+from app.db import get_bind
+from app.models import (
+    Attendance,
+    AttendanceStatus,
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    Student,
+    StudentHours,
+)
+from app.recurrence import expand_occurrences
+from tests.utils import create_school_with_admin
+
+
+def _login(client, email: str, password: str) -> str:
+    response = client.post(
+        "/v1/auth/login", json={"email": email, "password": password}
+    )
+    assert response.status_code == 200
+    return response.json()["access_token"]
+
+
+def _setup(client):
+    bind = get_bind()
+    with Session(bind) as session:
+        school, admin = create_school_with_admin(session, "A")
+        classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+        session.add(classroom)
+        session.flush()
+        project = Project(
+            school_id=school.id,
+            class_id=classroom.id,
+            title="Corso settimanale",
+            status=ProjectStatus.active,
+            start_date=date(2026, 9, 1),
+            end_date=date(2027, 6, 30),
+        )
+        session.add(project)
+        session.commit()
+        ids = school.id, classroom.id, project.id
+    return _login(client, admin["email"], "admin123!"), ids
+
+
+def _weekly_spec(**overrides) -> dict:
+    spec = {
+        "weekdays": [0, 3],
+        "start_time": "09:00",
+        "end_time": "12:00",
+        "start_date": "2026-10-05",
+        "end_date": "2026-11-01",
+        "exclude_dates": ["2026-10-15"],
+        "timezone": "Europe/Rome",
+        "topic": "Laboratorio",
+    }
+    spec.update(overrides)
+    return spec
+
+
+def _series_sessions(series_id: str) -> list[ProjectSession]:
+    with Session(get_bind()) as session:
+        return list(
+            session.exec(
+                select(ProjectSession)
+                .where(ProjectSession.series_id == UUID(series_id))
+                .order_by(ProjectSession.start)
+            ).all()
+        )
+
+
+def test_expand_occurrences_uses_local_time_across_dst():
+    occurrences = expand_occurrences(
+        [6], time(9), time(11), date(2026, 10, 18), date(2026, 11, 1), (), "Europe/Rome"
+    )
+    assert [start.hour for start, _ in occurrences] == [7, 8, 8]
+    assert all(start.tzinfo == timezone.utc for start, _ in occurrences)
+
+
+def test_recurring_sessions_single_insert(client):
+    token, (_, _, project_id) = _setup(client)
+    bind = get_bind()
+    inserts: list[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO session"):
+            inserts.append(statement)
+
+    event.listen(bind, "before_cursor_execute", count)
+    try:
+        response = client.post(
+            f"/v1/projects/{project_id}/sessions/recurring",
+            json=_weekly_spec(),
+            headers={"Authorization": f"Bearer {token}"},
+        )
+    finally:
+        event.remove(bind, "before_cursor_execute", count)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["created"] == 7
+    assert body["skipped"] == []
+    assert len(inserts) == 1
+
+    sessions = _series_sessions(body["series_id"])
+    assert len(sessions) == 7
+    assert sessions[0].planned_hours == 3.0
+    assert sessions[0].topic == "Laboratorio"
+    assert date(2026, 10, 15) not in {s.start.date() for s in sessions}
+
+
+def test_recurring_sessions_overlap_conflict_and_skip(client):
+    token, (_, _, project_id) = _setup(client)
+    existing = client.post(
+        f"/v1/projects/{project_id}/sessions",
+        json={
+            "start": datetime(2026, 10, 12, 8, 0, tzinfo=timezone.utc).isoformat(),
+            "end": datetime(2026, 10, 12, 9, 0, tzinfo=timezone.utc).isoformat(),
+            "planned_hours": 1.0,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert existing.status_code == 200
+
+    conflict = client.post(
+        f"/v1/projects/{project_id}/sessions/recurring",
+        json=_weekly_spec(),
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert conflict.status_code == 409
+    assert conflict.json()["detail"] == "Overlaps existing sessions: 2026-10-12"
+
+    skipped = client.post(
+        f"/v1/projects/{project_id}/sessions/recurring",
+        json=_weekly_spec(skip_conflicts=True),
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert skipped.status_code == 200
+    assert skipped.json()["created"] == 6
+    assert skipped.json()["skipped"] == ["2026-10-12"]
+
+    invalid = client.post(
+        f"/v1/projects/{project_id}/sessions/recurring",
+        json=_weekly_spec(weekdays=[7]),
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert invalid.status_code == 400
+
+
+def test_series_reschedule_and_cancel(client):
+    token, (school_id, class_id, project_id) = _setup(client)
+    created = client.post(
+        f"/v1/projects/{project_id}/sessions/recurring",
+        json=_weekly_spec(exclude_dates=[]),
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert created.status_code == 200
+    series_id = created.json()["series_id"]
+    first = _series_sessions(series_id)[0]
+
+    with Session(get_bind()) as session:
+        student = Student(
+            school_id=school_id, class_id=class_id, first_name="Luca", last_name="Rossi"
+        )
+        session.add(student)
+        session.flush()
+        session.add(
+            Attendance(
+                school_id=school_id,
+                session_id=first.id,
+                student_id=student.id,
+                status=AttendanceStatus.present,
+                hours=3.0,
+            )
+        )
+        session.commit()
+        student_id = student.id
+
+    moved = client.patch(
+        f"/v1/sessions/series/{series_id}",
+        json={"start_time": "14:00", "end_time": "16:00", "topic": "Pomeriggio"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert moved.status_code == 200
+    assert moved.json()["updated"] == 8
+    sessions = _series_sessions(series_id)
+    assert {(s.start.hour, s.end.hour) for s in sessions} == {(12, 14), (13, 15)}
+    assert {s.topic for s in sessions} == {"Pomeriggio"}
+
+    with Session(get_bind()) as session:
+        rollup = session.exec(
+            select(StudentHours).where(StudentHours.student_id == student_id)
+        ).one()
+    assert rollup.last_session_end.hour == 14
+
+    cancelled = client.delete(
+        f"/v1/sessions/series/{series_id}",
+        params={"from_date": "2026-10-20"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert cancelled.status_code == 200
+    assert cancelled.json() == {"deleted": 3}
+    assert len(_series_sessions(series_id)) == 5
+
+    cancelled_all = client.delete(
+        f"/v1/sessions/series/{series_id}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert cancelled_all.json() == {"deleted": 5}
+    with Session(get_bind()) as session:
+        assert session.exec(select(StudentHours)).all() == []
+
+    missing = client.patch(
+        f"/v1/sessions/series/{series_id}",
+        json={"shift_days": 1},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert missing.status_code == 404
+
+
+def test_series_endpoints_reject_unknown_timezones(client, assert_max_queries):
+    token, (_, _, project_id) = _setup(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    created = client.post(
+        f"/v1/projects/{project_id}/sessions/recurring",
+        json=_weekly_spec(exclude_dates=[]),
+        headers=headers,
+    )
+    series_id = created.json()["series_id"]
+    path = f"/v1/sessions/series/{series_id}"
+
+    with assert_max_queries(0):
+        moved = client.patch(
+            path, json={"start_time": "14:00", "timezone": "Mars/Olympus"}, headers=headers
+        )
+        cancelled = client.delete(
+            path,
+            params={"from_date": "2026-10-20", "timezone": "Mars/Olympus"},
+            headers=headers,
+        )
+    assert moved.status_code == 400
+    assert cancelled.status_code == 400
+    assert moved.json()["detail"] == "Unknown timezone: Mars/Olympus"
+    assert len(_series_sessions(series_id)) == 8
+
+
+def test_series_move_from_date_conflicts_with_earlier_sessions(client):
+    token, (_, _, project_id) = _setup(client)
+    headers = {"Authorization": f"Bearer {token}"}
+    created = client.post(
+        f"/v1/projects/{project_id}/sessions/recurring",
+        json=_weekly_spec(),
+        headers=headers,
+    )
+    series_id = created.json()["series_id"]
+
+    # Thursday 8 October moved back onto Monday 5 October, which stays put.
+    moved = client.patch(
+        f"/v1/sessions/series/{series_id}",
+        json={"from_date": "2026-10-08", "shift_days": -3},
+        headers=headers,
+    )
+    assert moved.status_code == 409
+    assert "2026-10-05" in moved.json()["detail"]
+    starts = sorted(s.start for s in _series_sessions(series_id))
+    assert len(starts) == len(set(starts))
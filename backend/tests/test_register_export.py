@@ -0,0 +1,49 @@
+import re
+
+from sqlmodel import Session
+
+from app.db import get_bind
+
+
+def _page_count(pdf: bytes) -> int:
+    return len(re.findall(rb"/Type /Page\b", pdf))
+
+
+def test_attendance_register_spans_pages_and_streams_rows(client, tmp_path):
+    from app.bench.register_export import seed_project
+    from app.exports.render import render_attendance_register
+
+    progress: list[int] = []
+    with Session(get_bind()) as session:
+        export = seed_project(session, sessions=120, students=40)
+        export.file_path = str(tmp_path / "register.pdf")
+        render_attendance_register(session, export, progress.append)
+
+    pdf = (tmp_path / "register.pdf").read_bytes()
+    assert pdf.startswith(b"%PDF")
+    assert _page_count(pdf) > 1
+    assert progress[-1] == 100
+    assert progress == sorted(progress)
+
+
+def test_attendance_register_page_count_matches_layout(client, tmp_path):
+    from reportlab.pdfgen import canvas
+
+    from app.bench.register_export import seed_project
+    from app.exports.render import _RegisterPages, render_attendance_register
+
+    with Session(get_bind()) as session:
+        export = seed_project(session, sessions=300, students=25)
+        export.file_path = str(tmp_path / "register.pdf")
+        render_attendance_register(session, export, lambda _progress: None)
+
+    expected = _RegisterPages(
+        canvas.Canvas(str(tmp_path / "unused.pdf")),
+        None,
+        None,
+        None,
+        None,
+        300 + 25 + 3,
+        None,
+    ).total_pages
+    assert _page_count((tmp_path / "register.pdf").read_bytes()) == expected
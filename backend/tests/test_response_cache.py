@@ -0,0 +1,172 @@
+import time
+from datetime import date, datetime, timezone
+
+import pytest
+from sqlmodel import Session
+
+from app.core.cache import MemoryCache, SQLiteCache
+from app.core.security import create_access_token
+from app.db import get_bind
+from app.models import (
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    Student,
+    User,
+    UserRole,
+)
+from tests.utils import create_school_with_admin
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    def build(maxsize: int = 2, ttl: float = 60):
+        if request.param == "sqlite":
+            return SQLiteCache(tmp_path / "cache.sqlite3", maxsize=maxsize, ttl=ttl)
+        return MemoryCache(maxsize=maxsize, ttl=ttl)
+
+    return build
+
+
+def test_backend_evicts_expires_and_counts(backend):
+    cache = backend(maxsize=2)
+    cache.set("a", {"value": 1})
+    cache.set("b", [1, 2])
+    cache.set("c", "three")
+    assert cache.get("a") is None
+    assert cache.get("b") == [1, 2]
+    assert cache.get("c") == "three"
+    stats = cache.stats()
+    assert (stats["entries"], stats["hits"], stats["misses"], stats["evictions"]) == (
+        2,
+        2,
+        1,
+        1,
+    )
+
+    short = backend(ttl=0.05)
+    short.set("a", 1)
+    time.sleep(0.1)
+    assert short.get("a") is None
+
+
+def test_backend_generations_never_reset(backend):
+    cache = backend(maxsize=1)
+    assert cache.generations(["s:attendance", "s:branding"]) == [0, 0]
+    cache.bump_generations(["s:attendance"])
+    for key in range(5):
+        cache.set(str(key), key)
+    assert cache.generations(["s:attendance", "s:branding"]) == [1, 0]
+
+
+def test_sqlite_backend_is_shared_between_instances(tmp_path):
+    path = tmp_path / "cache.sqlite3"
+    first = SQLiteCache(path, maxsize=10, ttl=60)
+    second = SQLiteCache(path, maxsize=10, ttl=60)
+    first.set("key", {"hours": 4.0})
+    first.bump_generations(["school:students"])
+    assert second.get("key") == {"hours": 4.0}
+    assert second.generations(["school:students"]) == [1]
+
+
+def _seed(session, suffix: str):
+    school, admin = create_school_with_admin(session, suffix)
+    classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+    session.add(classroom)
+    session.flush()
+    student = Student(
+        school_id=school.id, class_id=classroom.id, first_name="Anna", last_name="Rossi"
+    )
+    project = Project(
+        school_id=school.id,
+        class_id=classroom.id,
+        title="PCTO",
+        status=ProjectStatus.active,
+        start_date=date(2026, 2, 1),
+        end_date=date(2026, 2, 28),
+    )
+    session.add_all([student, project])
+    session.flush()
+    project_session = ProjectSession(
+        school_id=school.id,
+        project_id=project.id,
+        start=datetime(2026, 2, 3, 9, 0, tzinfo=timezone.utc),
+        end=datetime(2026, 2, 3, 12, 0, tzinfo=timezone.utc),
+        planned_hours=3.0,
+    )
+    session.add(project_session)
+    session.commit()
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    return {"Authorization": f"Bearer {token}"}, str(student.id), str(project_session.id)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cached_client(request, monkeypatch):
+    monkeypatch.setenv("RESPONSE_CACHE_BACKEND", request.param)
+    return request.getfixturevalue("client")
+
+
+def test_reads_are_cached_per_school_until_a_write(cached_client, assert_max_queries):
+    client = cached_client
+    with Session(get_bind()) as session:
+        headers, student_id, session_id = _seed(session, "A")
+        other_headers, other_student_id, _ = _seed(session, "B")
+
+    summary_path = f"/v1/students/{student_id}/summary"
+    assert client.get("/v1/students/metrics", headers=headers).json() == [
+        {"student_id": student_id, "completed_hours": 0.0}
+    ]
+    assert client.get(summary_path, headers=headers).status_code == 200
+    with assert_max_queries(0):
+        metrics = client.get("/v1/students/metrics", headers=headers)
+        summary = client.get(summary_path, headers=headers)
+    assert metrics.json()[0]["completed_hours"] == 0.0
+    assert summary.json()["id"] == student_id
+    assert client.get("/v1/students/metrics", headers=other_headers).json() == [
+        {"student_id": other_student_id, "completed_hours": 0.0}
+    ]
+
+    response = client.post(
+        f"/v1/sessions/{session_id}/attendance",
+        json=[{"student_id": student_id, "status": "present", "hours": 3.0}],
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert client.get("/v1/students/metrics", headers=headers).json() == [
+        {"student_id": student_id, "completed_hours": 3.0}
+    ]
+    assert client.get(summary_path, headers=headers).json()["completed_hours_total"] == 3.0
+
+    assert client.get("/health/cache", headers=headers).status_code == 403
+    with Session(get_bind()) as session:
+        platform_admin = User(
+            role=UserRole.platform_admin,
+            email="platform@demo.it",
+            password_hash="unused",
+        )
+        session.add(platform_admin)
+        session.commit()
+        token = create_access_token(platform_admin.id, platform_admin.role, None)
+    stats = client.get(
+        "/health/cache", headers={"Authorization": f"Bearer {token}"}
+    ).json()["response"]
+    assert stats["hits"] >= 2
+    assert stats["misses"] >= 5
+
+
+def test_branding_is_cached_and_invalidated_on_update(cached_client, assert_max_queries):
+    client = cached_client
+    with Session(get_bind()) as session:
+        headers, *_ = _seed(session, "A")
+
+    assert client.get("/v1/school/branding", headers=headers).json()["header_text"] is None
+    with assert_max_queries(0):
+        assert client.get("/v1/school/branding", headers=headers).status_code == 200
+
+    response = client.patch(
+        "/v1/school/branding", json={"header_text": "Istituto A"}, headers=headers
+    )
+    assert response.status_code == 200
+    branding = client.get("/v1/school/branding", headers=headers).json()
+    assert branding["header_text"] == "Istituto A"
@@ -3,7 +3,7 @@ from uuid import UUID
 
 from sqlmodel import Session, select
 
-from app.db import get_engine
+from app.db import get_bind
 from app.models import Attendance, ClassRoom, Session as ProjectSession, Student
 from tests.utils import create_school_with_admin
 
@@ -33,8 +33,8 @@ def _create_project(client, token: str, class_id: str) -> str:
 
 
 def test_session_create_list_and_patch_topic(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         _, admin = create_school_with_admin(session, "A")
 
     token = _login(client, admin["email"], "admin123!")
@@ -86,8 +86,8 @@ def test_session_create_list_and_patch_topic(client):
 
 
 def test_session_delete_removes_attendance(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         school, admin = create_school_with_admin(session, "A")
         classroom = ClassRoom(school_id=school.id, name="3A", year=3, section="A")
         session.add(classroom)
@@ -136,7 +136,7 @@ def test_session_delete_removes_attendance(client):
     assert delete_response.status_code == 200
     assert delete_response.json() == {"deleted": True}
 
-    with Session(engine) as session:
+    with Session(bind) as session:
         attendance_rows = session.exec(
             select(Attendance).where(Attendance.session_id == UUID(session_id))
         ).all()
@@ -148,8 +148,8 @@ def test_session_delete_removes_attendance(client):
 
 
 def test_project_delete_removes_sessions_and_attendance(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         school, admin = create_school_with_admin(session, "A")
         classroom = ClassRoom(school_id=school.id, name="3A", year=3, section="A")
         session.add(classroom)
@@ -198,7 +198,7 @@ def test_project_delete_removes_sessions_and_attendance(client):
     assert delete_response.status_code == 200
     assert delete_response.json() == {"deleted": True}
 
-    with Session(engine) as session:
+    with Session(bind) as session:
         session_rows = session.exec(
             select(ProjectSession).where(ProjectSession.project_id == UUID(project_id))
         ).all()
@@ -210,8 +210,8 @@ def test_project_delete_removes_sessions_and_attendance(client):
 
 
 def test_session_patch_and_delete_cross_tenant_404(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         _, admin_a = create_school_with_admin(session, "A")
         _, admin_b = create_school_with_admin(session, "B")
 
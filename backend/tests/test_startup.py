@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1]
+# Generous enough for a loaded CI machine; a regression like importing
+# ReportLab or Alembic eagerly shows up as the module check below anyway.
+IMPORT_BUDGET_MS = int(os.environ.get("STARTUP_IMPORT_BUDGET_MS", "2500"))
+LAZY_MODULES = ("reportlab", "PIL", "alembic", "openpyxl")
+
+
+def _import_times(tmp_path, code: str) -> dict[str, int]:
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{tmp_path / 'startup.db'}",
+        "STORAGE_DIR": str(tmp_path / "storage"),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_cold_import_of_app_main_stays_lean(tmp_path):
+    times = _import_times(tmp_path, "import app.main")
+
+    assert "app.main" in times
+    eager = sorted(name for name in times if name.split(".")[0] in LAZY_MODULES)
+    assert eager == []
+    assert times["app.main"] / 1000 < IMPORT_BUDGET_MS
+
+
+def test_preload_imports_lazy_modules_before_fork(tmp_path):
+    times = _import_times(tmp_path, "from app.preload import preload; preload()")
+    loaded = {name.split(".")[0] for name in times}
+    assert {"reportlab", "PIL", "openpyxl"} <= loaded
@@ -0,0 +1,118 @@
+from datetime import date, datetime, timezone
+
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from app.core.security import create_access_token
+from app.db import get_bind
+from app.models import (
+    Attendance,
+    ClassRoom,
+    Project,
+    ProjectStatus,
+    Session as ProjectSession,
+    Student,
+    StudentHours,
+)
+from tests.utils import create_school_with_admin
+
+
+def _rollup(bind) -> list[StudentHours]:
+    with Session(bind) as session:
+        return list(session.exec(select(StudentHours)).all())
+
+
+def test_student_hours_follow_attendance_writes(client):
+    from app.rollups import rebuild_student_hours
+
+    bind = get_bind()
+    with Session(bind) as session:
+        school, admin = create_school_with_admin(session, "A")
+        classroom = ClassRoom(school_id=school.id, name="4A", year=4, section="A")
+        session.add(classroom)
+        session.flush()
+        student = Student(
+            school_id=school.id, class_id=classroom.id, first_name="Luca", last_name="Rossi"
+        )
+        project = Project(
+            school_id=school.id,
+            class_id=classroom.id,
+            title="PCTO",
+            status=ProjectStatus.active,
+            start_date=date(2026, 2, 1),
+            end_date=date(2026, 2, 28),
+        )
+        session.add_all([student, project])
+        session.flush()
+        sessions = [
+            ProjectSession(
+                school_id=school.id,
+                project_id=project.id,
+                start=datetime(2026, 2, day, 9, 0, tzinfo=timezone.utc),
+                end=datetime(2026, 2, day, 12, 0, tzinfo=timezone.utc),
+                planned_hours=3.0,
+            )
+            for day in (3, 4)
+        ]
+        session.add_all(sessions)
+        session.commit()
+        student_id = student.id
+        project_id = project.id
+        session_ids = [item.id for item in sessions]
+    token = create_access_token(admin["id"], admin["role"], admin["school_id"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for session_id, hours in zip(session_ids, (3.0, 2.5)):
+        response = client.post(
+            f"/v1/sessions/{session_id}/attendance",
+            json=[{"student_id": str(student_id), "status": "present", "hours": hours}],
+            headers=headers,
+        )
+        assert response.status_code == 200
+
+    [row] = _rollup(bind)
+    assert (row.student_id, row.project_id) == (student_id, project_id)
+    assert row.total_hours == 5.5
+    assert row.attendance_count == 2
+    assert row.present_count == 2
+    assert row.approved_school_count == 0
+
+    with Session(bind) as session:
+        attendance_id = session.exec(
+            select(Attendance.id).where(Attendance.session_id == session_ids[0])
+        ).one()
+    assert (
+        client.post(
+            f"/v1/attendance/{attendance_id}/approve/school", headers=headers
+        ).status_code
+        == 200
+    )
+    assert _rollup(bind)[0].approved_school_count == 1
+
+    patch = client.patch(
+        f"/v1/sessions/{session_ids[1]}",
+        json={"end": datetime(2026, 2, 4, 13, 0, tzinfo=timezone.utc).isoformat()},
+        headers=headers,
+    )
+    assert patch.status_code == 200
+    assert _rollup(bind)[0].last_session_end.replace(tzinfo=None) == datetime(
+        2026, 2, 4, 13, 0
+    )
+
+    assert client.delete(f"/v1/sessions/{session_ids[1]}", headers=headers).status_code == 200
+    [row] = _rollup(bind)
+    assert row.total_hours == 3.0
+    assert row.attendance_count == 1
+
+    metrics = client.get("/v1/students/metrics", headers=headers).json()
+    assert metrics == [{"student_id": str(student_id), "completed_hours": 3.0}]
+
+    with Session(bind) as session:
+        session.exec(delete(StudentHours))
+        session.commit()
+        rebuild_student_hours(session)
+        session.commit()
+    assert _rollup(bind)[0].total_hours == 3.0
+
+    assert client.delete(f"/v1/projects/{project_id}", headers=headers).status_code == 200
+    assert _rollup(bind) == []
@@ -0,0 +1,198 @@
+import io
+
+import pytest
+from sqlalchemy import event, func
+from sqlmodel import Session, select
+
+from app.db import get_bind
+from app.models import ClassRoom, Student
+from tests.utils import create_school_with_admin
+
+
+def _login(client, email: str, password: str) -> str:
+    response = client.post(
+        "/v1/auth/login", json={"email": email, "password": password}
+    )
+    assert response.status_code == 200
+    return response.json()["access_token"]
+
+
+def _setup(client) -> tuple[str, object]:
+    bind = get_bind()
+    with Session(bind) as session:
+        school, admin = create_school_with_admin(session, "A")
+        session.add(ClassRoom(school_id=school.id, name="3A", year=3, section="A"))
+        session.commit()
+        school_id = school.id
+    return _login(client, admin["email"], "admin123!"), school_id
+
+
+def _upload(client, token: str, filename: str, content: bytes, **params):
+    return client.post(
+        "/v1/students/import",
+        params=params,
+        files={"upload": (filename, content, "application/octet-stream")},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+def _counts(school_id) -> tuple[int, int]:
+    with Session(get_bind()) as session:
+        students = session.exec(
+            select(func.count()).select_from(Student).where(Student.school_id == school_id)
+        ).one()
+        classes = session.exec(
+            select(func.count()).select_from(ClassRoom).where(ClassRoom.school_id == school_id)
+        ).one()
+    return students, classes
+
+
+def test_import_csv_reports_row_errors_and_creates_classes(client):
+    token, school_id = _setup(client)
+    content = (
+        "first_name,last_name,year,section,pcto_required_hours\n"
+        "Luca,Rossi,3,A,\n"
+        "Anna,Bianchi,4,B,90\n"
+        ",Verdi,4,B,\n"
+        "\n"
+        "Marco,Neri,quarto,C,-1\n"
+        "Sara,Gialli,4,B,120\n"
+    ).encode()
+
+    response = _upload(client, token, "students.csv", content)
+    assert response.status_code == 200
+    report = response.json()
+    assert report["dry_run"] is False
+    assert report["total_rows"] == 5
+    assert report["imported"] == 3
+    assert report["created_classes"] == 1
+    assert report["errors"] == [
+        {"row": 4, "errors": ["first_name is required"]},
+        {
+            "row": 6,
+            "errors": ["year must be an integer", "pcto_required_hours must be >= 0"],
+        },
+    ]
+
+    with Session(get_bind()) as session:
+        rows = session.exec(
+            select(Student.last_name, Student.pcto_required_hours, ClassRoom.name)
+            .join(ClassRoom, ClassRoom.id == Student.class_id)
+            .where(Student.school_id == school_id)
+            .order_by(Student.last_name)
+        ).all()
+    assert rows == [("Bianchi", 90, "4B"), ("Gialli", 120, "4B"), ("Rossi", 150, "3A")]
+
+
+def test_import_dry_run_writes_nothing(client):
+    token, school_id = _setup(client)
+    content = "cognome;nome;anno;sezione\nRossi;Luca;3;A\nBianchi;Anna;5;C\n".encode()
+
+    response = _upload(client, token, "students.csv", content, dry_run="true")
+    assert response.status_code == 200
+    report = response.json()
+    assert report["dry_run"] is True
+    assert report["imported"] == 2
+    assert report["created_classes"] == 1
+    assert _counts(school_id) == (0, 1)
+
+
+def test_import_batches_statements_per_chunk(client):
+    token, school_id = _setup(client)
+    lines = ["first_name,last_name,year,section"]
+    lines += [f"Nome{index},Cognome{index},{3 + index % 3},A" for index in range(3000)]
+    content = "\n".join(lines).encode()
+
+    bind = get_bind()
+    statements: list[str] = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(bind, "before_cursor_execute", count)
+    try:
+        response = _upload(client, token, "students.csv", content)
+    finally:
+        event.remove(bind, "before_cursor_execute", count)
+
+    assert response.status_code == 200
+    assert response.json()["imported"] == 3000
+    assert response.json()["created_classes"] == 2
+    assert _counts(school_id) == (3000, 3)
+    student_inserts = [s for s in statements if s.startswith("INSERT INTO student")]
+    classroom_inserts = [s for s in statements if s.startswith("INSERT INTO classroom")]
+    assert len(classroom_inserts) == 1
+    assert len(student_inserts) < 10
+
+
+def test_import_xlsx(client):
+    openpyxl = pytest.importorskip("openpyxl")
+    token, school_id = _setup(client)
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Nome", "Cognome", "Anno", "Sezione", "Ore PCTO"])
+    sheet.append(["Luca", "Rossi", 3, "A", 100])
+    sheet.append(["Anna", "Bianchi", 4.0, "B", None])
+    buffer = io.BytesIO()
+    workbook.save(buffer)
+
+    response = _upload(client, token, "students.xlsx", buffer.getvalue())
+    assert response.status_code == 200
+    assert response.json()["imported"] == 2
+    assert response.json()["errors"] == []
+    assert _counts(school_id) == (2, 2)
+
+
+def test_import_rejects_bad_files(client):
+    token, _ = _setup(client)
+    missing = _upload(client, token, "students.csv", b"first_name,last_name\nLuca,Rossi\n")
+    assert missing.status_code == 400
+    assert missing.json()["detail"] == "Missing columns: year, section"
+
+    wrong_type = _upload(client, token, "students.txt", b"first_name")
+    assert wrong_type.status_code == 400
+
+
+def test_import_creates_classes_without_on_conflict(client, monkeypatch):
+    import app.imports
+
+    monkeypatch.setattr(app.imports, "_INSERT_BY_DIALECT", {})
+    token, school_id = _setup(client)
+    content = (
+        "first_name,last_name,year,section\n"
+        "Luca,Rossi,3,A\n"
+        "Anna,Bianchi,4,B\n"
+    ).encode()
+
+    response = _upload(client, token, "students.csv", content)
+    assert response.status_code == 200
+    assert response.json()["created_classes"] == 1
+    assert _counts(school_id) == (2, 2)
+
+
+@pytest.mark.parametrize("on_conflict", [True, False])
+def test_import_counts_only_classes_it_inserted(client, monkeypatch, on_conflict):
+    import app.imports
+
+    if not on_conflict:
+        monkeypatch.setattr(app.imports, "_INSERT_BY_DIALECT", {})
+    create_classrooms = app.imports._create_classrooms
+
+    def racing_create(session, school_id, keys):
+        # Another import creates 4B between our lookup and our insert.
+        session.add(ClassRoom(school_id=school_id, name="4B", year=4, section="B"))
+        session.flush()
+        return create_classrooms(session, school_id, keys)
+
+    monkeypatch.setattr(app.imports, "_create_classrooms", racing_create)
+    token, school_id = _setup(client)
+    content = (
+        "first_name,last_name,year,section\n"
+        "Anna,Bianchi,4,B\n"
+        "Sara,Gialli,5,C\n"
+    ).encode()
+
+    response = _upload(client, token, "students.csv", content)
+    assert response.status_code == 200
+    assert response.json()["created_classes"] == 1
+    assert _counts(school_id) == (2, 3)
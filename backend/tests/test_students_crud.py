@@ -3,7 +3,7 @@ from uuid import UUID
 
 from sqlmodel import Session, select
 
-from app.db import get_engine
+from app.db import get_bind
 from app.models import (
     Attendance,
     AttendanceStatus,
@@ -25,8 +25,8 @@ def _login(client, email: str, password: str) -> str:
 
 
 def test_student_default_hours_and_patch(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         school, admin = create_school_with_admin(session, "A")
         classroom = ClassRoom(school_id=school.id, name="3A", year=3, section="A")
         session.add(classroom)
@@ -52,9 +52,9 @@ def test_student_default_hours_and_patch(client):
     assert patch_resp.json()["pcto_required_hours"] == 200
 
 
-def test_student_delete_removes_attendance_and_metrics(client):
-    engine = get_engine()
-    with Session(engine) as session:
+def test_student_delete_removes_attendance_and_metrics(client, assert_max_queries):
+    bind = get_bind()
+    with Session(bind) as session:
         school, admin = create_school_with_admin(session, "A")
         classroom = ClassRoom(school_id=school.id, name="3A", year=3, section="A")
         session.add(classroom)
@@ -98,10 +98,11 @@ def test_student_delete_removes_attendance_and_metrics(client):
 
     token = _login(client, admin["email"], "admin123!")
 
-    metrics = client.get(
-        "/v1/students/metrics",
-        headers={"Authorization": f"Bearer {token}"},
-    )
+    with assert_max_queries(2):
+        metrics = client.get(
+            "/v1/students/metrics",
+            headers={"Authorization": f"Bearer {token}"},
+        )
     assert metrics.status_code == 200
     metrics_map = {row["student_id"]: row["completed_hours"] for row in metrics.json()}
     assert metrics_map[str(student_id)] == 2.0
@@ -113,7 +114,7 @@ def test_student_delete_removes_attendance_and_metrics(client):
     assert delete_resp.status_code == 200
     assert delete_resp.json() == {"deleted": True}
 
-    with Session(engine) as session:
+    with Session(bind) as session:
         attendance_rows = session.exec(
             select(Attendance).where(Attendance.student_id == UUID(str(student_id)))
         ).all()
@@ -125,8 +126,8 @@ def test_student_delete_removes_attendance_and_metrics(client):
 
 
 def test_student_cross_tenant_patch_delete(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         school_a, admin_a = create_school_with_admin(session, "A")
         school_b, admin_b = create_school_with_admin(session, "B")
         classroom = ClassRoom(school_id=school_a.id, name="3A", year=3, section="A")
@@ -159,9 +160,9 @@ def test_student_cross_tenant_patch_delete(client):
     assert delete_resp.status_code == 404
 
 
-def test_student_summary(client):
-    engine = get_engine()
-    with Session(engine) as session:
+def test_student_summary(client, assert_max_queries):
+    bind = get_bind()
+    with Session(bind) as session:
         school_a, admin_a = create_school_with_admin(session, "A")
         school_b, admin_b = create_school_with_admin(session, "B")
         classroom = ClassRoom(school_id=school_a.id, name="3A", year=3, section="A")
@@ -208,10 +209,11 @@ def test_student_summary(client):
     token_a = _login(client, admin_a["email"], "admin123!")
     token_b = _login(client, admin_b["email"], "admin123!")
 
-    summary = client.get(
-        f"/v1/students/{student_id}/summary",
-        headers={"Authorization": f"Bearer {token_a}"},
-    )
+    with assert_max_queries(3):
+        summary = client.get(
+            f"/v1/students/{student_id}/summary",
+            headers={"Authorization": f"Bearer {token_a}"},
+        )
     assert summary.status_code == 200
     body = summary.json()
     assert body["completed_hours_total"] == 2.0
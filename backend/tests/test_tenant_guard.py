@@ -1,14 +1,14 @@
 from sqlmodel import Session
 
-from app.db import get_engine
+from app.db import get_bind
 from app.models import School, User, UserRole
 
 
 def test_tenant_guard_blocks_cross_school(client):
     from app.core.security import create_access_token
 
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         school_a = School(
             name="School A",
             legal_name="School A SRL",
@@ -1,6 +1,6 @@
 from sqlmodel import Session
 
-from app.db import get_engine
+from app.db import get_bind
 from tests.utils import create_school_with_admin
 
 
@@ -13,8 +13,8 @@ def _login(client, email: str, password: str) -> str:
 
 
 def test_cross_tenant_project_access_returns_404(client):
-    engine = get_engine()
-    with Session(engine) as session:
+    bind = get_bind()
+    with Session(bind) as session:
         school_a, admin_a = create_school_with_admin(session, "A")
         school_b, admin_b = create_school_with_admin(session, "B")
 
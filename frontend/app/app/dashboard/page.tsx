@@ -1,7 +1,7 @@
 "use client";
 
 import { useMemo } from "react";
-import { useQueries, useQuery } from "@tanstack/react-query";
+import { useQuery } from "@tanstack/react-query";
 import {
   Bar,
   BarChart,
@@ -39,104 +39,44 @@ function getLast30Days() {
 }
 
 export default function DashboardPage() {
-  const projectsQuery = useQuery({
-    queryKey: ["projects"],
-    queryFn: api.getProjects
-  });
-  const classesQuery = useQuery({
-    queryKey: ["classes"],
-    queryFn: api.getClasses
-  });
-  const studentsQuery = useQuery({
-    queryKey: ["students"],
-    queryFn: () => api.getStudents()
-  });
-
-  const sessionsQueries = useQueries({
-    queries:
-      projectsQuery.data?.map((project) => ({
-        queryKey: ["sessions", project.id],
-        queryFn: () => api.getSessions(project.id),
-        enabled: !!project.id
-      })) ?? []
-  });
-
-  const sessions = useMemo(
-    () => sessionsQueries.flatMap((query) => query.data ?? []),
-    [sessionsQueries]
-  );
-
-  const attendanceQueries = useQueries({
-    queries: sessions.map((sessionItem) => ({
-      queryKey: ["attendance", sessionItem.id],
-      queryFn: () => api.getSessionAttendance(sessionItem.id),
-      enabled: !!sessionItem.id
-    }))
+  const dashboardQuery = useQuery({
+    queryKey: ["dashboard"],
+    queryFn: api.getDashboard
   });
 
-  const attendanceRows = useMemo(() => {
-    return attendanceQueries.flatMap((query, index) => {
-      const sessionItem = sessions[index];
-      if (!sessionItem) return [];
-      return (query.data ?? []).map((row) => ({
-        ...row,
-        sessionStart: sessionItem.start
-      }));
-    });
-  }, [attendanceQueries, sessions]);
-
-  const loading =
-    projectsQuery.isLoading ||
-    classesQuery.isLoading ||
-    studentsQuery.isLoading ||
-    sessionsQueries.some((query) => query.isLoading) ||
-    attendanceQueries.some((query) => query.isLoading);
+  const loading = dashboardQuery.isLoading;
 
   const kpis = useMemo(() => {
-    const totalProjects = projectsQuery.data?.length ?? 0;
-    const totalSessions = sessions.length;
-    const totalHours = attendanceRows.reduce((sum, row) => sum + row.hours, 0);
-    const presentCount = attendanceRows.filter((row) => row.status === "present").length;
-    const presenceAvg =
-      attendanceRows.length > 0
-        ? Math.round((presentCount / attendanceRows.length) * 100)
-        : 0;
-    return { totalProjects, totalSessions, totalHours, presenceAvg };
-  }, [attendanceRows, projectsQuery.data, sessions.length]);
+    const data = dashboardQuery.data;
+    return {
+      totalProjects: data?.total_projects ?? 0,
+      totalSessions: data?.total_sessions ?? 0,
+      totalHours: data?.total_hours ?? 0,
+      presenceAvg: data?.presence_pct ?? 0
+    };
+  }, [dashboardQuery.data]);
 
   const lineData = useMemo(() => {
-    const dateMap = new Map<string, number>();
-    attendanceRows.forEach((row) => {
-      const dateKey = row.sessionStart.slice(0, 10);
-      dateMap.set(dateKey, (dateMap.get(dateKey) ?? 0) + row.hours);
-    });
+    const dateMap = new Map(
+      (dashboardQuery.data?.hours_by_day ?? []).map((row) => [row.date, row.hours])
+    );
     const last30 = getLast30Days();
     return last30.map((date) => ({
       date,
       label: formatDate(date),
       hours: dateMap.get(date) ?? 0
     }));
-  }, [attendanceRows]);
-
-  const barData = useMemo(() => {
-    const studentToClass = new Map(
-      (studentsQuery.data ?? []).map((student) => [student.id, student.class_id])
-    );
-    const classLabel = new Map(
-      (classesQuery.data ?? []).map((cls) => [cls.id, `${cls.year}${cls.section}`])
-    );
-    const classHours = new Map<string, number>();
-    attendanceRows.forEach((row) => {
-      const classId = studentToClass.get(row.student_id);
-      if (!classId) return;
-      classHours.set(classId, (classHours.get(classId) ?? 0) + row.hours);
-    });
-    return Array.from(classHours.entries()).map(([classId, hours]) => ({
-      classId,
-      label: classLabel.get(classId) ?? "Classe",
-      hours
-    }));
-  }, [attendanceRows, classesQuery.data, studentsQuery.data]);
+  }, [dashboardQuery.data]);
+
+  const barData = useMemo(
+    () =>
+      (dashboardQuery.data?.hours_by_class ?? []).map((row) => ({
+        classId: row.class_id,
+        label: row.label,
+        hours: row.hours
+      })),
+    [dashboardQuery.data]
+  );
 
   const activities = useMemo(() => getActivities().slice(0, 5), []);
 
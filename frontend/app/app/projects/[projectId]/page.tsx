@@ -12,7 +12,7 @@ import { useToast } from "@/components/ui/toast";
 import { PageHeader } from "@/components/page-header";
 import { SectionContainer } from "@/components/section-container";
 import { addActivity } from "@/lib/activity";
-import { api } from "@/lib/api";
+import { api, waitForExport } from "@/lib/api";
 import { formatDate, formatDateTime } from "@/lib/format";
 import { computeProjectProgress } from "@/lib/progress";
 import { getProgressChip, getProjectStatusChip, getSessionStatusChip } from "@/lib/badges";
@@ -315,7 +315,7 @@ export default function ProjectDetailPage({ params }: { params: { projectId: str
   });
 
   const exportAttendance = useMutation({
-    mutationFn: () => api.exportAttendanceRegister(params.projectId),
+    mutationFn: async () => waitForExport(await api.exportAttendanceRegister(params.projectId)),
     onSuccess: (data) => {
       setExportId(data.export_id);
       addActivity("Registro presenze generato");
@@ -2,7 +2,7 @@
 
 import { useRouter } from "next/navigation";
 import { useEffect, useMemo, useState } from "react";
-import { useQueries, useQuery } from "@tanstack/react-query";
+import { useQuery } from "@tanstack/react-query";
 import { ArrowUpDown, MoreHorizontal, Sparkles } from "lucide-react";
 
 import { DataTable } from "@/components/data-table/data-table";
@@ -26,7 +26,6 @@ import { SectionContainer } from "@/components/section-container";
 import { api } from "@/lib/api";
 import { getProgressChip, getProjectStatusChip } from "@/lib/badges";
 import { formatDate } from "@/lib/format";
-import { computeProjectProgress } from "@/lib/progress";
 
 const statusLabel: Record<string, { label: string; variant: "draft" | "active" | "closed" }> = {
   draft: { label: "Bozza", variant: "draft" },
@@ -140,62 +139,16 @@ export default function ProjectsPage() {
     }
   }, [projectsQuery.error, toast]);
 
-  const sessionQueries = useQueries({
-    queries:
-      projectsQuery.data?.map((project) => ({
-        queryKey: ["sessions", project.id],
-        queryFn: () => api.getSessions(project.id),
-        enabled: !!project.id
-      })) ?? []
+  const progressQuery = useQuery({
+    queryKey: ["projects", "progress"],
+    queryFn: api.getProjectsProgress
   });
 
-  const sessionsByProject = useMemo(() => {
-    const map = new Map<
-      string,
-      Array<{ id: string; planned_hours: number; status: "scheduled" | "done" }>
-    >();
-    (projectsQuery.data ?? []).forEach((project, index) => {
-      const data = sessionQueries[index]?.data ?? [];
-      map.set(project.id, data);
-    });
-    return map;
-  }, [projectsQuery.data, sessionQueries]);
-
-  const doneSessionPairs = useMemo(
-    () =>
-      (projectsQuery.data ?? []).flatMap((project) => {
-        const sessions = sessionsByProject.get(project.id) ?? [];
-        return sessions
-          .filter((sessionItem) => sessionItem.status === "done")
-          .map((sessionItem) => ({ projectId: project.id, sessionId: sessionItem.id }));
-      }),
-    [projectsQuery.data, sessionsByProject]
+  const progressByProject = useMemo(
+    () => new Map((progressQuery.data ?? []).map((row) => [row.project_id, row])),
+    [progressQuery.data]
   );
 
-  const attendanceQueries = useQueries({
-    queries: doneSessionPairs.map((pair) => ({
-      queryKey: ["attendance", pair.sessionId],
-      queryFn: () => api.getSessionAttendance(pair.sessionId),
-      enabled: Boolean(pair.sessionId)
-    }))
-  });
-
-  const attendanceBySession = useMemo(() => {
-    const map: Record<string, Array<{ hours: number }>> = {};
-    doneSessionPairs.forEach((pair, index) => {
-      map[pair.sessionId] = attendanceQueries[index]?.data ?? [];
-    });
-    return map;
-  }, [attendanceQueries, doneSessionPairs]);
-
-  const sessionsLoadingByProject = useMemo(() => {
-    const map = new Map<string, boolean>();
-    (projectsQuery.data ?? []).forEach((project, index) => {
-      map.set(project.id, sessionQueries[index]?.isLoading ?? false);
-    });
-    return map;
-  }, [projectsQuery.data, sessionQueries]);
-
   const formatHours = (value: number) =>
     Number.isInteger(value) ? `${value}` : value.toFixed(1);
 
@@ -296,15 +249,11 @@ export default function ProjectsPage() {
             <ArrowUpDown className="h-3.5 w-3.5 text-slate-400" />
           </button>
         ),
-        accessorFn: (row) => {
-          const sessions = sessionsByProject.get(row.id) ?? [];
-          return sessions.length;
-        },
-        cell: ({ row }) => {
-          const isLoadingSessions = sessionsLoadingByProject.get(row.original.id);
-          const sessions = sessionsByProject.get(row.original.id);
-          return isLoadingSessions ? "…" : sessions?.length ?? 0;
-        },
+        accessorFn: (row) => progressByProject.get(row.id)?.session_count ?? 0,
+        cell: ({ row }) =>
+          progressQuery.isLoading
+            ? "…"
+            : progressByProject.get(row.original.id)?.session_count ?? 0,
         meta: { label: "# sessioni" }
       },
       {
@@ -335,36 +284,15 @@ export default function ProjectsPage() {
             <ArrowUpDown className="h-3.5 w-3.5 text-slate-400" />
           </button>
         ),
-        accessorFn: (row) => {
-          const sessions = sessionsByProject.get(row.id) ?? [];
-          const attendanceForProject: Record<string, Array<{ hours: number }>> = {};
-          sessions.forEach((sessionItem) => {
-            if (sessionItem.status === "done") {
-              attendanceForProject[sessionItem.id] = attendanceBySession[sessionItem.id] ?? [];
-            }
-          });
-          return computeProjectProgress(row, sessions, attendanceForProject).progressPct;
-        },
+        accessorFn: (row) => progressByProject.get(row.id)?.progress_pct ?? 0,
         cell: ({ row }) => {
-          const sessions = sessionsByProject.get(row.original.id) ?? [];
-          const attendanceForProject: Record<string, Array<{ hours: number }>> = {};
-          sessions.forEach((sessionItem) => {
-            if (sessionItem.status === "done") {
-              attendanceForProject[sessionItem.id] = attendanceBySession[sessionItem.id] ?? [];
-            }
-          });
-          const { progressPct, label } = computeProjectProgress(
-            row.original,
-            sessions,
-            attendanceForProject
-          );
-          const progressChip = getProgressChip(label);
-          const isLoadingSessions = sessionsLoadingByProject.get(row.original.id);
-          return isLoadingSessions ? (
+          const progress = progressByProject.get(row.original.id);
+          const progressChip = getProgressChip(progress?.label ?? "Non iniziato");
+          return progressQuery.isLoading ? (
             "…"
           ) : (
             <div className="flex items-center gap-2">
-              <span className="text-sm text-slate-600">{progressPct}%</span>
+              <span className="text-sm text-slate-600">{progress?.progress_pct ?? 0}%</span>
               <StatusChip label={progressChip.label} tone={progressChip.tone} withDot />
             </div>
           );
@@ -418,7 +346,7 @@ export default function ProjectsPage() {
         meta: { label: "Azioni" }
       }
     ];
-  }, [attendanceBySession, router, sessionsByProject, sessionsLoadingByProject, toast]);
+  }, [progressByProject, progressQuery.isLoading, router, toast]);
 
   return (
     <SectionContainer section="projects" className="space-y-8">
@@ -38,6 +38,51 @@ async function request<T>(path: string, init?: RequestInit): Promise<T> {
   return (await response.json()) as T;
 }
 
+export type ExportJob = {
+  export_id: string;
+  kind: string;
+  status: "pending" | "running" | "done" | "failed";
+  progress: number;
+  error?: string | null;
+  duration_ms?: number | null;
+  created_at: string;
+  finished_at?: string | null;
+};
+
+export type ProjectProgress = {
+  project_id: string;
+  total_hours: number | null;
+  session_count: number;
+  completed_hours: number;
+  planned_done_hours: number;
+  used_hours: number;
+  progress_pct: number;
+  label: "Non iniziato" | "In corso" | "Completato";
+  badge_variant: "draft" | "active" | "closed";
+};
+
+export type Dashboard = {
+  total_projects: number;
+  total_sessions: number;
+  total_hours: number;
+  presence_pct: number;
+  hours_by_day: Array<{ date: string; hours: number }>;
+  hours_by_class: Array<{ class_id: string; label: string; hours: number }>;
+  projects: ProjectProgress[];
+};
+
+export async function waitForExport(job: ExportJob, intervalMs = 1000): Promise<ExportJob> {
+  let current = job;
+  while (current.status === "pending" || current.status === "running") {
+    await new Promise((resolve) => setTimeout(resolve, intervalMs));
+    current = await api.getExport(current.export_id);
+  }
+  if (current.status === "failed") {
+    throw new Error(current.error ?? "Export failed");
+  }
+  return current;
+}
+
 export const api = {
   login: (email: string, password: string) =>
     request<{ access_token: string }>("/v1/auth/login", {
@@ -69,6 +114,8 @@ export const api = {
         total_hours?: number | null;
       }>
     >("/v1/projects"),
+  getProjectsProgress: () => request<ProjectProgress[]>("/v1/projects/progress"),
+  getDashboard: () => request<Dashboard>("/v1/dashboard"),
   createProject: (payload: {
     title: string;
     status: string;
@@ -146,7 +193,8 @@ export const api = {
       `/v1/sessions/${sessionId}/attendance`
     ),
   exportAttendanceRegister: (projectId: string) =>
-    request<{ export_id: string }>(`/v1/exports/projects/${projectId}/attendance-register`, { method: "POST" }),
+    request<ExportJob>(`/v1/exports/projects/${projectId}/attendance-register`, { method: "POST" }),
+  getExport: (exportId: string) => request<ExportJob>(`/v1/exports/${exportId}`),
   getClasses: () => request<Array<{ id: string; year: number; section: string }>>("/v1/classes"),
   createClass: (payload: { year: number; section: string }) =>
     request("/v1/classes", { method: "POST", body: JSON.stringify(payload) }),
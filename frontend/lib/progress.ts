@@ -14,6 +14,8 @@ type AttendanceLike = {
 
 export type ProgressBadgeVariant = "draft" | "active" | "closed";
 
+// Mirrored by backend/app/progress.py; backend/tests/fixtures/progress_cases.json
+// pins both implementations to the same results.
 export function computeProjectProgress(
   project: ProjectLike,
   sessions: SessionLike[],